@@ -1,7 +1,7 @@
 """Strands Agent service — orchestrates AI model invocation with 25 tools.
 
 Uses the Strands Agents SDK with GeminiModel. Tools are @tool-decorated
-functions that receive user_id via functools.partial injection.
+functions that receive user_id injected at call time (_UserBoundTool).
 Supports failover (primary Gemini → retry → failover provider),
 conversation history via SlidingWindowConversationManager,
 and card block parsing for structured UI responses.
@@ -15,23 +15,46 @@ Architecture borrowed from OpenClaw's Pi Agent runtime:
 
 from __future__ import annotations
 
-import functools
+import copy
 import inspect
 import json
 import logging
 import os
 import re
+import time
 from typing import Any
 
+from strands.types.tools import AgentTool
+
+from app.agent.daily_summary import needs_briefing, summary_json
+from app.agent.proactive_checks import ProactivePrechecks, proactive_stats
 from app.agent.system_prompt import build_system_prompt
 from app.agent.tools import ALL_TOOLS
-from app.db.repositories.messages import MessagesRepository
-from app.db.repositories.users import UsersRepository
+from app.agent.usage import TurnUsage, UsageRecorder
+from app.dependencies import get_memory_service, get_messages_repo, get_users_repo
 from app.exceptions import AgentUnavailableError
-from app.memory.memory_service import MemoryService
+from app.tracing import span
 
 logger = logging.getLogger(__name__)
 
+# Briefing prompts used when the day's summary is precomputed by the scheduler
+_PRECOMPUTED_PROMPTS = {
+    "morning_briefing": (
+        "Generate a morning briefing from the user's daily summary below "
+        "(already loaded; do not call tools to fetch it). Create a briefing "
+        "card using :::card{type=\"daily_briefing\"} format with JSON payload: "
+        "title, greeting, tasks (array), goals (array), reminders (array). "
+        "If nothing meaningful, respond with __SILENT__."
+    ),
+    "evening_journal": (
+        "Generate an evening journal prompt from the user's daily summary "
+        "below (already loaded; do not call tools to fetch it). Create a "
+        "journal card using :::card{type=\"journal_prompt\"} format with JSON "
+        "payload: title, reflection_questions (array), accomplishments (array). "
+        "If nothing meaningful, respond with __SILENT__."
+    ),
+}
+
 # ---------------------------------------------------------------------------
 # Card block parser — extracts :::card{type="X"} ... ::: from agent output
 # ---------------------------------------------------------------------------
@@ -72,26 +95,52 @@ def parse_card_blocks(text: str) -> tuple[str, str | None, dict | None]:
 # ---------------------------------------------------------------------------
 
 
+class _UserBoundTool(AgentTool):
+    """A @tool function with user_id filled in on every call.
+
+    user_id is dropped from the schema the model sees and set on the tool
+    input before the wrapped tool validates it, so the model can neither
+    omit nor override it.
+    """
+
+    def __init__(self, tool, user_id: str):
+        super().__init__()
+        self._tool = tool
+        self._user_id = user_id
+        spec = copy.deepcopy(tool.tool_spec)
+        schema = spec["inputSchema"]["json"]
+        schema.get("properties", {}).pop("user_id", None)
+        if "user_id" in schema.get("required", []):
+            schema["required"] = [r for r in schema["required"] if r != "user_id"]
+        self._spec = spec
+
+    @property
+    def tool_spec(self):
+        return self._spec
+
+    @property
+    def tool_name(self) -> str:
+        return self._tool.tool_name
+
+    @property
+    def tool_type(self) -> str:
+        return self._tool.tool_type
+
+    def stream(self, tool_use, invocation_state, **kwargs):
+        tool_use = {**tool_use, "input": {**tool_use.get("input", {}), "user_id": self._user_id}}
+        return self._tool.stream(tool_use, invocation_state, **kwargs)
+
+
 def _bind_tools(user_id: str) -> list:
     """Create user-bound copies of all @tool-decorated functions.
 
-    Strands @tool functions declare user_id as a parameter so the LLM
-    sees it in the schema. We use functools.partial to pre-fill it,
-    then copy over __name__, __doc__, and the tool metadata attributes
-    that Strands uses for tool registration.
+    Strands @tool functions declare user_id as a parameter; the bound
+    copies hide it from the model's schema and inject it at call time.
     """
     bound = []
     for fn in ALL_TOOLS:
-        sig = inspect.signature(fn)
-        if "user_id" in sig.parameters:
-            wrapper = functools.partial(fn, user_id=user_id)
-            functools.update_wrapper(wrapper, fn)
-            # Preserve Strands tool metadata
-            for attr in ("_tool_spec", "tool_spec", "TOOL_SPEC"):
-                val = getattr(fn, attr, None)
-                if val is not None:
-                    setattr(wrapper, attr, val)
-            bound.append(wrapper)
+        if "user_id" in inspect.signature(fn).parameters:
+            bound.append(_UserBoundTool(fn, user_id))
         else:
             bound.append(fn)
     return bound
@@ -110,50 +159,64 @@ class AgentService:
     """
 
     def __init__(self):
-        self._users_repo = UsersRepository()
-        self._messages_repo = MessagesRepository()
-        self._memory_service = MemoryService()
+        self._users_repo = get_users_repo()
+        self._messages_repo = get_messages_repo()
+        self._memory_service = get_memory_service()
+        self._prechecks = ProactivePrechecks()
+        self._usage_recorder = UsageRecorder()
 
     # -- public API ----------------------------------------------------------
 
     async def invoke(self, user_id: str, message: str) -> dict[str, Any]:
         """Run a chat turn. Returns dict with content, cardType, cardData."""
-        settings = self._users_repo.get_settings(user_id)
-        system_prompt = build_system_prompt(settings)
+        with span("agent.invoke", **{"enduser.id": user_id}):
+            return self._run_turn(user_id, message)
+
+    def _run_turn(self, user_id: str, message: str) -> dict[str, Any]:
+        with span("agent.settings"):
+            settings = self._users_repo.get_settings(user_id)
+            system_prompt = build_system_prompt(settings)
 
         # Enrich system prompt with relevant memories
-        system_prompt += self._build_memory_context(user_id, message)
+        with span("agent.memory_context"):
+            system_prompt += self._build_memory_context(user_id, message)
 
         # Load conversation history for context
-        history_messages = self._load_history(user_id)
+        with span("agent.history") as current:
+            history_messages = self._load_history(user_id)
+            current.set_attribute("item_count", len(history_messages))
 
         # Invoke with failover
+        usage = TurnUsage("chat")
         try:
             response_text = self._invoke_with_failover(
-                system_prompt, history_messages, message, user_id,
+                system_prompt, history_messages, message, user_id, usage=usage,
             )
         except Exception as exc:
             logger.exception("Agent invocation failed for user %s", user_id)
             raise AgentUnavailableError() from exc
+        finally:
+            self._usage_recorder.record(user_id, usage)
 
         # Parse card blocks
         clean_text, card_type, card_data = parse_card_blocks(response_text)
 
         # Persist messages
-        self._messages_repo.create_message(user_id, {
-            "role": "user",
-            "type": "text",
-            "content": message,
-        })
-        assistant_msg: dict[str, Any] = {
-            "role": "assistant",
-            "type": "card" if card_type else "text",
-            "content": clean_text or response_text,
-        }
-        if card_type:
-            assistant_msg["cardType"] = card_type
-            assistant_msg["cardData"] = card_data
-        self._messages_repo.create_message(user_id, assistant_msg)
+        with span("agent.persist"):
+            self._messages_repo.create_message(user_id, {
+                "role": "user",
+                "type": "text",
+                "content": message,
+            })
+            assistant_msg: dict[str, Any] = {
+                "role": "assistant",
+                "type": "card" if card_type else "text",
+                "content": clean_text or response_text,
+            }
+            if card_type:
+                assistant_msg["cardType"] = card_type
+                assistant_msg["cardData"] = card_data
+            self._messages_repo.create_message(user_id, assistant_msg)
 
         # Store memory (best-effort)
         try:
@@ -171,9 +234,23 @@ class AgentService:
         }
 
     async def invoke_proactive(
-        self, user_id: str, prompt_type: str,
+        self, user_id: str, prompt_type: str, *, briefing: dict | None = None,
     ) -> dict[str, Any] | None:
-        """Proactive invocation for scheduled briefings, plan reviews, etc."""
+        """Proactive invocation for scheduled briefings, plan reviews, etc.
+
+        A deterministic pre-filter runs first; the model is only called when
+        there is something it could report. Each outcome is recorded in
+        ``proactive_stats``.
+
+        ``briefing`` is precomputed data for a morning/evening prompt
+        ({"settings", "summary"}, see app.scheduler.briefing_batch). The
+        summary is then given inline and used for the pre-filter, so no
+        reads or tool calls are needed.
+
+        Returns the delivered result, or None when skipped or silent.
+        Raises AgentUnavailableError when the models fail, so the caller
+        can release its delivery key and retry.
+        """
         prompts = {
             "morning_briefing": (
                 "Generate a morning briefing. Use get_daily_summary to check "
@@ -190,7 +267,8 @@ class AgentService:
                 "If nothing meaningful, respond with __SILENT__."
             ),
             "reminder_check": (
-                "Check for active reminders due now. Use get_reminders. "
+                "Check for active reminders due now. Use "
+                "get_reminders(active_only=True). "
                 "For each due reminder, create a :::card{type=\"reminder\"} block. "
                 "If none due, respond with __SILENT__."
             ),
@@ -213,14 +291,82 @@ class AgentService:
         if not prompt:
             return None
 
+        if briefing is not None and prompt_type in _PRECOMPUTED_PROMPTS:
+            settings = briefing["settings"]
+            should_invoke = needs_briefing(briefing["summary"])
+            prompt = (
+                _PRECOMPUTED_PROMPTS[prompt_type]
+                + "\n\n## Daily Summary\n" + summary_json(briefing["summary"])
+            )
+        else:
+            settings = self._users_repo.get_settings(user_id)
+            should_invoke = self._prechecks.should_invoke(user_id, prompt_type, settings)
+        if not should_invoke:
+            proactive_stats.record(prompt_type, "skipped")
+            return None
+
         try:
-            result = await self.invoke(user_id, prompt)
-            if "__SILENT__" in result.get("content", ""):
-                return None
-            return result
+            result = await self.invoke_scheduled(
+                user_id, prompt, source=prompt_type, settings=settings,
+            )
         except AgentUnavailableError:
+            proactive_stats.record(prompt_type, "failed")
+            raise
+        proactive_stats.record(prompt_type, "silent" if result is None else "delivered")
+        return result
+
+    async def invoke_scheduled(
+        self,
+        user_id: str,
+        prompt: str,
+        *,
+        source: str,
+        settings: dict | None = None,
+        extra: dict[str, Any] | None = None,
+    ) -> dict[str, Any] | None:
+        """Run an unattended prompt (proactive check or cron job).
+
+        Scheduled prompts are not conversation turns: no history or memory
+        lookup, and only a delivered result is persisted, tagged proactive
+        with ``proactiveType=source`` plus any ``extra`` fields. Returns
+        None when the model answers __SILENT__.
+        """
+        if settings is None:
+            settings = self._users_repo.get_settings(user_id)
+        usage = TurnUsage(source)
+        with span("agent.scheduled", source=source, **{"enduser.id": user_id}) as current:
+            try:
+                response_text = self._invoke_with_failover(
+                    build_system_prompt(settings), [], prompt, user_id, usage=usage,
+                )
+            except Exception as exc:
+                raise AgentUnavailableError() from exc
+            finally:
+                self._usage_recorder.record(user_id, usage)
+            current.set_attribute("silent", "__SILENT__" in response_text)
+        if "__SILENT__" in response_text:
             return None
 
+        clean_text, card_type, card_data = parse_card_blocks(response_text)
+        message: dict[str, Any] = {
+            "role": "assistant",
+            "type": "card" if card_type else "text",
+            "content": clean_text or response_text,
+            "proactive": True,
+            "proactiveType": source,
+            **(extra or {}),
+        }
+        if card_type:
+            message["cardType"] = card_type
+            message["cardData"] = card_data
+        self._messages_repo.create_message(user_id, message)
+
+        return {
+            "content": clean_text or response_text,
+            "cardType": card_type,
+            "cardData": card_data,
+        }
+
     # -- private helpers -----------------------------------------------------
 
     def _build_memory_context(self, user_id: str, message: str) -> str:
@@ -240,8 +386,8 @@ class AgentService:
 
     def _load_history(self, user_id: str) -> list[dict]:
         """Load recent conversation history from DynamoDB."""
-        history = self._messages_repo.list_messages(user_id)
-        recent = history[-20:] if len(history) > 20 else history
+        # Newest 20 only: a range read off the end of the partition
+        recent = self._messages_repo.list_messages(user_id, limit=20)
         messages = []
         for msg in recent:
             role = msg.get("role", "user")
@@ -256,18 +402,39 @@ class AgentService:
         history: list[dict],
         user_message: str,
         user_id: str,
+        usage: TurnUsage | None = None,
     ) -> str:
-        """Try primary model, retry once, then failover model."""
+        """Try primary model, retry once, then failover model.
+
+        Each attempt (model, duration, tokens, tool calls) is added to
+        ``usage`` when given.
+        """
         gemini_key = os.getenv("GEMINI_API_KEY", "")
 
+        def attempt_call(model_id: str, api_key: str) -> str:
+            started = time.monotonic()
+            try:
+                with span("agent.model_attempt", **{"model.id": model_id}):
+                    result = self._call_agent(
+                        system_prompt, history, user_message, user_id,
+                        model_id=model_id, api_key=api_key,
+                    )
+            except Exception:
+                if usage is not None:
+                    usage.record_attempt(
+                        model_id, round((time.monotonic() - started) * 1000), error=True,
+                    )
+                raise
+            if usage is not None:
+                usage.record_attempt(
+                    model_id, round((time.monotonic() - started) * 1000), result,
+                )
+            return str(result)
+
         # Attempt 1 & 2: primary Gemini
         for attempt in range(2):
             try:
-                return self._call_agent(
-                    system_prompt, history, user_message, user_id,
-                    model_id="gemini-2.5-flash",
-                    api_key=gemini_key,
-                )
+                return attempt_call("gemini-2.5-flash", gemini_key)
             except Exception:
                 if attempt == 0:
                     logger.warning("Primary model attempt 1 failed, retrying...")
@@ -280,11 +447,7 @@ class AgentService:
         failover_key = os.getenv("FAILOVER_API_KEY", "")
         if failover_provider and failover_key:
             try:
-                return self._call_agent(
-                    system_prompt, history, user_message, user_id,
-                    model_id=failover_provider,
-                    api_key=failover_key,
-                )
+                return attempt_call(failover_provider, failover_key)
             except Exception:
                 logger.exception("Failover model also failed")
 
@@ -298,8 +461,12 @@ class AgentService:
         user_id: str,
         model_id: str,
         api_key: str,
-    ) -> str:
-        """Create a Strands Agent and invoke it with the user's message."""
+    ):
+        """Create a Strands Agent and invoke it with the user's message.
+
+        Returns the AgentResult (str() gives the response text; its metrics
+        carry token usage).
+        """
         try:
             from strands import Agent
             from strands.models.gemini import GeminiModel
@@ -325,8 +492,7 @@ class AgentService:
             )
 
             # Invoke — Strands Agent accepts a string prompt
-            result = agent(user_message)
-            return str(result)
+            return agent(user_message)
 
         except ImportError:
             # Strands not installed — dev mode fallback
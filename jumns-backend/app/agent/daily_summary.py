@@ -0,0 +1,101 @@
+"""Daily summary of a user's goals, tasks and reminders.
+
+Pure functions over already-loaded items, shared by the get_daily_summary
+tool and the scheduler's batch briefing precompute
+(app.scheduler.briefing_batch), so both produce the same shape.
+"""
+
+from __future__ import annotations
+
+from app.serialization import dumps
+
+
+def build_daily_summary(
+    goals: list[dict],
+    tasks: list[dict],
+    reminders: list[dict],
+    today: str | None = None,
+) -> dict:
+    """Summary dict with goals, tasks, reminders, and overall progress.
+
+    ``reminders`` should be the active reminders. When ``today`` (the
+    user's local ISO date) is given, the tasks section also counts pending
+    tasks due today and overdue.
+    """
+    completed_tasks = [t for t in tasks if t.get("completed")]
+    pending_tasks = [t for t in tasks if not t.get("completed")]
+    active_goals = [g for g in goals if not g.get("completed")]
+
+    summary = {
+        "goals": {
+            "active": [
+                {
+                    "id": g.get("id", g.get("goalId", "")),
+                    "title": g.get("title", ""),
+                    "category": g.get("category", ""),
+                    "progress": g.get("progress", 0),
+                    "total": g.get("total", 100),
+                    "unit": g.get("unit", ""),
+                    "percentComplete": (
+                        round((g.get("progress", 0) / g.get("total", 100)) * 100)
+                        if g.get("total", 100) > 0 else 0
+                    ),
+                }
+                for g in active_goals
+            ],
+            "completedCount": len([g for g in goals if g.get("completed")]),
+        },
+        "tasks": {
+            "completed": len(completed_tasks),
+            "pending": len(pending_tasks),
+            "total": len(tasks),
+            "upcoming": [
+                {
+                    "id": t.get("id", t.get("taskId", "")),
+                    "title": t.get("title", ""),
+                    "time": t.get("time", ""),
+                    "type": t.get("type", "task"),
+                    "priority": t.get("priority", "medium"),
+                }
+                for t in pending_tasks[:5]
+            ],
+        },
+        "reminders": {
+            "active": [
+                {
+                    "id": r.get("id", r.get("reminderId", "")),
+                    "title": r.get("title", ""),
+                    "time": r.get("time", ""),
+                }
+                for r in reminders
+            ],
+        },
+        "overallProgress": (
+            round((len(completed_tasks) / len(tasks)) * 100)
+            if tasks else 0
+        ),
+    }
+    if today:
+        due = [t.get("dueDate") for t in pending_tasks if t.get("dueDate")]
+        summary["tasks"]["dueToday"] = sum(1 for d in due if d == today)
+        summary["tasks"]["overdue"] = sum(1 for d in due if d < today)
+    return summary
+
+
+def needs_briefing(summary: dict) -> bool:
+    """Same rule as the morning/evening pre-filter, from a built summary.
+
+    Requires a summary built with ``today``.
+    """
+    tasks = summary["tasks"]
+    return bool(
+        summary["goals"]["active"]
+        or tasks.get("dueToday")
+        or tasks.get("overdue")
+        or summary["reminders"]["active"]
+    )
+
+
+def summary_json(summary: dict) -> str:
+    """Compact JSON for embedding a summary in a prompt."""
+    return dumps(summary).decode()
@@ -0,0 +1,144 @@
+"""Deterministic pre-filters for proactive invocations.
+
+Most proactive ticks have nothing to say, and the model would answer
+__SILENT__ after a paid call plus tool round-trips. These checks read a
+few targeted index slices and decide whether the model is worth calling:
+
+- reminder_check: an active reminder may fire within the sweep window
+- morning_briefing / evening_journal: active goals, tasks due today or
+  overdue, or active reminders
+- plan_review: active goals
+- smart_suggestions: active goals, or tasks due today or overdue
+
+Outcomes (skipped / silent / delivered / failed) are tallied per prompt
+type so skip and deliver ratios can be reported by the scheduler.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from app.dependencies import get_goals_repo, get_reminders_repo, get_tasks_repo
+from app.scheduling.recurrence import clock_times, fire_key
+
+# Look-ahead for the reminder_check prompt
+REMINDER_WINDOW = timedelta(minutes=5)
+
+
+def reminder_may_be_due(
+    reminder: dict, settings: dict, now: datetime, window: timedelta = REMINDER_WINDOW,
+) -> bool:
+    """Whether a reminder could fire in [now, now + window).
+
+    Uses nextFireAt when the reminder has a parsed schedule. Otherwise the
+    check is conservative: weekday/date qualifiers are ignored, and times
+    with no recognizable clock time are treated as due.
+    """
+    next_fire = reminder.get("nextFireAt")
+    if next_fire:
+        return next_fire < fire_key(now + window)
+
+    snoozed_until = reminder.get("snoozedUntil")
+    if snoozed_until:
+        try:
+            until = datetime.fromisoformat(snoozed_until)
+            if until >= now:
+                return until < now + window
+        except ValueError:
+            pass
+
+    times = clock_times(reminder.get("time", ""), settings)
+    if not times:
+        return True
+
+    try:
+        tz = ZoneInfo(settings.get("timezone", "UTC"))
+    except Exception:
+        tz = timezone.utc
+    local_now = now.astimezone(tz)
+    for hhmm in times:
+        hour, minute = (int(p) for p in hhmm.split(":"))
+        fire = local_now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        if fire < local_now:
+            fire += timedelta(days=1)
+        if fire < local_now + window:
+            return True
+    return False
+
+
+class ProactivePrechecks:
+    """Cheap per-prompt-type checks run before the model is invoked."""
+
+    def __init__(self):
+        self._goals_repo = get_goals_repo()
+        self._tasks_repo = get_tasks_repo()
+        self._reminders_repo = get_reminders_repo()
+
+    def should_invoke(self, user_id: str, prompt_type: str, settings: dict) -> bool:
+        """Return False when the model would have nothing to say."""
+        now = datetime.now(timezone.utc)
+        if prompt_type == "reminder_check":
+            return any(
+                reminder_may_be_due(r, settings, now)
+                for r in self._reminders_repo.list_active_reminders(user_id)
+            )
+        if prompt_type in ("morning_briefing", "evening_journal"):
+            return (
+                self._has_active_goals(user_id)
+                or self._has_tasks_needing_attention(user_id, now)
+                or bool(self._reminders_repo.list_active_reminders(user_id))
+            )
+        if prompt_type == "plan_review":
+            return self._has_active_goals(user_id)
+        if prompt_type == "smart_suggestions":
+            return (
+                self._has_active_goals(user_id)
+                or self._has_tasks_needing_attention(user_id, now)
+            )
+        return True
+
+    def _has_active_goals(self, user_id: str) -> bool:
+        return any(not g.get("completed") for g in self._goals_repo.list_all(user_id))
+
+    def _has_tasks_needing_attention(self, user_id: str, now: datetime) -> bool:
+        today = now.strftime("%Y-%m-%d")
+        if self._tasks_repo.list_overdue(user_id, today):
+            return True
+        return any(
+            not t.get("completed")
+            for t in self._tasks_repo.list_due_between(user_id, today, today)
+        )
+
+
+class ProactiveStats:
+    """Thread-safe per-prompt-type outcome counters for this process."""
+
+    OUTCOMES = ("skipped", "silent", "delivered", "failed")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: dict[str, Counter] = {}
+
+    def record(self, prompt_type: str, outcome: str) -> None:
+        with self._lock:
+            self._counts.setdefault(prompt_type, Counter())[outcome] += 1
+
+    def snapshot(self, prompt_type: str) -> dict[str, int]:
+        with self._lock:
+            counts = self._counts.get(prompt_type, Counter())
+            return {o: counts[o] for o in self.OUTCOMES}
+
+    @staticmethod
+    def summarize(before: dict[str, int], after: dict[str, int]) -> dict:
+        """Outcome counts between two snapshots, with skip/deliver ratios."""
+        delta = {o: after[o] - before[o] for o in ProactiveStats.OUTCOMES}
+        total = sum(delta.values())
+        delta["skipRatio"] = round(delta["skipped"] / total, 3) if total else 0.0
+        delta["deliverRatio"] = round(delta["delivered"] / total, 3) if total else 0.0
+        return delta
+
+
+proactive_stats = ProactiveStats()
@@ -20,7 +20,7 @@ PERSONA_TEMPLATE = """You are {agent_name}, a personal AI life assistant built i
 ### Goals
 - get_goals() — list all goals with progress
 - create_goal(title, category, total, unit, insight) — create a new goal
-- update_goal(goal_id, progress, insight, completed, title, category, total, unit) — update any goal field
+- update_goal(goal_id, progress, progress_increment, insight, completed, title, category, total, unit) — update any goal field; use progress_increment to log new progress
 - delete_goal(goal_id) — delete a goal and its linked tasks
 
 ### Tasks
@@ -31,12 +31,19 @@ PERSONA_TEMPLATE = """You are {agent_name}, a personal AI life assistant built i
 - delete_task(task_id) — remove a task
 
 ### Reminders
-- get_reminders() — list all reminders with snooze info
+- get_reminders(active_only?) — list reminders with snooze info
 - create_reminder(title, time, goal_id) — set a reminder
 - update_reminder(reminder_id, title, time, active) — update or pause/resume
 - snooze_reminder(reminder_id, minutes) — push a reminder forward (default 30 min)
 - delete_reminder(reminder_id) — remove a reminder
 
+### Scheduled Automation
+- cron_add(name, schedule_type, action_message, schedule_value, description, enabled) — run a prompt on a schedule (once, daily "HH:MM", weekly "Monday 09:00", interval minutes, or cron "0 8 * * mon-fri")
+- cron_list(include_disabled?) — list scheduled jobs
+- cron_update(job_id, name, schedule_type, schedule_value, action_message, enabled) — change or enable/disable a job
+- cron_remove(job_id) — delete a job
+- cron_run(job_id) — run a job within the next minute
+
 ### Calendar & Scheduling
 - get_schedule(date?, days?) — view the user's schedule for a date range
 - assign_task_to_date(task_id, date) — assign/reassign a task to a calendar date
@@ -51,6 +58,7 @@ PERSONA_TEMPLATE = """You are {agent_name}, a personal AI life assistant built i
 - analyze_progress() — deep analysis across all goals with risk assessment
 - get_daily_summary() — comprehensive day overview
 - smart_suggest(focus?) — generate smart next-step suggestions
+- get_usage_stats(days?) — how much the user has used the assistant (turns, tokens, tool calls)
 
 ### Memory
 - search_memory(query, top_k) — semantic search over past conversations
@@ -8,8 +8,10 @@ Tool categories (borrowed from OpenClaw's tool policy system):
   - goal_tools: CRUD + planning decomposition
   - task_tools: CRUD + completion + rescheduling
   - reminder_tools: CRUD + pause/resume
+  - cron_tools: user-defined scheduled jobs
   - planning_tools: autonomous goal decomposition, adaptation, rescheduling
-  - analysis_tools: progress analysis, smart suggestions, daily summary
+  - analysis_tools: progress analysis, smart suggestions, daily summary,
+    assistant usage stats
   - memory_tools: vector search, fact storage, recall
   - web_tools: internet search via Google grounding
   - utility_tools: data queries, datetime, search across entities
@@ -35,6 +37,13 @@ from app.agent.tools.reminder_tools import (
     snooze_reminder,
     update_reminder,
 )
+from app.agent.tools.cron_tools import (
+    cron_add,
+    cron_list,
+    cron_remove,
+    cron_run,
+    cron_update,
+)
 from app.agent.tools.planning_tools import (
     decompose_goal_into_plan,
     adapt_plan,
@@ -48,6 +57,7 @@ from app.agent.tools.calendar_tools import (
 from app.agent.tools.analysis_tools import (
     analyze_progress,
     get_daily_summary,
+    get_usage_stats,
     smart_suggest,
 )
 from app.agent.tools.memory_tools import (
@@ -80,6 +90,12 @@ ALL_TOOLS = [
     update_reminder,
     snooze_reminder,
     delete_reminder,
+    # Scheduled automation
+    cron_add,
+    cron_list,
+    cron_update,
+    cron_remove,
+    cron_run,
     # Planning (autonomous)
     decompose_goal_into_plan,
     adapt_plan,
@@ -92,6 +108,7 @@ ALL_TOOLS = [
     analyze_progress,
     get_daily_summary,
     smart_suggest,
+    get_usage_stats,
     # Memory
     search_memory,
     remember_fact,
@@ -6,22 +6,37 @@ tools from the Projectj ai-agent.ts.
 
 from __future__ import annotations
 
+import asyncio
 import math
 
 from strands import tool
 
-from app.db.repositories.goals import GoalsRepository
-from app.db.repositories.tasks import TasksRepository
-from app.db.repositories.reminders import RemindersRepository
+from app.agent.daily_summary import build_daily_summary
+from app.agent.usage import user_usage_report
+from app.db.base_repository import LazyInstance
+from app.dependencies import (
+    get_async_goals_repo,
+    get_async_reminders_repo,
+    get_async_tasks_repo,
+)
 
 
-_goals_repo = GoalsRepository()
-_tasks_repo = TasksRepository()
-_reminders_repo = RemindersRepository()
+_goals_repo = LazyInstance(get_async_goals_repo)
+_tasks_repo = LazyInstance(get_async_tasks_repo)
+_reminders_repo = LazyInstance(get_async_reminders_repo)
+
+
+async def _load_day(user_id: str) -> tuple[list[dict], list[dict], list[dict]]:
+    """Goals, tasks and active reminders, read concurrently."""
+    return await asyncio.gather(
+        _goals_repo.list_all(user_id),
+        _tasks_repo.list_all(user_id),
+        _reminders_repo.list_active_reminders(user_id),
+    )
 
 
 @tool
-def get_daily_summary(user_id: str) -> dict:
+async def get_daily_summary(user_id: str) -> dict:
     """Get a comprehensive summary of the user's day.
 
     Use for daily briefings, planning, or when the user asks
@@ -33,67 +48,11 @@ def get_daily_summary(user_id: str) -> dict:
     Returns:
         Summary dict with goals, tasks, reminders, and overall progress.
     """
-    goals = _goals_repo.list_all(user_id)
-    tasks = _tasks_repo.list_all(user_id)
-    reminders = _reminders_repo.list_all(user_id)
-
-    completed_tasks = [t for t in tasks if t.get("completed")]
-    pending_tasks = [t for t in tasks if not t.get("completed")]
-    active_goals = [g for g in goals if not g.get("completed")]
-
-    return {
-        "goals": {
-            "active": [
-                {
-                    "id": g.get("id", g.get("goalId", "")),
-                    "title": g.get("title", ""),
-                    "category": g.get("category", ""),
-                    "progress": g.get("progress", 0),
-                    "total": g.get("total", 100),
-                    "unit": g.get("unit", ""),
-                    "percentComplete": (
-                        round((g.get("progress", 0) / g.get("total", 100)) * 100)
-                        if g.get("total", 100) > 0 else 0
-                    ),
-                }
-                for g in active_goals
-            ],
-            "completedCount": len([g for g in goals if g.get("completed")]),
-        },
-        "tasks": {
-            "completed": len(completed_tasks),
-            "pending": len(pending_tasks),
-            "total": len(tasks),
-            "upcoming": [
-                {
-                    "id": t.get("id", t.get("taskId", "")),
-                    "title": t.get("title", ""),
-                    "time": t.get("time", ""),
-                    "type": t.get("type", "task"),
-                    "priority": t.get("priority", "medium"),
-                }
-                for t in pending_tasks[:5]
-            ],
-        },
-        "reminders": {
-            "active": [
-                {
-                    "id": r.get("id", r.get("reminderId", "")),
-                    "title": r.get("title", ""),
-                    "time": r.get("time", ""),
-                }
-                for r in reminders if r.get("active")
-            ],
-        },
-        "overallProgress": (
-            round((len(completed_tasks) / len(tasks)) * 100)
-            if tasks else 0
-        ),
-    }
+    return build_daily_summary(*await _load_day(user_id))
 
 
 @tool
-def analyze_progress(user_id: str) -> dict:
+async def analyze_progress(user_id: str) -> dict:
     """Deep analysis of progress across all goals and tasks.
 
     Identifies patterns, bottlenecks, at-risk goals, and provides
@@ -106,9 +65,7 @@ def analyze_progress(user_id: str) -> dict:
     Returns:
         Detailed analysis with goal breakdowns, risk assessment, and recommendations.
     """
-    goals = _goals_repo.list_all(user_id)
-    tasks = _tasks_repo.list_all(user_id)
-    reminders = _reminders_repo.list_all(user_id)
+    goals, tasks, reminders = await _load_day(user_id)
 
     active_goals = [g for g in goals if not g.get("completed")]
     completed_goals = [g for g in goals if g.get("completed")]
@@ -177,7 +134,7 @@ def analyze_progress(user_id: str) -> dict:
         )
     if len(pending_tasks) > 10:
         recs.append("Task overload detected. Focus on the top 3 highest-priority items.")
-    if not [r for r in reminders if r.get("active")] and pending_tasks:
+    if not reminders and pending_tasks:
         recs.append("No active reminders. Setting reminders boosts completion rates.")
     if at_risk:
         recs.append(
@@ -193,7 +150,7 @@ def analyze_progress(user_id: str) -> dict:
             "totalTasks": len(tasks),
             "completedTasks": len(completed_tasks),
             "pendingTasks": len(pending_tasks),
-            "activeReminders": len([r for r in reminders if r.get("active")]),
+            "activeReminders": len(reminders),
             "overallCompletionRate": (
                 round((len(completed_tasks) / len(tasks)) * 100) if tasks else 0
             ),
@@ -207,7 +164,7 @@ def analyze_progress(user_id: str) -> dict:
 
 
 @tool
-def smart_suggest(user_id: str, focus: str = "all") -> dict:
+async def smart_suggest(user_id: str, focus: str = "all") -> dict:
     """Generate smart suggestions based on current goals, tasks, and patterns.
 
     Use proactively to offer helpful next steps, or when the user says
@@ -220,9 +177,7 @@ def smart_suggest(user_id: str, focus: str = "all") -> dict:
     Returns:
         List of prioritized suggestions.
     """
-    goals = _goals_repo.list_all(user_id)
-    tasks = _tasks_repo.list_all(user_id)
-    reminders = _reminders_repo.list_all(user_id)
+    goals, tasks, reminders = await _load_day(user_id)
 
     suggestions: list[dict] = []
 
@@ -299,8 +254,7 @@ def smart_suggest(user_id: str, focus: str = "all") -> dict:
         })
 
     # No reminders
-    active_reminders = [r for r in reminders if r.get("active")]
-    if not active_reminders and pending:
+    if not reminders and pending:
         suggestions.append({
             "type": "no_reminders",
             "suggestion": "You have tasks but no reminders. Reminders boost completion by 40%.",
@@ -312,3 +266,21 @@ def smart_suggest(user_id: str, focus: str = "all") -> dict:
         "focusArea": focus,
         "totalSuggestions": len(suggestions),
     }
+
+
+@tool
+def get_usage_stats(user_id: str, days: int = 7) -> dict:
+    """How much the user has used the assistant recently.
+
+    Use when the user asks how often they talk to you or how much of the
+    assistant they've used.
+
+    Args:
+        user_id: The authenticated user's ID.
+        days: Number of days to cover (1-90).
+
+    Returns:
+        Totals (turns, tokens, tool calls), a breakdown by source
+        (chat, briefings, cron, ...) and one row per day.
+    """
+    return user_usage_report(user_id, days, include_cost=False)
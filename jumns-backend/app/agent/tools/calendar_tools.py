@@ -14,13 +14,12 @@ from datetime import datetime, timedelta, timezone
 
 from strands import tool
 
-from app.db.repositories.goals import GoalsRepository
-from app.db.repositories.reminders import RemindersRepository
-from app.db.repositories.tasks import TasksRepository
+from app.db.base_repository import LazyInstance
+from app.dependencies import get_goals_repo, get_reminders_repo, get_tasks_repo
 
-_goals_repo = GoalsRepository()
-_tasks_repo = TasksRepository()
-_reminders_repo = RemindersRepository()
+_goals_repo = LazyInstance(get_goals_repo)
+_tasks_repo = LazyInstance(get_tasks_repo)
+_reminders_repo = LazyInstance(get_reminders_repo)
 
 
 @tool
@@ -54,10 +53,12 @@ def get_schedule(
     end = start + timedelta(days=days)
     start_iso = start.strftime("%Y-%m-%d")
     end_iso = end.strftime("%Y-%m-%d")
+    last_day_iso = (end - timedelta(days=1)).strftime("%Y-%m-%d")
 
-    # Fetch all tasks and reminders
-    all_tasks = _tasks_repo.list_all(user_id)
-    all_reminders = _reminders_repo.list_all(user_id)
+    # Only read the days shown, plus pending tasks overdue before the window
+    all_tasks = _tasks_repo.list_due_between(user_id, start_iso, last_day_iso)
+    overdue_tasks = _tasks_repo.list_overdue(user_id, start_iso)
+    all_reminders = _reminders_repo.list_active_reminders(user_id)
 
     schedule: dict[str, dict] = {}
     current = start
@@ -83,8 +84,6 @@ def get_schedule(
         # Reminders active on this day (recurring or scheduled for this date)
         day_reminders = []
         for r in all_reminders:
-            if not r.get("active", True):
-                continue
             time_str = r.get("time", "").lower()
             # Check if reminder is relevant for this day
             is_daily = any(
@@ -119,10 +118,6 @@ def get_schedule(
 
     # Summary stats
     total_tasks = sum(d["totalItems"] for d in schedule.values())
-    overdue_tasks = [
-        t for t in all_tasks
-        if not t.get("completed") and t.get("dueDate", "") and t["dueDate"] < start_iso
-    ]
 
     return {
         "startDate": start_iso,
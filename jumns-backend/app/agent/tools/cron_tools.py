@@ -0,0 +1,174 @@
+"""Agent tools for scheduled automation — user-defined cron jobs.
+
+Jobs are stored in jumns-cron-jobs and executed by the scheduler's
+cron_jobs tick (app.scheduler.cron_dispatcher), which runs each job's
+action_message through the agent and posts the result to the chat.
+"""
+
+from __future__ import annotations
+
+from strands import tool
+
+from app.db.base_repository import LazyInstance
+from app.dependencies import get_cron_jobs_repo, get_users_repo
+
+
+_cron_repo = LazyInstance(get_cron_jobs_repo)
+_users_repo = LazyInstance(get_users_repo)
+
+
+def _summary(job: dict) -> dict:
+    return {
+        "id": job.get("id", job.get("jobId", "")),
+        "name": job.get("name", ""),
+        "description": job.get("description", ""),
+        "scheduleType": job.get("scheduleType", ""),
+        "scheduleValue": job.get("scheduleValue", ""),
+        "enabled": job.get("enabled", True),
+        "nextRunAt": job.get("nextRunAt"),
+        "lastRunAt": job.get("lastRunAt"),
+        "runCount": job.get("runCount", 0),
+        "lastStatus": job.get("lastStatus"),
+    }
+
+
+@tool
+def cron_add(
+    user_id: str,
+    name: str,
+    schedule_type: str,
+    action_message: str,
+    schedule_value: str = "",
+    description: str = "",
+    enabled: bool = True,
+) -> dict:
+    """Create a scheduled cron job that runs automatically.
+
+    Use this when the user says "check my goals weekly", "run a daily
+    briefing at 8am", etc. For a simple notification at a time, prefer
+    create_reminder.
+
+    Args:
+        user_id: The authenticated user's ID.
+        name: Short name for the job (e.g. "Morning Briefing").
+        schedule_type: One of: "once", "daily", "weekly", "interval", "cron".
+        action_message: The message/prompt to execute when the job fires.
+        schedule_value: Schedule details depending on type:
+            - once: ISO datetime (e.g. "2026-03-01T08:00:00Z")
+            - daily: Time in HH:MM format (e.g. "08:00")
+            - weekly: Day and time (e.g. "Monday 09:00")
+            - interval: Minutes between runs, at least 15 (e.g. "30")
+            - cron: Cron expression (e.g. "0 8 * * mon-fri")
+        description: What this job does.
+        enabled: Whether the job starts enabled.
+
+    Returns:
+        The created cron job, or an error for an invalid schedule.
+    """
+    settings = _users_repo.get_settings(user_id)
+    try:
+        job = _cron_repo.create(user_id, {
+            "name": name,
+            "description": description,
+            "enabled": enabled,
+            "scheduleType": schedule_type,
+            "scheduleValue": schedule_value,
+            "actionMessage": action_message,
+            "timezone": settings.get("timezone", "UTC"),
+        })
+    except ValueError as exc:
+        return {"error": f"Invalid schedule: {exc}"}
+    return _summary(job)
+
+
+@tool
+def cron_list(user_id: str, include_disabled: bool = False) -> list[dict]:
+    """List the user's scheduled cron jobs.
+
+    Args:
+        user_id: The authenticated user's ID.
+        include_disabled: Whether to include disabled jobs.
+
+    Returns:
+        List of cron jobs with next/last run times and run counts.
+    """
+    return [
+        _summary(j) for j in _cron_repo.list_all(user_id, include_disabled)
+    ]
+
+
+@tool
+def cron_update(
+    user_id: str,
+    job_id: str,
+    name: str | None = None,
+    schedule_type: str | None = None,
+    schedule_value: str | None = None,
+    action_message: str | None = None,
+    enabled: bool | None = None,
+) -> dict:
+    """Update a cron job's schedule, message, or enabled status.
+
+    Args:
+        user_id: The authenticated user's ID.
+        job_id: The cron job ID.
+        name: New name.
+        schedule_type: New schedule type.
+        schedule_value: New schedule value.
+        action_message: New action message.
+        enabled: Enable or disable.
+
+    Returns:
+        Updated cron job.
+    """
+    try:
+        job = _cron_repo.update(user_id, job_id, {
+            "name": name,
+            "scheduleType": schedule_type,
+            "scheduleValue": schedule_value,
+            "actionMessage": action_message,
+            "enabled": enabled,
+        })
+    except ValueError as exc:
+        return {"error": f"Invalid schedule: {exc}"}
+    except Exception:
+        return {"error": "Cron job not found"}
+    return _summary(job)
+
+
+@tool
+def cron_remove(user_id: str, job_id: str) -> dict:
+    """Delete a cron job.
+
+    Args:
+        user_id: The authenticated user's ID.
+        job_id: The cron job ID.
+
+    Returns:
+        Confirmation.
+    """
+    _cron_repo.delete(user_id, job_id)
+    return {"success": True, "deleted": job_id}
+
+
+@tool
+def cron_run(user_id: str, job_id: str) -> dict:
+    """Run a cron job as soon as possible (within about a minute).
+
+    Args:
+        user_id: The authenticated user's ID.
+        job_id: The cron job ID.
+
+    Returns:
+        Confirmation that the run is queued.
+    """
+    try:
+        job = _cron_repo.run_now(user_id, job_id)
+    except Exception:
+        return {"error": "Cron job not found"}
+    return {
+        "id": job_id,
+        "name": job.get("name", ""),
+        "queued": True,
+        "message": f"Job '{job.get('name', '')}' will run within a minute.",
+    }
@@ -8,12 +8,12 @@ from __future__ import annotations
 
 from strands import tool
 
-from app.db.repositories.goals import GoalsRepository
-from app.db.repositories.tasks import TasksRepository
+from app.db.base_repository import LazyInstance
+from app.dependencies import get_goals_repo, get_tasks_repo
 
 
-_goals_repo = GoalsRepository()
-_tasks_repo = TasksRepository()
+_goals_repo = LazyInstance(get_goals_repo)
+_tasks_repo = LazyInstance(get_tasks_repo)
 
 
 @tool
@@ -94,6 +94,7 @@ def update_goal(
     user_id: str,
     goal_id: str,
     progress: int | None = None,
+    progress_increment: int | None = None,
     insight: str | None = None,
     completed: bool | None = None,
     title: str | None = None,
@@ -103,12 +104,16 @@ def update_goal(
 ) -> dict:
     """Update a goal's progress, insight, completion status, or other fields.
 
-    Use get_goals first to find the goal ID.
+    Use get_goals first to find the goal ID. Prefer progress_increment
+    when logging new progress (e.g. "ran 5 km") — it adds atomically and
+    can't overwrite a concurrent update.
 
     Args:
         user_id: The authenticated user's ID.
         goal_id: The goal ID to update.
-        progress: New progress value.
+        progress: New absolute progress value.
+        progress_increment: Amount to add to the current progress
+            (ignored if progress is also given).
         insight: Updated AI insight about the goal.
         completed: Mark goal as completed.
         title: New title.
@@ -136,7 +141,9 @@ def update_goal(
         updates["unit"] = unit
 
     try:
-        goal = _goals_repo.update(user_id, goal_id, updates)
+        goal = _goals_repo.update(
+            user_id, goal_id, updates, progress_increment=progress_increment,
+        )
         return {
             "id": goal.get("id", goal.get("goalId", "")),
             "title": goal.get("title", ""),
@@ -8,10 +8,11 @@ from __future__ import annotations
 
 from strands import tool
 
-from app.memory.memory_service import MemoryService
+from app.db.base_repository import LazyInstance
+from app.dependencies import get_memory_service
 
 
-_memory_service = MemoryService()
+_memory_service = LazyInstance(get_memory_service)
 
 
 @tool
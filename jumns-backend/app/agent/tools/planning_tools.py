@@ -16,16 +16,21 @@ from datetime import datetime, timezone
 
 from strands import tool
 
-from app.db.repositories.goals import GoalsRepository
-from app.db.repositories.tasks import TasksRepository
-from app.db.repositories.reminders import RemindersRepository
-from app.db.repositories.insights import InsightsRepository
+from app.db.base_repository import LazyInstance
+from app.dependencies import (
+    get_goals_repo,
+    get_insights_repo,
+    get_reminders_repo,
+    get_tasks_repo,
+    get_users_repo,
+)
 
 
-_goals_repo = GoalsRepository()
-_tasks_repo = TasksRepository()
-_reminders_repo = RemindersRepository()
-_insights_repo = InsightsRepository()
+_goals_repo = LazyInstance(get_goals_repo)
+_tasks_repo = LazyInstance(get_tasks_repo)
+_reminders_repo = LazyInstance(get_reminders_repo)
+_insights_repo = LazyInstance(get_insights_repo)
+_users_repo = LazyInstance(get_users_repo)
 
 
 @tool
@@ -123,12 +128,13 @@ def decompose_goal_into_plan(
         })
 
     # Create all reminders linked to the goal
+    settings = _users_repo.get_settings(user_id) if reminders else None
     for r in reminders:
         reminder = _reminders_repo.create(user_id, {
             "title": r.get("title", ""),
             "time": r.get("time", ""),
             "goalId": goal_id,
-        })
+        }, settings=settings)
         created_reminders.append({
             "id": reminder.get("id", reminder.get("reminderId", "")),
             "title": reminder["title"],
@@ -264,32 +270,31 @@ def reschedule_failed_tasks(
     """
     from datetime import timedelta
 
-    all_tasks = _tasks_repo.list_all(user_id, goal_id=goal_id)
     now_iso = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    overdue_tasks = _tasks_repo.list_overdue(user_id, now_iso, goal_id=goal_id)
     rescheduled = []
 
-    for t in all_tasks:
-        if t.get("completed"):
+    for t in overdue_tasks:
+        dd = t["dueDate"]
+        try:
+            old_date = datetime.strptime(dd, "%Y-%m-%d")
+            new_date = datetime.now(timezone.utc) + timedelta(days=days_forward)
+            new_dd = new_date.strftime("%Y-%m-%d")
+            task_id = t.get("id", t.get("taskId", ""))
+            # Versioned write: detail is read-modify-write, so don't clobber
+            # an edit that landed since the task was read
+            _tasks_repo.update(user_id, task_id, {
+                "dueDate": new_dd,
+                "detail": f"{t.get('detail', '')} [rescheduled from {dd}]".strip(),
+            }, expected_version=t.get("version", 0))
+            rescheduled.append({
+                "id": task_id,
+                "title": t.get("title", ""),
+                "oldDate": dd,
+                "newDate": new_dd,
+            })
+        except Exception:
             continue
-        dd = t.get("dueDate", "")
-        if dd and dd < now_iso:
-            try:
-                old_date = datetime.strptime(dd, "%Y-%m-%d")
-                new_date = datetime.now(timezone.utc) + timedelta(days=days_forward)
-                new_dd = new_date.strftime("%Y-%m-%d")
-                task_id = t.get("id", t.get("taskId", ""))
-                _tasks_repo.update(user_id, task_id, {
-                    "dueDate": new_dd,
-                    "detail": f"{t.get('detail', '')} [rescheduled from {dd}]".strip(),
-                })
-                rescheduled.append({
-                    "id": task_id,
-                    "title": t.get("title", ""),
-                    "oldDate": dd,
-                    "newDate": new_dd,
-                })
-            except Exception:
-                continue
 
     # Create an insight about the rescheduling
     if rescheduled:
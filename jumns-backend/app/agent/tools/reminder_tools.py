@@ -6,23 +6,35 @@ from datetime import datetime, timedelta, timezone
 
 from strands import tool
 
-from app.db.repositories.reminders import RemindersRepository
+from app.db.base_repository import LazyInstance
+from app.dependencies import get_reminders_repo, get_users_repo
 
 
-_reminders_repo = RemindersRepository()
+_reminders_repo = LazyInstance(get_reminders_repo)
+_users_repo = LazyInstance(get_users_repo)
+
+_UNSCHEDULED_WARNING = (
+    "Couldn't work out when this should fire, so it won't be delivered "
+    "automatically. Ask the user for a day and clock time, e.g. "
+    "\"Every Monday 8 AM\" or \"Tomorrow 5 PM\"."
+)
 
 
 @tool
-def get_reminders(user_id: str) -> list[dict]:
+def get_reminders(user_id: str, active_only: bool = False) -> list[dict]:
     """Get all reminders for the user.
 
     Args:
         user_id: The authenticated user's ID.
+        active_only: Only return active (not paused) reminders.
 
     Returns:
         List of reminder dicts.
     """
-    reminders = _reminders_repo.list_all(user_id)
+    if active_only:
+        reminders = _reminders_repo.list_active_reminders(user_id)
+    else:
+        reminders = _reminders_repo.list_all(user_id)
     return [
         {
             "id": r.get("id", r.get("reminderId", "")),
@@ -33,6 +45,7 @@ def get_reminders(user_id: str) -> list[dict]:
             "snoozeCount": r.get("snoozeCount", 0),
             "snoozedUntil": r.get("snoozedUntil"),
             "originalTime": r.get("originalTime"),
+            "nextFireAt": r.get("nextFireAt"),
         }
         for r in reminders
     ]
@@ -66,12 +79,18 @@ def create_reminder(
     if goal_id:
         data["goalId"] = goal_id
 
-    reminder = _reminders_repo.create(user_id, data)
-    return {
+    reminder = _reminders_repo.create(
+        user_id, data, settings=_users_repo.get_settings(user_id),
+    )
+    result = {
         "id": reminder.get("id", reminder.get("reminderId", "")),
         "title": reminder["title"],
         "time": reminder.get("time", ""),
+        "nextFireAt": reminder.get("nextFireAt"),
     }
+    if not reminder.get("nextFireAt"):
+        result["warning"] = _UNSCHEDULED_WARNING
+    return result
 
 
 @tool
@@ -103,13 +122,20 @@ def update_reminder(
         updates["active"] = active
 
     try:
-        reminder = _reminders_repo.update(user_id, reminder_id, updates)
-        return {
+        reminder = _reminders_repo.update(
+            user_id, reminder_id, updates,
+            settings=_users_repo.get_settings(user_id) if time is not None else None,
+        )
+        result = {
             "id": reminder.get("id", reminder.get("reminderId", "")),
             "title": reminder.get("title", ""),
             "time": reminder.get("time", ""),
             "active": reminder.get("active", True),
+            "nextFireAt": reminder.get("nextFireAt"),
         }
+        if time is not None and not reminder.get("nextFireAt"):
+            result["warning"] = _UNSCHEDULED_WARNING
+        return result
     except Exception:
         return {"error": "Reminder not found"}
 
@@ -4,10 +4,11 @@ from __future__ import annotations
 
 from strands import tool
 
-from app.db.repositories.tasks import TasksRepository
+from app.db.base_repository import LazyInstance
+from app.dependencies import get_tasks_repo
 
 
-_tasks_repo = TasksRepository()
+_tasks_repo = LazyInstance(get_tasks_repo)
 
 
 @tool
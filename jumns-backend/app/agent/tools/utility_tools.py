@@ -5,20 +5,30 @@ Mirrors OpenClaw's query_user_data, search_data, and get_current_datetime.
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone
 
 from strands import tool
 
-from app.db.repositories.goals import GoalsRepository
-from app.db.repositories.tasks import TasksRepository
-from app.db.repositories.reminders import RemindersRepository
-from app.db.repositories.skills import SkillsRepository
+from app.db.base_repository import LazyInstance
+from app.dependencies import (
+    get_async_goals_repo,
+    get_async_reminders_repo,
+    get_async_tasks_repo,
+    get_goals_repo,
+    get_reminders_repo,
+    get_skills_repo,
+    get_tasks_repo,
+)
 
 
-_goals_repo = GoalsRepository()
-_tasks_repo = TasksRepository()
-_reminders_repo = RemindersRepository()
-_skills_repo = SkillsRepository()
+_goals_repo = LazyInstance(get_goals_repo)
+_tasks_repo = LazyInstance(get_tasks_repo)
+_reminders_repo = LazyInstance(get_reminders_repo)
+_skills_repo = LazyInstance(get_skills_repo)
+_async_goals_repo = LazyInstance(get_async_goals_repo)
+_async_tasks_repo = LazyInstance(get_async_tasks_repo)
+_async_reminders_repo = LazyInstance(get_async_reminders_repo)
 
 
 @tool
@@ -53,7 +63,7 @@ def query_user_data(user_id: str, data_type: str = "all") -> dict:
 
 
 @tool
-def search_data(user_id: str, query: str) -> dict:
+async def search_data(user_id: str, query: str) -> dict:
     """Search across goals, tasks, and reminders by keyword.
 
     Use when the user asks about something specific and you need to find it.
@@ -66,9 +76,11 @@ def search_data(user_id: str, query: str) -> dict:
         Dict with matching goals, tasks, and reminders.
     """
     q = query.lower()
-    goals = _goals_repo.list_all(user_id)
-    tasks = _tasks_repo.list_all(user_id)
-    reminders = _reminders_repo.list_all(user_id)
+    goals, tasks, reminders = await asyncio.gather(
+        _async_goals_repo.list_all(user_id),
+        _async_tasks_repo.list_all(user_id),
+        _async_reminders_repo.list_all(user_id),
+    )
 
     return {
         "goals": [
@@ -0,0 +1,167 @@
+"""Per-turn token, tool-call and cost accounting for agent invocations.
+
+Every invoke / invoke_scheduled call collects a TurnUsage while it runs
+through the failover chain: one entry per model attempt, with tokens and
+tool calls read from the Strands result metrics. When the turn ends, the
+totals are added to daily counters in jumns-usage (see
+UsageRepository.record_agent_usage), keyed by user and by day so both a
+user's history and a day's top spenders are single queries.
+
+Costs are estimates from MODEL_PRICES (USD per million tokens), kept as
+integer micro-dollars so they can be summed with atomic ADDs.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+from app.dependencies import get_usage_repo
+
+logger = logging.getLogger(__name__)
+
+# USD per million (input, output) tokens; override with MODEL_PRICES JSON
+_DEFAULT_PRICES = {
+    "gemini-2.5-flash": [0.30, 2.50],
+}
+MODEL_PRICES: dict[str, list[float]] = {
+    **_DEFAULT_PRICES,
+    **json.loads(os.getenv("MODEL_PRICES", "{}")),
+}
+
+
+def extract_metrics(result) -> dict[str, int]:
+    """Tokens, tool calls and cycles from a Strands AgentResult (if present)."""
+    metrics = getattr(result, "metrics", None)
+    if metrics is None:
+        return {"inputTokens": 0, "outputTokens": 0, "toolCalls": 0, "cycles": 0}
+    usage = getattr(metrics, "accumulated_usage", None) or {}
+    tools = getattr(metrics, "tool_metrics", None) or {}
+    return {
+        "inputTokens": int(usage.get("inputTokens", 0) or 0),
+        "outputTokens": int(usage.get("outputTokens", 0) or 0),
+        "toolCalls": sum(int(getattr(t, "call_count", 0)) for t in tools.values()),
+        "cycles": int(getattr(metrics, "cycle_count", 0) or 0),
+    }
+
+
+def cost_micro_usd(model_id: str, input_tokens: int, output_tokens: int) -> int:
+    """Estimated cost in micro-dollars (0 for models without a price)."""
+    input_price, output_price = MODEL_PRICES.get(model_id, (0.0, 0.0))
+    return round(input_tokens * input_price + output_tokens * output_price)
+
+
+class TurnUsage:
+    """Usage of one agent turn across all of its model attempts."""
+
+    def __init__(self, source: str):
+        self.source = source
+        self.attempts: list[dict] = []
+        self._started = time.monotonic()
+
+    def record_attempt(
+        self, model_id: str, duration_ms: int, result=None, error: bool = False,
+    ) -> None:
+        self.attempts.append({
+            "model": model_id,
+            "durationMs": duration_ms,
+            "error": error,
+            **extract_metrics(result),
+        })
+
+    def totals(self) -> dict[str, int]:
+        """Counter increments for this turn."""
+        totals = {
+            "turns": 1,
+            "failedTurns": int(not self.attempts or self.attempts[-1]["error"]),
+            "modelAttempts": len(self.attempts),
+            "failedAttempts": sum(1 for a in self.attempts if a["error"]),
+            "durationMs": round((time.monotonic() - self._started) * 1000),
+            "modelMs": sum(a["durationMs"] for a in self.attempts),
+        }
+        for key in ("inputTokens", "outputTokens", "toolCalls"):
+            totals[key] = sum(a[key] for a in self.attempts)
+        totals["costMicroUsd"] = sum(
+            cost_micro_usd(a["model"], a["inputTokens"], a["outputTokens"])
+            for a in self.attempts
+        )
+        return totals
+
+
+class UsageRecorder:
+    """Writes finished turns to the daily usage counters (best-effort)."""
+
+    def __init__(self):
+        self._repo = get_usage_repo()
+
+    def record(self, user_id: str, usage: TurnUsage) -> None:
+        totals = usage.totals()
+        day = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        # Per-source and per-model breakdowns live beside the totals
+        breakdown = {
+            f"{usage.source}:turns": 1,
+            f"{usage.source}:inputTokens": totals["inputTokens"],
+            f"{usage.source}:outputTokens": totals["outputTokens"],
+            f"{usage.source}:durationMs": totals["durationMs"],
+        }
+        for attempt in usage.attempts:
+            breakdown[f"model:{attempt['model']}:calls"] = (
+                breakdown.get(f"model:{attempt['model']}:calls", 0) + 1
+            )
+        try:
+            self._repo.record_agent_usage(user_id, day, {**totals, **breakdown})
+        except Exception:
+            logger.exception("Failed to record agent usage for user %s", user_id)
+
+
+def summarize_usage(items: list[dict]) -> dict:
+    """Totals and per-source / per-model breakdowns over daily usage items."""
+    totals: dict[str, int] = {}
+    by_source: dict[str, dict[str, int]] = {}
+    by_model: dict[str, int] = {}
+    for item in items:
+        for key, value in item.items():
+            if key in ("userId", "usageKey", "day", "expiresAt") or isinstance(value, str):
+                continue
+            value = int(value)
+            if key.startswith("model:"):
+                model = key[len("model:"):].rsplit(":", 1)[0]
+                by_model[model] = by_model.get(model, 0) + value
+            elif ":" in key:
+                source, metric = key.split(":", 1)
+                bucket = by_source.setdefault(source, {})
+                bucket[metric] = bucket.get(metric, 0) + value
+            else:
+                totals[key] = totals.get(key, 0) + value
+    totals["estimatedCostUsd"] = round(totals.get("costMicroUsd", 0) / 1_000_000, 4)
+    return {"totals": totals, "bySource": by_source, "modelCalls": by_model}
+
+
+def user_usage_report(user_id: str, days: int = 7, include_cost: bool = True) -> dict:
+    """A user's usage over the last ``days`` UTC days, with daily rows.
+
+    Cost is an operator figure; user-facing callers pass include_cost=False.
+    """
+    days = max(1, min(days, 90))
+    today = datetime.now(timezone.utc)
+    start = (today - timedelta(days=days - 1)).strftime("%Y-%m-%d")
+    items = get_usage_repo().list_agent_usage(user_id, start, today.strftime("%Y-%m-%d"))
+    report = summarize_usage(items)
+    if not include_cost:
+        report["totals"].pop("costMicroUsd", None)
+        report["totals"].pop("estimatedCostUsd", None)
+    report["days"] = days
+    report["daily"] = [
+        {
+            "day": item.get("day", item["usageKey"].split("#", 1)[-1]),
+            "turns": int(item.get("turns", 0)),
+            "inputTokens": int(item.get("inputTokens", 0)),
+            "outputTokens": int(item.get("outputTokens", 0)),
+            "toolCalls": int(item.get("toolCalls", 0)),
+        }
+        for item in items
+    ]
+    return report
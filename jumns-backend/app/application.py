@@ -0,0 +1,261 @@
+"""FastAPI app factory shared by the Lambda entry points.
+
+``create_app(routes)`` builds the app with CORS, response compression,
+Cognito auth, request tracing, the global exception handlers and
+/health, serving only the given route modules:
+
+    app.main            every route (local dev, single-function deploys)
+    app.handlers.crud   CRUD_ROUTES — no agent stack, no numpy
+    app.handlers.chat   CHAT_ROUTES — /api/chat and the agent-backed routes
+
+Route modules are imported on the first request under their /api prefix
+(RouteLoader), so a cold start only pays for what it serves.
+LAZY_ROUTES=0 registers them when the app is created instead.
+"""
+
+import importlib
+import os
+import threading
+from collections.abc import Iterable
+
+from fastapi import FastAPI, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, Response
+from starlette.background import BackgroundTask
+
+from app.exceptions import (
+    AgentUnavailableError,
+    ConcurrentModificationError,
+    ForbiddenError,
+    NotModifiedError,
+    RateLimitExceededError,
+    ResourceNotFoundError,
+    UnauthorizedError,
+)
+from app.middleware.auth import CognitoAuthMiddleware
+from app.middleware.compression import CompressionMiddleware
+from app import push
+from app.tracing import span
+
+# First path segment under /api -> module in app.routes
+ROUTE_MODULES = {
+    "chat": "chat",
+    "messages": "messages",
+    "goals": "goals",
+    "tasks": "tasks",
+    "reminders": "reminders",
+    "cron": "cron",
+    "skills": "skills",
+    "user-settings": "settings",
+    "subscription": "subscription",
+    "access-code": "access_code",
+    "insights": "insights",
+    "memories": "memories",
+    "admin": "admin",
+    "push": "push",
+}
+
+ALL_ROUTES = tuple(ROUTE_MODULES.values())
+CHAT_ROUTES = ("chat", "insights")
+CRUD_ROUTES = tuple(m for m in ALL_ROUTES if m != "chat")
+
+
+# ---------------------------------------------------------------------------
+# Lazy route registration
+# ---------------------------------------------------------------------------
+
+
+class RouteLoader:
+    """Registers an app's route modules on the first request to each."""
+
+    def __init__(self, app: FastAPI, modules: Iterable[str]):
+        self._app = app
+        self._modules = set(modules)
+        self._loaded: set[str] = set()
+        self._lock = threading.Lock()
+
+    def _include(self, module_name: str) -> None:
+        with self._lock:
+            if module_name in self._loaded:
+                return
+            module = importlib.import_module(f"app.routes.{module_name}")
+            self._app.include_router(module.router, prefix="/api")
+            self._loaded.add(module_name)
+
+    def ensure(self, path: str) -> None:
+        """Register the route module that serves ``path`` (once)."""
+        parts = path.split("/", 3)  # "", "api", segment, rest
+        if len(parts) < 3 or parts[1] != "api":
+            return
+        module_name = ROUTE_MODULES.get(parts[2])
+        if module_name in self._modules and module_name not in self._loaded:
+            self._include(module_name)
+
+    def load_all(self) -> None:
+        for module_name in sorted(self._modules):
+            self._include(module_name)
+
+
+class _RouteLoaderMiddleware:
+    """Plain ASGI middleware that calls RouteLoader.ensure per request.
+
+    Added before auth, so it runs inside it: only authenticated requests
+    import route modules.
+    """
+
+    def __init__(self, asgi_app, loader: RouteLoader):
+        self.app = asgi_app
+        self.loader = loader
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] in ("http", "websocket"):
+            self.loader.ensure(scope["path"])
+        await self.app(scope, receive, send)
+
+
+# ---------------------------------------------------------------------------
+# Global exception handlers
+# ---------------------------------------------------------------------------
+
+
+async def not_found_handler(_request: Request, exc: ResourceNotFoundError):
+    return JSONResponse(status_code=404, content={"error": "Resource not found"})
+
+
+async def conflict_handler(_request: Request, exc: ConcurrentModificationError):
+    return JSONResponse(
+        status_code=409,
+        content={"error": "Resource was modified concurrently, please retry"},
+    )
+
+
+async def unauthorized_handler(_request: Request, exc: UnauthorizedError):
+    return JSONResponse(status_code=401, content={"error": "Unauthorized"})
+
+
+async def forbidden_handler(_request: Request, exc: ForbiddenError):
+    return JSONResponse(status_code=403, content={"error": "Forbidden"})
+
+
+async def rate_limit_handler(_request: Request, exc: RateLimitExceededError):
+    return JSONResponse(
+        status_code=429,
+        content={"error": "Daily message limit reached. Upgrade to Pro for unlimited messages."},
+    )
+
+
+async def agent_unavailable_handler(_request: Request, exc: AgentUnavailableError):
+    return JSONResponse(
+        status_code=503,
+        content={"error": "AI service temporarily unavailable"},
+    )
+
+
+async def not_modified_handler(_request: Request, exc: NotModifiedError):
+    return Response(status_code=304, headers={"ETag": exc.etag})
+
+
+async def validation_handler(_request: Request, exc: RequestValidationError):
+    return JSONResponse(status_code=422, content={"error": str(exc)})
+
+
+async def generic_handler(_request: Request, exc: Exception):
+    # Never leak stack traces to the client
+    return JSONResponse(status_code=500, content={"error": "Internal server error"})
+
+
+_EXCEPTION_HANDLERS = [
+    (ResourceNotFoundError, not_found_handler),
+    (ConcurrentModificationError, conflict_handler),
+    (UnauthorizedError, unauthorized_handler),
+    (ForbiddenError, forbidden_handler),
+    (RateLimitExceededError, rate_limit_handler),
+    (AgentUnavailableError, agent_unavailable_handler),
+    (NotModifiedError, not_modified_handler),
+    (RequestValidationError, validation_handler),
+    (Exception, generic_handler),
+]
+
+
+async def trace_requests(request: Request, call_next):
+    """Root span per request (app.tracing; no-op unless TRACE_EXPORTER is set)."""
+    with span(
+        f"http {request.method} {request.url.path}",
+        **{"http.method": request.method, "http.target": request.url.path},
+    ) as current:
+        response = await call_next(request)
+        current.set_attribute("http.status_code", response.status_code)
+        return response
+
+
+async def flush_push(request: Request, call_next):
+    """Deliver the push events this request's writes buffered (app.push).
+
+    The flush is a background task on a worker thread: it starts once the
+    response body has been sent and never blocks the event loop.
+    """
+    response = await call_next(request)
+    response.background = _then(response.background, BackgroundTask(push.flush))
+    return response
+
+
+def _then(first: BackgroundTask | None, second: BackgroundTask) -> BackgroundTask:
+    if first is None:
+        return second
+
+    async def both():
+        await first()
+        await second()
+
+    return BackgroundTask(both)
+
+
+async def health_check():
+    return {"status": "ok"}
+
+
+# ---------------------------------------------------------------------------
+# Factory
+# ---------------------------------------------------------------------------
+
+
+def create_app(routes: Iterable[str] = ALL_ROUTES, lazy: bool | None = None) -> FastAPI:
+    """Build the API serving the given app.routes modules."""
+    app = FastAPI(title="Jumns API", docs_url=None, redoc_url=None)
+
+    # CORS — allow Flutter app from any origin (restrict in production)
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_methods=["*"],
+        allow_headers=["*"],
+        # Conditional GET / ?since= polling (app.routes.conditional) and
+        # message history paging (app.routes.messages)
+        expose_headers=["ETag", "X-Delta", "X-Sync-Time", "X-Next-Cursor"],
+    )
+    # brotli / gzip for JSON bodies over COMPRESS_MIN_BYTES (deployed
+    # stages leave it to API Gateway)
+    if os.getenv("COMPRESS_RESPONSES", "1") != "0":
+        app.add_middleware(CompressionMiddleware)
+
+    loader = RouteLoader(app, routes)
+    app.state.route_loader = loader
+    app.add_middleware(_RouteLoaderMiddleware, loader=loader)
+
+    # Auth middleware — validates Cognito JWT, sets request.state.user_id
+    app.add_middleware(CognitoAuthMiddleware)
+    app.middleware("http")(flush_push)
+    app.middleware("http")(trace_requests)
+
+    for exc_class, handler in _EXCEPTION_HANDLERS:
+        app.add_exception_handler(exc_class, handler)
+
+    # Health check (unauthenticated)
+    app.get("/health")(health_check)
+
+    if lazy is None:
+        lazy = os.getenv("LAZY_ROUTES", "1") != "0"
+    if not lazy:
+        loader.load_all()
+    return app
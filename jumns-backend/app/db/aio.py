@@ -0,0 +1,412 @@
+"""Async DynamoDB access — coroutine repositories for fan-out reads.
+
+AsyncBaseRepository has BaseRepository's operations as coroutines, so
+independent reads (goals + tasks + reminders for one user) can run under
+asyncio.gather, and async route handlers stop blocking the event loop.
+It sits on an async table chosen by DYNAMODB_ASYNC:
+
+    thread  (default) the boto3 Table's calls run on a thread pool sized
+            to the connection pool (connection.MAX_POOL_CONNECTIONS)
+    native  an aiobotocore client on one background event loop shared by
+            the process; callers on any loop await it without a thread
+            per request. Falls back to ``thread`` when aiobotocore is not
+            installed.
+
+Both tables take and return the same shapes as a boto3 Table (Key/Attr
+conditions, Decimal numbers), so repository code is identical either way.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import logging
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from botocore.exceptions import BotoCoreError, ClientError
+
+from app.db.base_repository import (
+    _query_kwargs,
+    _update_error,
+    _update_kwargs,
+    _user_query_kwargs,
+    touch_collection,
+    utc_now_iso,
+)
+from app.db.connection import MAX_POOL_CONNECTIONS, client_config, get_table
+from app.exceptions import ResourceNotFoundError
+
+logger = logging.getLogger(__name__)
+
+ASYNC_BACKEND = os.getenv("DYNAMODB_ASYNC", "thread")
+
+
+# ---------------------------------------------------------------------------
+# thread: boto3 Table on a bounded pool
+# ---------------------------------------------------------------------------
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def _thread_pool() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=MAX_POOL_CONNECTIONS, thread_name_prefix="dynamodb",
+                )
+    return _executor
+
+
+class _ThreadedTable:
+    """Awaitable boto3 Table calls, run on the DynamoDB thread pool."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    async def _call(self, operation: str, **kwargs) -> dict[str, Any]:
+        # The Table is looked up per call so reset_connection() applies
+        method = getattr(get_table(self.name), operation)
+        ctx = contextvars.copy_context()  # keeps the trace parent
+        return await asyncio.get_running_loop().run_in_executor(
+            _thread_pool(), ctx.run, functools.partial(method, **kwargs),
+        )
+
+    async def get_item(self, **kwargs):
+        return await self._call("get_item", **kwargs)
+
+    async def put_item(self, **kwargs):
+        return await self._call("put_item", **kwargs)
+
+    async def query(self, **kwargs):
+        return await self._call("query", **kwargs)
+
+    async def scan(self, **kwargs):
+        return await self._call("scan", **kwargs)
+
+    async def update_item(self, **kwargs):
+        return await self._call("update_item", **kwargs)
+
+    async def delete_item(self, **kwargs):
+        return await self._call("delete_item", **kwargs)
+
+
+# ---------------------------------------------------------------------------
+# native: aiobotocore on a background loop
+# ---------------------------------------------------------------------------
+
+
+class _IoLoop:
+    """One event loop thread owning the process's aiobotocore client.
+
+    aiobotocore clients are bound to the loop that created them, and
+    callers arrive on many loops (the API's, and a fresh one per agent
+    run), so all calls are marshalled onto this loop instead.
+    """
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(
+            target=self.loop.run_forever, name="dynamodb-io", daemon=True,
+        ).start()
+        self.client = asyncio.run_coroutine_threadsafe(self._open(), self.loop).result()
+
+    async def _open(self):
+        from aiobotocore.config import AioConfig
+        from aiobotocore.session import get_session
+
+        from app.tracing import instrument_boto_client
+
+        config = client_config()
+        kwargs: dict = {
+            "config": AioConfig(
+                retries=config.retries,
+                max_pool_connections=config.max_pool_connections,
+                connect_timeout=config.connect_timeout,
+                read_timeout=config.read_timeout,
+                connector_args={"keepalive_timeout": 60},
+            ),
+        }
+        endpoint = os.getenv("DYNAMODB_ENDPOINT")
+        if endpoint:
+            kwargs["endpoint_url"] = endpoint
+        client = await get_session().create_client("dynamodb", **kwargs).__aenter__()
+        instrument_boto_client(client)
+        return client
+
+    def submit(self, operation: str, params: dict) -> Future:
+        """Start ``operation`` on the IO loop in the caller's context."""
+        ctx = contextvars.copy_context()
+        result: Future = Future()
+
+        def done(task: asyncio.Task) -> None:
+            if task.cancelled():
+                result.cancel()
+            elif task.exception() is not None:
+                result.set_exception(task.exception())
+            else:
+                result.set_result(task.result())
+
+        def start() -> None:
+            coro = getattr(self.client, operation)(**params)
+            self.loop.create_task(coro, context=ctx).add_done_callback(done)
+
+        self.loop.call_soon_threadsafe(start)
+        return result
+
+
+_io: _IoLoop | None = None
+_io_lock = threading.Lock()
+
+
+def _io_loop() -> _IoLoop:
+    global _io
+    if _io is None:
+        with _io_lock:
+            if _io is None:
+                _io = _IoLoop()
+    return _io
+
+
+def _to_client_params(table_name: str, params: dict) -> dict:
+    """boto3 Table parameters -> low-level client parameters."""
+    from boto3.dynamodb.conditions import ConditionExpressionBuilder
+    from boto3.dynamodb.types import TypeSerializer
+
+    serializer = TypeSerializer()
+    params = dict(params, TableName=table_name)
+    names = dict(params.pop("ExpressionAttributeNames", {}))
+    values = dict(params.pop("ExpressionAttributeValues", {}))
+    builder = ConditionExpressionBuilder()
+    for field, is_key in (
+        ("KeyConditionExpression", True),
+        ("FilterExpression", False),
+        ("ConditionExpression", False),
+    ):
+        condition = params.get(field)
+        if condition is not None and not isinstance(condition, str):
+            built = builder.build_expression(condition, is_key_condition=is_key)
+            params[field] = built.condition_expression
+            names.update(built.attribute_name_placeholders)
+            values.update(built.attribute_value_placeholders)
+    if names:
+        params["ExpressionAttributeNames"] = names
+    if values:
+        params["ExpressionAttributeValues"] = {
+            k: serializer.serialize(v) for k, v in values.items()
+        }
+    for field in ("Key", "Item", "ExclusiveStartKey"):
+        if field in params:
+            params[field] = {k: serializer.serialize(v) for k, v in params[field].items()}
+    return params
+
+
+def _from_client_response(response: dict) -> dict:
+    """Low-level client response -> boto3 Table response shapes."""
+    from boto3.dynamodb.types import TypeDeserializer
+
+    deserializer = TypeDeserializer()
+
+    def plain(item: dict) -> dict:
+        return {k: deserializer.deserialize(v) for k, v in item.items()}
+
+    for field in ("Item", "Attributes", "LastEvaluatedKey"):
+        if field in response:
+            response[field] = plain(response[field])
+    if "Items" in response:
+        response["Items"] = [plain(item) for item in response["Items"]]
+    return response
+
+
+class _AioTable:
+    """Awaitable Table calls over the shared aiobotocore client."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    async def _call(self, operation: str, **kwargs) -> dict[str, Any]:
+        params = _to_client_params(self.name, kwargs)
+        response = await asyncio.wrap_future(_io_loop().submit(operation, params))
+        return _from_client_response(response)
+
+    async def get_item(self, **kwargs):
+        return await self._call("get_item", **kwargs)
+
+    async def put_item(self, **kwargs):
+        return await self._call("put_item", **kwargs)
+
+    async def query(self, **kwargs):
+        return await self._call("query", **kwargs)
+
+    async def scan(self, **kwargs):
+        return await self._call("scan", **kwargs)
+
+    async def update_item(self, **kwargs):
+        return await self._call("update_item", **kwargs)
+
+    async def delete_item(self, **kwargs):
+        return await self._call("delete_item", **kwargs)
+
+
+def _native_available() -> bool:
+    try:
+        import aiobotocore  # noqa: F401
+    except ImportError:
+        logger.warning("DYNAMODB_ASYNC=native but aiobotocore is missing; using threads")
+        return False
+    return True
+
+
+def get_async_table(table_name: str):
+    """The async table for ``table_name`` under the configured backend."""
+    if ASYNC_BACKEND == "native" and _native_available():
+        return _AioTable(table_name)
+    return _ThreadedTable(table_name)
+
+
+# ---------------------------------------------------------------------------
+# Repository base
+# ---------------------------------------------------------------------------
+
+
+class AsyncBaseRepository:
+    """BaseRepository's operations as coroutines, over an async table."""
+
+    collection: str | None = None  # see BaseRepository
+
+    def __init__(self, table):
+        self._table = table
+
+    async def _changed(self, records, deleted: bool = False) -> None:
+        if self.collection:
+            await asyncio.get_running_loop().run_in_executor(
+                _thread_pool(), touch_collection, self.collection, records, deleted,
+            )
+
+    # -- write ---------------------------------------------------------------
+
+    async def put_item(self, item: dict[str, Any]) -> dict[str, Any]:
+        try:
+            await self._table.put_item(Item=item)
+        except (ClientError, BotoCoreError) as exc:
+            raise RuntimeError(f"DynamoDB put_item failed: {exc}") from exc
+        await self._changed([item])
+        return item
+
+    # -- read ----------------------------------------------------------------
+
+    async def get_item(self, key: dict[str, Any]) -> dict[str, Any]:
+        try:
+            resp = await self._table.get_item(Key=key)
+        except (ClientError, BotoCoreError) as exc:
+            raise RuntimeError(f"DynamoDB get_item failed: {exc}") from exc
+        item = resp.get("Item")
+        if not item:
+            raise ResourceNotFoundError()
+        return item
+
+    async def query_by_user(
+        self,
+        user_id: str,
+        *,
+        scan_forward: bool = True,
+        limit: int | None = None,
+        filter_expression=None,
+        index_name: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Query items by userId partition key."""
+        kwargs = _user_query_kwargs(
+            user_id, scan_forward, limit, filter_expression, index_name,
+        )
+        try:
+            resp = await self._table.query(**kwargs)
+            return resp.get("Items", [])
+        except (ClientError, BotoCoreError) as exc:
+            raise RuntimeError(f"DynamoDB query failed: {exc}") from exc
+
+    async def query_all(
+        self,
+        key_condition,
+        *,
+        index_name: str | None = None,
+        filter_expression=None,
+        scan_forward: bool = True,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Query with an arbitrary key condition, following LastEvaluatedKey."""
+        kwargs = _query_kwargs(
+            key_condition, index_name, filter_expression, scan_forward, limit,
+        )
+        items: list[dict[str, Any]] = []
+        try:
+            while True:
+                resp = await self._table.query(**kwargs)
+                items.extend(resp.get("Items", []))
+                if limit and len(items) >= limit:
+                    return items[:limit]
+                last_key = resp.get("LastEvaluatedKey")
+                if not last_key:
+                    return items
+                kwargs["ExclusiveStartKey"] = last_key
+        except (ClientError, BotoCoreError) as exc:
+            raise RuntimeError(f"DynamoDB query failed: {exc}") from exc
+
+    async def scan_all(self, filter_expression=None) -> list[dict[str, Any]]:
+        """Full-table scan following LastEvaluatedKey (fallback paths only)."""
+        kwargs: dict[str, Any] = {}
+        if filter_expression is not None:
+            kwargs["FilterExpression"] = filter_expression
+        items: list[dict[str, Any]] = []
+        try:
+            while True:
+                resp = await self._table.scan(**kwargs)
+                items.extend(resp.get("Items", []))
+                last_key = resp.get("LastEvaluatedKey")
+                if not last_key:
+                    return items
+                kwargs["ExclusiveStartKey"] = last_key
+        except (ClientError, BotoCoreError) as exc:
+            raise RuntimeError(f"DynamoDB scan failed: {exc}") from exc
+
+    # -- update --------------------------------------------------------------
+
+    async def update_item(
+        self,
+        key: dict[str, Any],
+        updates: dict[str, Any],
+        remove: list[str] | None = None,
+        *,
+        increments: dict[str, int | float] | None = None,
+        expected_version: int | None = None,
+        expected: dict[str, Any] | None = None,
+        must_exist: bool = False,
+    ) -> dict[str, Any]:
+        """See BaseRepository.update_item."""
+        if not updates and not remove and not increments:
+            return await self.get_item(key)
+        if self.collection:
+            updates = {**updates, "updatedAt": utc_now_iso()}
+        kwargs = _update_kwargs(
+            key, updates, remove, increments, expected_version, must_exist, expected,
+        )
+        try:
+            resp = await self._table.update_item(**kwargs)
+        except (ClientError, BotoCoreError) as exc:
+            raise _update_error(exc, must_exist) from exc
+        await self._changed([key])
+        return resp.get("Attributes", {})
+
+    # -- delete --------------------------------------------------------------
+
+    async def delete_item(self, key: dict[str, Any]) -> None:
+        try:
+            await self._table.delete_item(Key=key)
+        except (ClientError, BotoCoreError) as exc:
+            raise RuntimeError(f"DynamoDB delete_item failed: {exc}") from exc
+        await self._changed([key], deleted=True)
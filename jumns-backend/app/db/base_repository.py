@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import logging
 import uuid
 from datetime import datetime, timezone
 from typing import Any
 
 from botocore.exceptions import BotoCoreError, ClientError
 
-from app.exceptions import ResourceNotFoundError
+from app.exceptions import ConcurrentModificationError, ResourceNotFoundError
+
+logger = logging.getLogger(__name__)
 
 
 def new_id() -> str:
@@ -21,20 +24,65 @@ def utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+class LazyInstance:
+    """Module-level repository or service, constructed on first use.
+
+    ``_goals_repo = LazyInstance(get_goals_repo)`` keeps importing a
+    module free of boto3 setup; the instance (and its DynamoDB resource)
+    is resolved by the first attribute access.
+    """
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._instance = None
+
+    def __getattr__(self, name: str):
+        if self._instance is None:
+            self._instance = self._factory()
+        return getattr(self._instance, name)
+
+
 class BaseRepository:
-    """Thin wrapper around a DynamoDB table with common operations."""
+    """Thin wrapper around a DynamoDB table with common operations.
+
+    Repositories of a per-user collection the app polls set ``collection``:
+    every write then bumps that user's collection version (for ETags) and
+    updates stamp ``updatedAt`` (for ?since= deltas).
+    """
+
+    collection: str | None = None
 
     def __init__(self, table):
         self._table = table
 
+    def _changed(self, records, deleted: bool = False) -> None:
+        if self.collection:
+            touch_collection(self.collection, records, deleted)
+
     # -- write ---------------------------------------------------------------
 
     def put_item(self, item: dict[str, Any]) -> dict[str, Any]:
         try:
             self._table.put_item(Item=item)
-            return item
         except (ClientError, BotoCoreError) as exc:
             raise RuntimeError(f"DynamoDB put_item failed: {exc}") from exc
+        self._changed([item])
+        return item
+
+    def batch_put(self, items: list[dict[str, Any]]) -> int:
+        """Write many items with BatchWriteItem (25 per request).
+
+        The batch writer resends unprocessed items. Items are written as
+        given — no versioning or conditions. Returns the number written.
+        """
+        try:
+            with self._table.batch_writer() as batch:
+                for item in items:
+                    batch.put_item(Item=item)
+        except (ClientError, BotoCoreError) as exc:
+            raise RuntimeError(f"DynamoDB batch_write_item failed: {exc}") from exc
+        self._changed(items)
+        return len(items)
 
     # -- read ----------------------------------------------------------------
 
@@ -58,56 +106,132 @@ class BaseRepository:
         index_name: str | None = None,
     ) -> list[dict[str, Any]]:
         """Query items by userId partition key."""
-        from boto3.dynamodb.conditions import Key
-
-        kwargs: dict[str, Any] = {
-            "KeyConditionExpression": Key("userId").eq(user_id),
-            "ScanIndexForward": scan_forward,
-        }
-        if limit:
-            kwargs["Limit"] = limit
-        if filter_expression:
-            kwargs["FilterExpression"] = filter_expression
-        if index_name:
-            kwargs["IndexName"] = index_name
+        kwargs = _user_query_kwargs(
+            user_id, scan_forward, limit, filter_expression, index_name,
+        )
         try:
             resp = self._table.query(**kwargs)
             return resp.get("Items", [])
         except (ClientError, BotoCoreError) as exc:
             raise RuntimeError(f"DynamoDB query failed: {exc}") from exc
 
+    def query_all(
+        self,
+        key_condition,
+        *,
+        index_name: str | None = None,
+        filter_expression=None,
+        scan_forward: bool = True,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Query with an arbitrary key condition, following LastEvaluatedKey.
+
+        Stops paging once ``limit`` items have been collected.
+        """
+        kwargs = _query_kwargs(
+            key_condition, index_name, filter_expression, scan_forward, limit,
+        )
+
+        items: list[dict[str, Any]] = []
+        try:
+            while True:
+                resp = self._table.query(**kwargs)
+                items.extend(resp.get("Items", []))
+                if limit and len(items) >= limit:
+                    return items[:limit]
+                last_key = resp.get("LastEvaluatedKey")
+                if not last_key:
+                    return items
+                kwargs["ExclusiveStartKey"] = last_key
+        except (ClientError, BotoCoreError) as exc:
+            raise RuntimeError(f"DynamoDB query failed: {exc}") from exc
+
+    def scan_all(self, filter_expression=None) -> list[dict[str, Any]]:
+        """Full-table scan following LastEvaluatedKey (fallback paths only)."""
+        kwargs: dict[str, Any] = {}
+        if filter_expression is not None:
+            kwargs["FilterExpression"] = filter_expression
+        items: list[dict[str, Any]] = []
+        try:
+            while True:
+                resp = self._table.scan(**kwargs)
+                items.extend(resp.get("Items", []))
+                last_key = resp.get("LastEvaluatedKey")
+                if not last_key:
+                    return items
+                kwargs["ExclusiveStartKey"] = last_key
+        except (ClientError, BotoCoreError) as exc:
+            raise RuntimeError(f"DynamoDB scan failed: {exc}") from exc
+
+    def batch_get(self, keys: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Fetch many items by key with BatchGetItem (100 keys per request).
+
+        Unprocessed keys are retried; missing items are simply absent from
+        the result, which is in no particular order.
+        """
+        from app.db.connection import get_dynamodb_resource
+
+        resource = get_dynamodb_resource()
+        name = self._table.name
+        items: list[dict[str, Any]] = []
+        try:
+            for start in range(0, len(keys), 100):
+                request = {name: {"Keys": keys[start:start + 100]}}
+                while request:
+                    resp = resource.batch_get_item(RequestItems=request)
+                    items.extend(resp.get("Responses", {}).get(name, []))
+                    request = resp.get("UnprocessedKeys") or None
+        except (ClientError, BotoCoreError) as exc:
+            raise RuntimeError(f"DynamoDB batch_get_item failed: {exc}") from exc
+        return items
+
     # -- update --------------------------------------------------------------
 
     def update_item(
         self,
         key: dict[str, Any],
         updates: dict[str, Any],
+        remove: list[str] | None = None,
+        *,
+        increments: dict[str, int | float] | None = None,
+        expected_version: int | None = None,
+        expected: dict[str, Any] | None = None,
+        must_exist: bool = False,
     ) -> dict[str, Any]:
-        """Update specific attributes on an item. Returns the updated item."""
-        if not updates:
-            return self.get_item(key)
+        """Update specific attributes on an item. Returns the updated item.
 
-        expr_parts = []
-        names: dict[str, str] = {}
-        values: dict[str, Any] = {}
-        for i, (attr, val) in enumerate(updates.items()):
-            placeholder = f"#a{i}"
-            value_key = f":v{i}"
-            expr_parts.append(f"{placeholder} = {value_key}")
-            names[placeholder] = attr
-            values[value_key] = val
+        Every update bumps the item's ``version`` attribute.
 
+        Args:
+            key: Primary key of the item.
+            updates: Attributes to SET.
+            remove: Attributes to REMOVE — needed for GSI key attributes,
+                which DynamoDB rejects as empty strings.
+            increments: Numeric attributes to change with an atomic ADD,
+                e.g. ``{"snoozeCount": 1}``. No prior read is needed.
+            expected_version: Only apply if the stored ``version`` still
+                matches (items written before versioning count as 0).
+                Raises ConcurrentModificationError otherwise.
+            expected: Only apply if each attribute has the given value,
+                e.g. ``{"active": True}``; ConcurrentModificationError
+                otherwise.
+            must_exist: Raise ResourceNotFoundError instead of creating
+                the item when it does not exist.
+        """
+        if not updates and not remove and not increments:
+            return self.get_item(key)
+        if self.collection:
+            updates = {**updates, "updatedAt": utc_now_iso()}
+
+        kwargs = _update_kwargs(
+            key, updates, remove, increments, expected_version, must_exist, expected,
+        )
         try:
-            resp = self._table.update_item(
-                Key=key,
-                UpdateExpression="SET " + ", ".join(expr_parts),
-                ExpressionAttributeNames=names,
-                ExpressionAttributeValues=values,
-                ReturnValues="ALL_NEW",
-            )
-            return resp.get("Attributes", {})
+            resp = self._table.update_item(**kwargs)
         except (ClientError, BotoCoreError) as exc:
-            raise RuntimeError(f"DynamoDB update_item failed: {exc}") from exc
+            raise _update_error(exc, must_exist) from exc
+        self._changed([key])
+        return resp.get("Attributes", {})
 
     # -- delete --------------------------------------------------------------
 
@@ -116,6 +240,7 @@ class BaseRepository:
             self._table.delete_item(Key=key)
         except (ClientError, BotoCoreError) as exc:
             raise RuntimeError(f"DynamoDB delete_item failed: {exc}") from exc
+        self._changed([key], deleted=True)
 
     def batch_delete(self, keys: list[dict[str, Any]]) -> None:
         """Delete multiple items using batch_writer (handles pagination)."""
@@ -125,3 +250,183 @@ class BaseRepository:
                     batch.delete_item(Key=key)
         except (ClientError, BotoCoreError) as exc:
             raise RuntimeError(f"DynamoDB batch_delete failed: {exc}") from exc
+        self._changed(keys, deleted=True)
+
+
+# ---------------------------------------------------------------------------
+# Collection versions
+# ---------------------------------------------------------------------------
+
+
+def touch_collection(collection: str, records, deleted: bool = False) -> None:
+    """Bump each owner's version of ``collection`` and push the change.
+
+    ``records`` are the written items or keys. Runs after the write it
+    reports. A failed bump raises RuntimeError once every owner has been
+    tried: the write stands, but an unchanged version would answer the
+    next conditional GET with a 304 that hides it, so the caller must see
+    the failure (and retry) rather than succeed.
+    """
+    from app import push
+    from app.dependencies import get_usage_repo
+
+    usage = get_usage_repo()
+    ids_by_user: dict[str, list[str]] = {}
+    for record in records:
+        ids_by_user.setdefault(record["userId"], []).append(_record_id(record))
+    failure = None
+    for user_id, ids in ids_by_user.items():
+        try:
+            version = usage.touch_collection(user_id, collection, deleted)
+        except (ClientError, BotoCoreError) as exc:
+            logger.exception("Could not bump %s version for %s", collection, user_id)
+            failure, version = exc, None
+        push.publish(user_id, push.change_event(collection, ids, version))
+    if failure is not None:
+        raise RuntimeError(
+            f"DynamoDB {collection} version bump failed: {failure}"
+        ) from failure
+
+
+def _record_id(record: dict[str, Any]) -> str:
+    """The client-facing id of an item, or of a key (sort key, after any '#')."""
+    if "id" in record:
+        return record["id"]
+    sort_value = next(v for k, v in record.items() if k != "userId")
+    return str(sort_value).rsplit("#", 1)[-1]
+
+
+def changed_since(since: str):
+    """Filter for items created or updated after ``since`` (ISO, UTC)."""
+    from boto3.dynamodb.conditions import Attr
+
+    return Attr("updatedAt").gt(since) | Attr("createdAt").gt(since)
+
+
+# ---------------------------------------------------------------------------
+# Request builders — shared with the async repositories (app.db.aio)
+# ---------------------------------------------------------------------------
+
+
+def _user_query_kwargs(
+    user_id: str,
+    scan_forward: bool,
+    limit: int | None,
+    filter_expression,
+    index_name: str | None,
+) -> dict[str, Any]:
+    from boto3.dynamodb.conditions import Key
+
+    kwargs: dict[str, Any] = {
+        "KeyConditionExpression": Key("userId").eq(user_id),
+        "ScanIndexForward": scan_forward,
+    }
+    if limit:
+        kwargs["Limit"] = limit
+    if filter_expression:
+        kwargs["FilterExpression"] = filter_expression
+    if index_name:
+        kwargs["IndexName"] = index_name
+    return kwargs
+
+
+def _query_kwargs(
+    key_condition,
+    index_name: str | None,
+    filter_expression,
+    scan_forward: bool,
+    limit: int | None,
+) -> dict[str, Any]:
+    kwargs: dict[str, Any] = {
+        "KeyConditionExpression": key_condition,
+        "ScanIndexForward": scan_forward,
+    }
+    if filter_expression is not None:
+        kwargs["FilterExpression"] = filter_expression
+    if index_name:
+        kwargs["IndexName"] = index_name
+    if limit:
+        kwargs["Limit"] = limit
+    return kwargs
+
+
+def _update_kwargs(
+    key: dict[str, Any],
+    updates: dict[str, Any],
+    remove: list[str] | None,
+    increments: dict[str, int | float] | None,
+    expected_version: int | None,
+    must_exist: bool,
+    expected: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """UpdateItem parameters for BaseRepository.update_item."""
+    expr_parts = []
+    names: dict[str, str] = {"#ver": "version"}
+    values: dict[str, Any] = {":one": 1}
+    for i, (attr, val) in enumerate(updates.items()):
+        placeholder = f"#a{i}"
+        value_key = f":v{i}"
+        expr_parts.append(f"{placeholder} = {value_key}")
+        names[placeholder] = attr
+        values[value_key] = val
+
+    add_parts = ["#ver :one"]
+    for i, (attr, delta) in enumerate((increments or {}).items()):
+        placeholder = f"#n{i}"
+        value_key = f":n{i}"
+        add_parts.append(f"{placeholder} {value_key}")
+        names[placeholder] = attr
+        values[value_key] = delta
+
+    remove_parts = []
+    for i, attr in enumerate(remove or []):
+        placeholder = f"#r{i}"
+        remove_parts.append(placeholder)
+        names[placeholder] = attr
+
+    expression = ""
+    if expr_parts:
+        expression = "SET " + ", ".join(expr_parts)
+    expression += " ADD " + ", ".join(add_parts)
+    if remove_parts:
+        expression += " REMOVE " + ", ".join(remove_parts)
+
+    conditions = []
+    if must_exist:
+        pk = next(iter(key))
+        names["#pk"] = pk
+        conditions.append("attribute_exists(#pk)")
+    if expected_version is not None:
+        values[":ev"] = expected_version
+        if expected_version == 0:
+            conditions.append("(attribute_not_exists(#ver) OR #ver = :ev)")
+        else:
+            conditions.append("#ver = :ev")
+    for i, (attr, val) in enumerate((expected or {}).items()):
+        names[f"#e{i}"] = attr
+        values[f":e{i}"] = val
+        conditions.append(f"#e{i} = :e{i}")
+
+    kwargs: dict[str, Any] = {
+        "Key": key,
+        "UpdateExpression": expression.strip(),
+        "ExpressionAttributeNames": names,
+        "ExpressionAttributeValues": values,
+        "ReturnValues": "ALL_NEW",
+    }
+    if conditions:
+        kwargs["ConditionExpression"] = " AND ".join(conditions)
+        kwargs["ReturnValuesOnConditionCheckFailure"] = "ALL_OLD"
+    return kwargs
+
+
+def _update_error(exc: Exception, must_exist: bool) -> Exception:
+    """The repository error for a failed UpdateItem."""
+    if isinstance(exc, ClientError) and (
+        exc.response["Error"]["Code"] == "ConditionalCheckFailedException"
+    ):
+        # ALL_OLD tells the two conditions apart: no item → missing
+        if not exc.response.get("Item") and must_exist:
+            return ResourceNotFoundError()
+        return ConcurrentModificationError()
+    return RuntimeError(f"DynamoDB update_item failed: {exc}")
@@ -1,28 +1,71 @@
-"""Boto3 DynamoDB resource — cached across Lambda invocations."""
+"""Boto3 DynamoDB resource — cached across Lambda invocations.
+
+One resource (and one connection pool) per process; Table objects are
+cached per name so repositories share them. The botocore config keeps
+connections alive between invocations and sizes the pool for the
+thread pools that fan out over it (scheduler sweeps, batch loads).
+"""
 
 from __future__ import annotations
 
 import os
+import threading
 
 import boto3
 from botocore.config import Config
 
+from app.tracing import instrument_boto_client
+
+# Pool size — at least the widest ThreadPoolExecutor sharing the resource
+MAX_POOL_CONNECTIONS = int(os.getenv("DYNAMODB_MAX_POOL_CONNECTIONS", "50"))
+
 _resource = None
+_tables: dict[str, object] = {}
+_lock = threading.Lock()
+
+
+def client_config() -> Config:
+    """Botocore config shared by the DynamoDB resource."""
+    return Config(
+        retries={"max_attempts": 3, "mode": "adaptive"},
+        max_pool_connections=MAX_POOL_CONNECTIONS,
+        tcp_keepalive=True,
+        connect_timeout=float(os.getenv("DYNAMODB_CONNECT_TIMEOUT", "2")),
+        read_timeout=float(os.getenv("DYNAMODB_READ_TIMEOUT", "10")),
+    )
 
 
 def get_dynamodb_resource():
     """Return a cached boto3 DynamoDB resource."""
     global _resource
     if _resource is None:
-        endpoint = os.getenv("DYNAMODB_ENDPOINT")  # for local/moto testing
-        config = Config(retries={"max_attempts": 3, "mode": "adaptive"})
-        kwargs: dict = {"config": config}
-        if endpoint:
-            kwargs["endpoint_url"] = endpoint
-        _resource = boto3.resource("dynamodb", **kwargs)
+        with _lock:
+            if _resource is None:
+                endpoint = os.getenv("DYNAMODB_ENDPOINT")  # for local/moto testing
+                kwargs: dict = {"config": client_config()}
+                if endpoint:
+                    kwargs["endpoint_url"] = endpoint
+                resource = boto3.resource("dynamodb", **kwargs)
+                instrument_boto_client(resource.meta.client)
+                _resource = resource
     return _resource
 
 
 def get_table(table_name: str):
-    """Return a DynamoDB Table object."""
-    return get_dynamodb_resource().Table(table_name)
+    """Return the cached DynamoDB Table object for ``table_name``."""
+    table = _tables.get(table_name)
+    if table is None:
+        table = _tables.setdefault(table_name, get_dynamodb_resource().Table(table_name))
+    return table
+
+
+def reset_connection() -> None:
+    """Drop the cached resource and tables (tests, endpoint changes).
+
+    Repositories built on the old tables are cached in app.dependencies;
+    call app.dependencies.reset_instances() as well.
+    """
+    global _resource
+    with _lock:
+        _resource = None
+        _tables.clear()
@@ -0,0 +1,95 @@
+"""Create the Jumns tables on DynamoDB Local or moto.
+
+Mirrors infra/infra_constructs/database.py so local runs exercise the same
+key schemas and GSIs as the deployed stack.
+
+Usage:
+    DYNAMODB_ENDPOINT=http://localhost:8000 python -m app.db.local_tables
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from app.db import table_config as tc
+
+
+def _attr(name: str) -> dict[str, str]:
+    return {"AttributeName": name, "AttributeType": "S"}
+
+
+def _keys(pk: str, sk: str | None = None) -> list[dict[str, str]]:
+    schema = [{"AttributeName": pk, "KeyType": "HASH"}]
+    if sk:
+        schema.append({"AttributeName": sk, "KeyType": "RANGE"})
+    return schema
+
+
+def _gsi(name: str, pk: str, sk: str | None) -> dict[str, Any]:
+    return {
+        "IndexName": name,
+        "KeySchema": _keys(pk, sk),
+        "Projection": {"ProjectionType": "ALL"},
+    }
+
+
+# table name -> (partition key, sort key, [(gsi name, gsi pk, gsi sk)])
+TABLE_SCHEMAS: dict[
+    str, tuple[str, str | None, list[tuple[str, str, str | None]]]
+] = {
+    tc.USERS_TABLE: ("userId", None, [
+        (tc.USERS_BY_SLOT_GSI, "morningSlotUtc", "eveningSlotUtc"),
+    ]),
+    tc.MESSAGES_TABLE: ("userId", "createdAt#msgId", [
+        (tc.MESSAGES_BY_TYPE_GSI, "userId", "cardKey"),
+    ]),
+    tc.GOALS_TABLE: ("userId", "goalId", []),
+    tc.TASKS_TABLE: ("userId", "taskId", [
+        (tc.TASKS_BY_GOAL_GSI, "userId", "goalId"),
+        (tc.TASKS_BY_DUE_DATE_GSI, "userId", "dueDate"),
+    ]),
+    tc.REMINDERS_TABLE: ("userId", "reminderId", [
+        (tc.DUE_REMINDERS_GSI, "fireShard", "nextFireAt"),
+    ]),
+    tc.SKILLS_TABLE: ("userId", "skillId", []),
+    tc.INSIGHTS_TABLE: ("userId", "createdAt#insightId", []),
+    tc.ACCESS_CODES_TABLE: ("code", None, [
+        (tc.ACCESS_CODES_BY_USER_GSI, "usedBy", None),
+    ]),
+    tc.USAGE_TABLE: ("userId", "usageKey", []),
+    tc.CRON_JOBS_TABLE: ("userId", "jobId", [
+        (tc.DUE_JOBS_GSI, "fireShard", "nextRunAt"),
+    ]),
+}
+
+
+def create_tables(resource=None) -> list[str]:
+    """Create any missing tables. Returns the names of tables created."""
+    if resource is None:
+        from app.db.connection import get_dynamodb_resource
+
+        resource = get_dynamodb_resource()
+
+    existing = {t.name for t in resource.tables.all()}
+    created = []
+    for name, (pk, sk, gsis) in TABLE_SCHEMAS.items():
+        if name in existing:
+            continue
+        attrs = {pk, *([sk] if sk else [])}
+        for _, gsi_pk, gsi_sk in gsis:
+            attrs.update(a for a in (gsi_pk, gsi_sk) if a)
+        kwargs: dict[str, Any] = {
+            "TableName": name,
+            "KeySchema": _keys(pk, sk),
+            "AttributeDefinitions": [_attr(a) for a in sorted(attrs)],
+            "BillingMode": "PAY_PER_REQUEST",
+        }
+        if gsis:
+            kwargs["GlobalSecondaryIndexes"] = [_gsi(*g) for g in gsis]
+        resource.create_table(**kwargs).wait_until_exists()
+        created.append(name)
+    return created
+
+
+if __name__ == "__main__":
+    print("Created:", ", ".join(create_tables()) or "nothing (all tables exist)")
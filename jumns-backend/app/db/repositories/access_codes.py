@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+from boto3.dynamodb.conditions import Attr, Key
 from botocore.exceptions import ClientError
 
 from app.db.base_repository import BaseRepository, utc_now_iso
 from app.db.connection import get_table
-from app.db.table_config import ACCESS_CODES_TABLE
+from app.db.table_config import ACCESS_CODES_BY_USER_GSI, ACCESS_CODES_TABLE
 
 
 class AccessCodesRepository(BaseRepository):
@@ -32,13 +33,32 @@ class AccessCodesRepository(BaseRepository):
             raise
 
     def get_activation_status(self, user_id: str) -> bool:
-        """Check if this user has activated any access code."""
+        """Check if this user has activated any access code.
+
+        Uses the sparse CodesByUser GSI (PK: usedBy) — a single-item Query
+        instead of a table scan.
+        """
         try:
-            resp = self._table.scan(
-                FilterExpression="usedBy = :uid",
-                ExpressionAttributeValues={":uid": user_id},
+            resp = self._table.query(
+                IndexName=ACCESS_CODES_BY_USER_GSI,
+                KeyConditionExpression=Key("usedBy").eq(user_id),
                 Limit=1,
             )
             return len(resp.get("Items", [])) > 0
+        except Exception:
+            return self._scan_activation_status(user_id)
+
+    def _scan_activation_status(self, user_id: str) -> bool:
+        """Fallback if the GSI is not available: paginated filtered scan."""
+        kwargs = {"FilterExpression": Attr("usedBy").eq(user_id)}
+        try:
+            while True:
+                resp = self._table.scan(**kwargs)
+                if resp.get("Items"):
+                    return True
+                last_key = resp.get("LastEvaluatedKey")
+                if not last_key:
+                    return False
+                kwargs["ExclusiveStartKey"] = last_key
         except Exception:
             return False
@@ -0,0 +1,183 @@
+"""Repository for jumns-cron-jobs table.
+
+Jobs are user-defined scheduled prompts (see app.scheduling.cron for the
+schedule formats). Enabled jobs with a pending run carry ``nextRunAt`` and
+appear in the sparse DueJobs GSI under their ``fireShard``.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from boto3.dynamodb.conditions import Attr, Key
+
+from app.db.base_repository import BaseRepository, new_id, utc_now_iso
+from app.db.connection import get_table
+from app.db.table_config import CRON_JOBS_TABLE, DUE_JOBS_GSI, fire_shard
+from app.exceptions import ConcurrentModificationError
+from app.scheduling.cron import (
+    MIN_RUN_INTERVAL,
+    compute_next_run,
+    next_run_after,
+    validate_schedule,
+)
+from app.scheduling.recurrence import fire_key
+
+_EDITABLE = (
+    "name", "description", "enabled", "scheduleType", "scheduleValue",
+    "actionMessage", "timezone",
+)
+
+
+def _next_run_key(job: dict, after: datetime, *, ran: bool = False) -> str | None:
+    """nextRunAt for a job, or None when disabled or finished.
+
+    ``ran`` means the job runs at ``after``, so the next run keeps
+    MIN_RUN_INTERVAL from it. Raises ValueError for a malformed schedule.
+    """
+    next_run = (next_run_after if ran else compute_next_run)(
+        job["scheduleType"], job.get("scheduleValue", ""), after,
+        job.get("timezone", "UTC"),
+    )
+    if not job.get("enabled", True) or next_run is None:
+        return None
+    return fire_key(next_run)
+
+
+class CronJobsRepository(BaseRepository):
+    def __init__(self):
+        super().__init__(get_table(CRON_JOBS_TABLE))
+
+    def create(self, user_id: str, data: dict) -> dict:
+        """Create a job.
+
+        Raises ValueError for a malformed schedule or one with no run ahead.
+        """
+        job_id = new_id()
+        now = utc_now_iso()
+        item = {
+            "userId": user_id,
+            "jobId": job_id,
+            "id": job_id,
+            "name": data.get("name") or "Untitled Job",
+            "description": data.get("description", ""),
+            "enabled": data.get("enabled", True),
+            "scheduleType": data.get("scheduleType", "daily"),
+            "scheduleValue": data.get("scheduleValue", "08:00"),
+            "actionMessage": data.get("actionMessage", ""),
+            "timezone": data.get("timezone", "UTC"),
+            "runCount": 0,
+            "fireShard": fire_shard(user_id),
+            "createdAt": now,
+            "updatedAt": now,
+        }
+        after = datetime.now(timezone.utc)
+        validate_schedule(
+            item["scheduleType"], item["scheduleValue"], item["timezone"], after,
+        )
+        item["nextRunAt"] = _next_run_key(item, after)
+        item = {k: v for k, v in item.items() if v is not None}
+        return self.put_item(item)
+
+    def get(self, user_id: str, job_id: str) -> dict:
+        return self.get_item({"userId": user_id, "jobId": job_id})
+
+    def list_all(self, user_id: str, include_disabled: bool = True) -> list[dict]:
+        jobs = self.query_by_user(user_id)
+        if not include_disabled:
+            jobs = [j for j in jobs if j.get("enabled", True)]
+        return jobs
+
+    def list_due(self, shard: int | str, now: datetime) -> list[dict]:
+        """Jobs in one fireShard whose nextRunAt is at or before now."""
+        cutoff = fire_key(now)
+        try:
+            return self.query_all(
+                Key("fireShard").eq(str(shard)) & Key("nextRunAt").lte(cutoff),
+                index_name=DUE_JOBS_GSI,
+            )
+        except Exception:
+            # Fallback: scan if GSI not available
+            return self.scan_all(
+                Attr("fireShard").eq(str(shard)) & Attr("nextRunAt").lte(cutoff),
+            )
+
+    def update(self, user_id: str, job_id: str, data: dict) -> dict:
+        """Update fields and recompute nextRunAt.
+
+        Raises ValueError for a malformed schedule or one with no run ahead.
+        """
+        current = self.get(user_id, job_id)
+        updates = {k: v for k, v in data.items() if k in _EDITABLE and v is not None}
+        updates["updatedAt"] = utc_now_iso()
+        merged = {**current, **updates}
+        now = datetime.now(timezone.utc)
+        # A finished job may still be renamed; a new schedule or turning
+        # the job back on needs a run ahead
+        rescheduled = bool({"scheduleType", "scheduleValue", "timezone"} & updates.keys())
+        if rescheduled or (updates.get("enabled") and not current.get("enabled", True)):
+            validate_schedule(
+                merged["scheduleType"], merged.get("scheduleValue", ""),
+                merged.get("timezone", "UTC"), now,
+            )
+        next_run = _next_run_key(merged, now)
+        remove = []
+        if next_run:
+            updates["nextRunAt"] = next_run
+        else:
+            remove.append("nextRunAt")
+        return self.update_item(
+            {"userId": user_id, "jobId": job_id}, updates, remove=remove,
+            expected_version=int(current.get("version", 0)),
+        )
+
+    def claim(self, job: dict, now: datetime) -> dict | None:
+        """Claim a due job: count the run and advance nextRunAt.
+
+        The next run is at least MIN_RUN_INTERVAL after this one.
+        Conditional on the job's version, so concurrent dispatchers run it
+        once. Returns the updated item, or None if another writer won.
+        """
+        updates: dict = {"lastRunAt": utc_now_iso(), "lastStatus": "running"}
+        remove = []
+        try:
+            next_run = _next_run_key(job, now, ran=True)
+        except ValueError:
+            next_run = None
+        if next_run:
+            updates["nextRunAt"] = next_run
+        else:
+            remove.append("nextRunAt")
+        try:
+            return self.update_item(
+                {"userId": job["userId"], "jobId": job["jobId"]},
+                updates,
+                remove=remove,
+                increments={"runCount": 1},
+                expected_version=int(job.get("version", 0)),
+            )
+        except ConcurrentModificationError:
+            return None
+
+    def record_status(self, user_id: str, job_id: str, status: str) -> None:
+        self.update_item(
+            {"userId": user_id, "jobId": job_id}, {"lastStatus": status},
+            must_exist=True,
+        )
+
+    def run_now(self, user_id: str, job_id: str) -> dict:
+        """Make a job due now, or MIN_RUN_INTERVAL after its last run if
+        that is later; the dispatcher runs it on the tick after that."""
+        current = self.get(user_id, job_id)
+        due = datetime.now(timezone.utc)
+        if current.get("lastRunAt"):
+            last_run = datetime.fromisoformat(current["lastRunAt"].replace("Z", "+00:00"))
+            due = max(due, last_run + MIN_RUN_INTERVAL)
+        return self.update_item(
+            {"userId": user_id, "jobId": job_id},
+            {"nextRunAt": fire_key(due)},
+            must_exist=True,
+        )
+
+    def delete(self, user_id: str, job_id: str) -> None:
+        self.delete_item({"userId": user_id, "jobId": job_id})
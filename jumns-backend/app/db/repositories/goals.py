@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-from app.db.base_repository import BaseRepository, new_id, utc_now_iso
+from app.db.aio import AsyncBaseRepository, get_async_table
+from app.db.base_repository import BaseRepository, changed_since, new_id, utc_now_iso
 from app.db.connection import get_table
 from app.db.table_config import GOALS_TABLE
 
 
 class GoalsRepository(BaseRepository):
+    collection = "goals"
+
     def __init__(self):
         super().__init__(get_table(GOALS_TABLE))
 
@@ -35,11 +38,42 @@ class GoalsRepository(BaseRepository):
     def list_all(self, user_id: str) -> list[dict]:
         return self.query_by_user(user_id)
 
-    def update(self, user_id: str, goal_id: str, data: dict) -> dict:
+    def update(
+        self,
+        user_id: str,
+        goal_id: str,
+        data: dict,
+        progress_increment: int | None = None,
+    ) -> dict:
+        """Update goal fields; progress_increment is applied with atomic ADD."""
         updates = {k: v for k, v in data.items() if v is not None}
+        increments = {}
+        if progress_increment is not None and "progress" not in updates:
+            increments["progress"] = progress_increment
         return self.update_item(
-            {"userId": user_id, "goalId": goal_id}, updates
+            {"userId": user_id, "goalId": goal_id},
+            updates,
+            increments=increments,
+            must_exist=bool(increments),
         )
 
     def delete(self, user_id: str, goal_id: str) -> None:
         self.delete_item({"userId": user_id, "goalId": goal_id})
+
+
+class AsyncGoalsRepository(AsyncBaseRepository):
+    """Read side of GoalsRepository for async handlers and tools."""
+
+    collection = "goals"
+
+    def __init__(self):
+        super().__init__(get_async_table(GOALS_TABLE))
+
+    async def get(self, user_id: str, goal_id: str) -> dict:
+        return await self.get_item({"userId": user_id, "goalId": goal_id})
+
+    async def list_all(self, user_id: str, since: str | None = None) -> list[dict]:
+        """All goals, or only those created or updated after ``since``."""
+        return await self.query_by_user(
+            user_id, filter_expression=changed_since(since) if since else None,
+        )
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+from boto3.dynamodb.conditions import Key
+
 from app.db.base_repository import BaseRepository, new_id, utc_now_iso
 from app.db.connection import get_table
 from app.db.table_config import INSIGHTS_TABLE
 
 
 class InsightsRepository(BaseRepository):
+    collection = "insights"
+
     def __init__(self):
         super().__init__(get_table(INSIGHTS_TABLE))
 
@@ -27,5 +31,11 @@ class InsightsRepository(BaseRepository):
         item = {k: v for k, v in item.items() if v is not None}
         return self.put_item(item)
 
-    def list_all(self, user_id: str) -> list[dict]:
+    def list_all(self, user_id: str, since: str | None = None) -> list[dict]:
+        """Newest first; with ``since``, only insights created after it."""
+        if since:
+            return self.query_all(
+                Key("userId").eq(user_id) & Key("createdAt#insightId").gt(since),
+                scan_forward=False,
+            )
         return self.query_by_user(user_id, scan_forward=False)
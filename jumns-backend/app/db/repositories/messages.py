@@ -1,13 +1,24 @@
-"""Repository for jumns-messages table."""
+"""Repository for jumns-messages table.
+
+Messages are keyed by userId and a ``createdAt#msgId`` sort key, so
+history pages are ranges on it: the sort key of a page's oldest message
+is the cursor for the page before it.
+"""
 
 from __future__ import annotations
 
+from boto3.dynamodb.conditions import Attr, Key
+
+from app import push
 from app.db.base_repository import BaseRepository, new_id, utc_now_iso
 from app.db.connection import get_table
-from app.db.table_config import MESSAGES_TABLE
+from app.db.table_config import MESSAGES_BY_TYPE_GSI, MESSAGES_TABLE
+from app.exceptions import ResourceNotFoundError
 
 
 class MessagesRepository(BaseRepository):
+    collection = "messages"
+
     def __init__(self):
         super().__init__(get_table(MESSAGES_TABLE))
 
@@ -24,12 +35,23 @@ class MessagesRepository(BaseRepository):
             "content": data.get("content"),
             "cardType": data.get("cardType"),
             "cardData": self._sanitize_card_data(data.get("cardData")),
+            # Set on scheduler-generated messages (briefings, reminders, ...)
+            "proactive": data.get("proactive") or None,
+            "proactiveType": data.get("proactiveType"),
+            "cronJobId": data.get("cronJobId"),
             "timestamp": now,
             "createdAt": now,
         }
+        if item["cardType"]:
+            # MessagesByType GSI sort key — only card messages are indexed
+            item["cardKey"] = f"{item['cardType']}#{now}"
         # Remove None values and empty strings (DynamoDB doesn't like them)
         item = {k: v for k, v in item.items() if v is not None}
-        return self.put_item(item)
+        self.put_item(item)
+        if item.get("proactive"):
+            # Briefings, reminders, cron results: shown without a re-poll
+            push.publish(user_id, push.card_event(item))
+        return item
 
     @staticmethod
     def _sanitize_card_data(card_data) -> dict | None:
@@ -57,28 +79,113 @@ class MessagesRepository(BaseRepository):
 
         return _clean(card_data)
 
-    def list_messages(self, user_id: str) -> list[dict]:
-        """Return all messages for a user in chronological order."""
-        return self.query_by_user(user_id, scan_forward=True)
+    def get_message(
+        self, user_id: str, message_id: str, created_at: str | None = None,
+    ) -> dict:
+        """One message by id; ``created_at`` makes it a GetItem."""
+        if created_at:
+            return self.get_item(
+                {"userId": user_id, "createdAt#msgId": f"{created_at}#{message_id}"}
+            )
+        # Fallback: filter the partition when the client lacks createdAt
+        items = self.query_all(
+            Key("userId").eq(user_id), filter_expression=Attr("id").eq(message_id),
+        )
+        if not items:
+            raise ResourceNotFoundError("Message")
+        return items[0]
+
+    def list_messages(
+        self,
+        user_id: str,
+        since: str | None = None,
+        before: str | None = None,
+        limit: int | None = None,
+    ) -> list[dict]:
+        """Return a user's messages in chronological order.
+
+        With ``since``, only messages created after it; with ``before`` (a
+        sort key cursor), only those before it; with ``limit``, only the
+        newest ``limit`` of those. All are ranges on the createdAt#msgId
+        sort key, so messages outside them are not read at all.
+        """
+        if limit:
+            return self.list_page(user_id, limit, since=since, before=before)[0]
+        items = self.query_all(self._range(user_id, since, before))
+        return [i for i in items if i["createdAt#msgId"] not in (since, before)]
 
-    def count_user_messages_today(self, user_id: str, date_prefix: str) -> int:
-        """Count user-role messages sent today (for rate limiting)."""
-        from boto3.dynamodb.conditions import Attr, Key
+    def list_page(
+        self,
+        user_id: str,
+        limit: int,
+        since: str | None = None,
+        before: str | None = None,
+    ) -> tuple[list[dict], str | None]:
+        """The newest ``limit`` messages in range, oldest first, and the
+        cursor for the page before them (None on the last page).
 
+        One extra message is read to tell whether an older page exists.
+        """
+        # between() is inclusive, so its two end points may come back too
+        extra = 2 if since and before else 1
+        items = self.query_all(
+            self._range(user_id, since, before), scan_forward=False, limit=limit + extra,
+        )
+        items = [i for i in items if i["createdAt#msgId"] not in (since, before)]
+        page = items[:limit]
+        page.reverse()
+        cursor = page[0]["createdAt#msgId"] if len(items) > limit else None
+        return page, cursor
+
+    @staticmethod
+    def _range(user_id: str, since: str | None, before: str | None):
+        sort_key = Key("createdAt#msgId")
+        key = Key("userId").eq(user_id)
+        if since and before:
+            return key & sort_key.between(since, before)
+        if since:
+            return key & sort_key.gt(since)
+        if before:
+            return key & sort_key.lt(before)
+        return key
+
+    def list_cards(
+        self,
+        user_id: str,
+        card_type: str | None = None,
+        limit: int | None = None,
+        since: str | None = None,
+    ) -> list[dict]:
+        """Return card messages, newest first, via the MessagesByType GSI.
+
+        With card_type, only cards of that type (e.g. "daily_briefing");
+        with since, only cards created after it.
+        """
+        key = Key("userId").eq(user_id)
+        if card_type:
+            key = key & Key("cardKey").begins_with(f"{card_type}#")
+        filter_expression = Attr("createdAt").gt(since) if since else None
         try:
-            resp = self._table.query(
-                KeyConditionExpression=Key("userId").eq(user_id)
-                & Key("createdAt#msgId").begins_with(date_prefix),
-                FilterExpression=Attr("role").eq("user"),
-                Select="COUNT",
+            return self.query_all(
+                key,
+                index_name=MESSAGES_BY_TYPE_GSI,
+                filter_expression=filter_expression,
+                scan_forward=False,
+                limit=limit,
             )
-            return resp.get("Count", 0)
         except Exception:
-            return 0
+            # Fallback: filter client-side if GSI not available
+            items = [
+                i for i in self.query_all(Key("userId").eq(user_id), scan_forward=False)
+                if i.get("cardType")
+                and (not card_type or i["cardType"] == card_type)
+                and (not since or i.get("createdAt", "") > since)
+            ]
+            return items[:limit] if limit else items
 
     def delete_all_messages(self, user_id: str) -> None:
         """Delete all messages for a user (paginated batch delete)."""
-        items = self.query_by_user(user_id)
+        items = self.query_all(Key("userId").eq(user_id))
         keys = [
             {"userId": item["userId"], "createdAt#msgId": item["createdAt#msgId"]}
             for item in items
@@ -1,20 +1,38 @@
-"""Repository for jumns-reminders table."""
+"""Repository for jumns-reminders table.
+
+Free-text times are parsed on write into a ``recurrence`` map with a
+``nextFireAt`` (see app.scheduling.recurrence). Active, scheduled reminders
+appear in the sparse DueReminders GSI under their ``fireShard``.
+"""
 
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
 
-from app.db.base_repository import BaseRepository, new_id, utc_now_iso
+from boto3.dynamodb.conditions import Attr, Key
+
+from app.db.aio import AsyncBaseRepository, get_async_table
+from app.db.base_repository import BaseRepository, changed_since, new_id, utc_now_iso
 from app.db.connection import get_table
-from app.db.table_config import REMINDERS_TABLE
+from app.db.table_config import (
+    DUE_REMINDERS_GSI,
+    REMINDERS_TABLE,
+    fire_shard,
+)
+from app.exceptions import ConcurrentModificationError, ResourceNotFoundError
+from app.scheduling.recurrence import fire_key, next_fire_at, parse_schedule
 
 
 class RemindersRepository(BaseRepository):
+    collection = "reminders"
+
     def __init__(self):
         super().__init__(get_table(REMINDERS_TABLE))
 
-    def create(self, user_id: str, data: dict) -> dict:
+    def create(self, user_id: str, data: dict, settings: dict | None = None) -> dict:
+        """Create a reminder; ``settings`` supplies timezone and default times."""
         reminder_id = new_id()
+        now = utc_now_iso()
         item = {
             "userId": user_id,
             "reminderId": reminder_id,
@@ -26,7 +44,9 @@ class RemindersRepository(BaseRepository):
             "snoozeCount": 0,
             "snoozedUntil": None,
             "originalTime": data.get("time", ""),
-            "createdAt": utc_now_iso(),
+            "createdAt": now,
+            "fireShard": fire_shard(user_id),
+            **self._schedule(user_id, data.get("time", ""), settings),
         }
         item = {k: v for k, v in item.items() if v is not None}
         return self.put_item(item)
@@ -37,37 +57,224 @@ class RemindersRepository(BaseRepository):
     def list_all(self, user_id: str) -> list[dict]:
         return self.query_by_user(user_id)
 
-    def update(self, user_id: str, reminder_id: str, data: dict) -> dict:
-        updates = {k: v for k, v in data.items() if v is not None}
-        return self.update_item(
-            {"userId": user_id, "reminderId": reminder_id}, updates
+    def list_active_reminders(self, user_id: str) -> list[dict]:
+        """Active reminders only: the user's partition, filtered on active.
+
+        A user has few reminders, so this needs no index of its own.
+        """
+        return self.query_all(
+            Key("userId").eq(user_id), filter_expression=Attr("active").eq(True),
         )
 
+    def list_due(self, shard: int | str, now: datetime) -> list[dict]:
+        """Reminders in one fireShard whose nextFireAt is at or before now."""
+        cutoff = fire_key(now)
+        try:
+            return self.query_all(
+                Key("fireShard").eq(str(shard)) & Key("nextFireAt").lte(cutoff),
+                index_name=DUE_REMINDERS_GSI,
+            )
+        except Exception:
+            # Fallback: scan if GSI not available
+            return self.scan_all(
+                Attr("fireShard").eq(str(shard)) & Attr("nextFireAt").lte(cutoff),
+            )
+
+    def update(
+        self, user_id: str, reminder_id: str, data: dict,
+        settings: dict | None = None,
+    ) -> dict:
+        updates = {k: v for k, v in data.items() if v is not None}
+        remove = []
+        key = {"userId": user_id, "reminderId": reminder_id}
+        # Keep the sparse DueReminders index in step
+        if updates.get("active") is False:
+            remove.append("nextFireAt")
+        else:
+            if "time" in updates:
+                schedule = self._schedule(user_id, updates["time"], settings)
+                if schedule:
+                    updates.update(schedule)
+                    updates["fireShard"] = fire_shard(user_id)
+                else:
+                    remove += ["recurrence", "nextFireAt"]
+            elif updates.get("active") is True:
+                next_fire = next_fire_at(
+                    self.get_item(key).get("recurrence"), datetime.now(timezone.utc),
+                )
+                if next_fire:
+                    updates["nextFireAt"] = fire_key(next_fire)
+                    updates["fireShard"] = fire_shard(user_id)
+        if "nextFireAt" in updates and updates.get("active") is not True:
+            return self._update_if_active(key, updates, remove)
+        return self.update_item(key, updates, remove=remove, must_exist=True)
+
+    def _update_if_active(
+        self, key: dict, updates: dict, remove: list[str], **kwargs,
+    ) -> dict:
+        """Apply an update that sets nextFireAt, scheduling only if active.
+
+        A paused reminder takes the rest of the update but no nextFireAt,
+        so it stays out of the DueReminders index until it is resumed.
+        """
+        try:
+            return self.update_item(
+                key, updates, remove=remove,
+                expected={"active": True}, must_exist=True, **kwargs,
+            )
+        except ConcurrentModificationError:
+            updates = {k: v for k, v in updates.items() if k != "nextFireAt"}
+            return self.update_item(
+                key, updates, remove=[*remove, "nextFireAt"], must_exist=True, **kwargs,
+            )
+
+    def advance(self, reminder: dict, fired_at: datetime) -> dict | None:
+        """Claim a due reminder and move nextFireAt to its next occurrence.
+
+        Conditional on the reminder's version and on it still being
+        active, so concurrent dispatchers fire it once and a reminder paused
+        meanwhile not at all. A snoozed occurrence restores the original
+        time text; a one-off reminder is deactivated after it fires.
+        Returns the updated item, or None if it was not claimed.
+        """
+        updates: dict = {"lastFiredAt": fire_key(fired_at)}
+        remove = ["snoozedUntil"]
+        if reminder.get("snoozedUntil"):
+            updates["time"] = reminder.get("originalTime", reminder.get("time", ""))
+
+        next_fire = next_fire_at(reminder.get("recurrence"), fired_at)
+        if next_fire:
+            updates["nextFireAt"] = fire_key(next_fire)
+        else:
+            updates["active"] = False
+            remove.append("nextFireAt")
+        try:
+            return self.update_item(
+                {"userId": reminder["userId"], "reminderId": reminder["reminderId"]},
+                updates,
+                remove=remove,
+                expected_version=int(reminder.get("version", 0)),
+                expected={"active": True},
+                must_exist=True,
+            )
+        except (ConcurrentModificationError, ResourceNotFoundError):
+            return None
+
+    def unadvance(self, reminder: dict, claimed: dict) -> bool:
+        """Undo advance() when the occurrence could not be delivered.
+
+        Restores the fields advance() changed from ``reminder`` (as read
+        before the claim), so the next tick fires the occurrence again.
+        Conditional on the claim's version: a reminder edited meanwhile
+        keeps the edit. Returns whether it was restored.
+        """
+        fields = ("nextFireAt", "active", "time", "snoozedUntil", "lastFiredAt")
+        try:
+            self.update_item(
+                {"userId": reminder["userId"], "reminderId": reminder["reminderId"]},
+                {f: reminder[f] for f in fields if f in reminder},
+                remove=[f for f in fields if f not in reminder],
+                expected_version=int(claimed.get("version", 0)),
+                must_exist=True,
+            )
+            return True
+        except (ConcurrentModificationError, ResourceNotFoundError):
+            return False
+
+    def reschedule_all(self, user_id: str, settings: dict) -> int:
+        """Re-parse every reminder after a timezone or default-time change."""
+        count = 0
+        for r in self.list_all(user_id):
+            snoozed = bool(r.get("snoozedUntil"))
+            text = r.get("originalTime", "") if snoozed else r.get("time", "")
+            schedule = self._schedule(user_id, text, settings)
+            updates = {"fireShard": fire_shard(user_id)}
+            remove = []
+            if "recurrence" in schedule:
+                updates["recurrence"] = schedule["recurrence"]
+            else:
+                remove.append("recurrence")
+            # A pending snooze keeps its own fire time
+            if not snoozed:
+                if r.get("active", True) and "nextFireAt" in schedule:
+                    updates["nextFireAt"] = schedule["nextFireAt"]
+                else:
+                    remove.append("nextFireAt")
+            self.update_item(
+                {"userId": user_id, "reminderId": r["reminderId"]},
+                updates,
+                remove=remove,
+            )
+            count += 1
+        return count
+
+    @staticmethod
+    def _schedule(user_id: str, text: str, settings: dict | None) -> dict:
+        """recurrence + nextFireAt for a free-text time ({} if unparseable)."""
+        if settings is None:
+            from app.dependencies import get_users_repo
+
+            settings = get_users_repo().get_settings(user_id)
+        now = datetime.now(timezone.utc)
+        recurrence = parse_schedule(text, settings, now)
+        if not recurrence:
+            return {}
+        fields: dict = {"recurrence": recurrence}
+        next_fire = next_fire_at(recurrence, now)
+        if next_fire:
+            fields["nextFireAt"] = fire_key(next_fire)
+        return fields
+
     def snooze(self, user_id: str, reminder_id: str, minutes: int = 30) -> dict:
         """Snooze a reminder by pushing its time forward.
 
-        Increments snoozeCount, sets snoozedUntil to now + minutes,
-        and updates the time field with the new schedule.
+        Increments snoozeCount with an atomic ADD (no prior read), sets
+        snoozedUntil and nextFireAt to now + minutes, and updates the time
+        field with the new schedule. originalTime was fixed at creation.
+        A paused reminder records the snooze but is not scheduled.
         """
-        current = self.get(user_id, reminder_id)
-        snooze_count = current.get("snoozeCount", 0) + 1
         now = datetime.now(timezone.utc)
-        snoozed_until = (now + timedelta(minutes=minutes)).isoformat()
+        new_time_dt = now + timedelta(minutes=minutes)
 
         # Build a human-readable snoozed time
-        new_time_dt = now + timedelta(minutes=minutes)
         new_time_str = new_time_dt.strftime("%I:%M %p").lstrip("0")
         today_str = new_time_dt.strftime("%b %d")
 
         updates = {
-            "snoozeCount": snooze_count,
-            "snoozedUntil": snoozed_until,
+            "snoozedUntil": new_time_dt.isoformat(),
             "time": f"Snoozed to {new_time_str}, {today_str}",
-            "originalTime": current.get("originalTime", current.get("time", "")),
+            "nextFireAt": fire_key(new_time_dt),
+            "fireShard": fire_shard(user_id),
         }
-        return self.update_item(
-            {"userId": user_id, "reminderId": reminder_id}, updates
+        return self._update_if_active(
+            {"userId": user_id, "reminderId": reminder_id},
+            updates,
+            [],
+            increments={"snoozeCount": 1},
         )
 
     def delete(self, user_id: str, reminder_id: str) -> None:
         self.delete_item({"userId": user_id, "reminderId": reminder_id})
+
+
+class AsyncRemindersRepository(AsyncBaseRepository):
+    """Read side of RemindersRepository for async handlers and tools."""
+
+    collection = "reminders"
+
+    def __init__(self):
+        super().__init__(get_async_table(REMINDERS_TABLE))
+
+    async def get(self, user_id: str, reminder_id: str) -> dict:
+        return await self.get_item({"userId": user_id, "reminderId": reminder_id})
+
+    async def list_all(self, user_id: str, since: str | None = None) -> list[dict]:
+        """All reminders, or only those created or updated after ``since``."""
+        return await self.query_by_user(
+            user_id, filter_expression=changed_since(since) if since else None,
+        )
+
+    async def list_active_reminders(self, user_id: str) -> list[dict]:
+        return await self.query_all(
+            Key("userId").eq(user_id), filter_expression=Attr("active").eq(True),
+        )
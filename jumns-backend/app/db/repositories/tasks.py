@@ -4,12 +4,19 @@ from __future__ import annotations
 
 from boto3.dynamodb.conditions import Attr, Key
 
-from app.db.base_repository import BaseRepository, new_id, utc_now_iso
+from app.db.aio import AsyncBaseRepository, get_async_table
+from app.db.base_repository import BaseRepository, changed_since, new_id, utc_now_iso
 from app.db.connection import get_table
-from app.db.table_config import TASKS_BY_GOAL_GSI, TASKS_TABLE
+from app.db.table_config import (
+    TASKS_BY_DUE_DATE_GSI,
+    TASKS_BY_GOAL_GSI,
+    TASKS_TABLE,
+)
 
 
 class TasksRepository(BaseRepository):
+    collection = "tasks"
+
     def __init__(self):
         super().__init__(get_table(TASKS_TABLE))
 
@@ -28,7 +35,8 @@ class TasksRepository(BaseRepository):
             "goalId": data.get("goalId"),
             "priority": data.get("priority", "medium"),
             "requiresProof": data.get("requiresProof", False),
-            "dueDate": data.get("dueDate"),
+            # Empty strings are not valid GSI keys — omit instead
+            "dueDate": data.get("dueDate") or None,
             "proofUrl": None,
             "proofType": None,
             "proofStatus": "pending",
@@ -60,10 +68,75 @@ class TasksRepository(BaseRepository):
             items = self.query_by_user(user_id)
             return [i for i in items if i.get("goalId") == goal_id]
 
-    def update(self, user_id: str, task_id: str, data: dict) -> dict:
+    def list_due_between(self, user_id: str, start: str, end: str) -> list[dict]:
+        """Tasks with start <= dueDate <= end (ISO dates), via TasksByDueDate."""
+        try:
+            return self.query_all(
+                Key("userId").eq(user_id) & Key("dueDate").between(start, end),
+                index_name=TASKS_BY_DUE_DATE_GSI,
+            )
+        except Exception:
+            # Fallback: filter client-side if GSI not available
+            items = self.query_by_user(user_id)
+            return [
+                i for i in items
+                if i.get("dueDate") and start <= i["dueDate"] <= end
+            ]
+
+    def list_overdue(
+        self,
+        user_id: str,
+        before: str,
+        pending_only: bool = True,
+        goal_id: str | None = None,
+    ) -> list[dict]:
+        """Tasks with dueDate < before, via TasksByDueDate.
+
+        Completed tasks are dropped server-side unless pending_only=False.
+        """
+        filter_expression = None
+        if pending_only:
+            filter_expression = Attr("completed").ne(True)
+        if goal_id:
+            goal_filter = Attr("goalId").eq(goal_id)
+            filter_expression = (
+                goal_filter if filter_expression is None
+                else filter_expression & goal_filter
+            )
+        try:
+            return self.query_all(
+                Key("userId").eq(user_id) & Key("dueDate").lt(before),
+                index_name=TASKS_BY_DUE_DATE_GSI,
+                filter_expression=filter_expression,
+            )
+        except Exception:
+            # Fallback: filter client-side if GSI not available
+            items = self.query_by_user(user_id)
+            return [
+                i for i in items
+                if i.get("dueDate") and i["dueDate"] < before
+                and not (pending_only and i.get("completed"))
+                and (not goal_id or i.get("goalId") == goal_id)
+            ]
+
+    def update(
+        self,
+        user_id: str,
+        task_id: str,
+        data: dict,
+        expected_version: int | None = None,
+    ) -> dict:
         updates = {k: v for k, v in data.items() if v is not None}
+        remove = []
+        if updates.get("dueDate") == "":
+            # Clearing the due date drops the task from TasksByDueDate
+            del updates["dueDate"]
+            remove.append("dueDate")
         return self.update_item(
-            {"userId": user_id, "taskId": task_id}, updates
+            {"userId": user_id, "taskId": task_id},
+            updates,
+            remove=remove,
+            expected_version=expected_version,
         )
 
     def complete(self, user_id: str, task_id: str, data: dict) -> dict:
@@ -82,3 +155,54 @@ class TasksRepository(BaseRepository):
 
     def delete(self, user_id: str, task_id: str) -> None:
         self.delete_item({"userId": user_id, "taskId": task_id})
+
+
+class AsyncTasksRepository(AsyncBaseRepository):
+    """Read side of TasksRepository for async handlers and tools."""
+
+    collection = "tasks"
+
+    def __init__(self):
+        super().__init__(get_async_table(TASKS_TABLE))
+
+    async def get(self, user_id: str, task_id: str) -> dict:
+        return await self.get_item({"userId": user_id, "taskId": task_id})
+
+    async def list_all(
+        self, user_id: str, goal_id: str | None = None, since: str | None = None,
+    ) -> list[dict]:
+        """All tasks (of one goal), or only those changed after ``since``."""
+        filter_expression = changed_since(since) if since else None
+        if goal_id:
+            return await self._list_by_goal(user_id, goal_id, filter_expression)
+        return await self.query_by_user(user_id, filter_expression=filter_expression)
+
+    async def _list_by_goal(
+        self, user_id: str, goal_id: str, filter_expression=None,
+    ) -> list[dict]:
+        try:
+            return await self.query_all(
+                Key("userId").eq(user_id) & Key("goalId").eq(goal_id),
+                index_name=TASKS_BY_GOAL_GSI,
+                filter_expression=filter_expression,
+            )
+        except Exception:
+            # Fallback: filter client-side if GSI not available
+            items = await self.query_by_user(
+                user_id, filter_expression=filter_expression,
+            )
+            return [i for i in items if i.get("goalId") == goal_id]
+
+    async def list_due_between(self, user_id: str, start: str, end: str) -> list[dict]:
+        try:
+            return await self.query_all(
+                Key("userId").eq(user_id) & Key("dueDate").between(start, end),
+                index_name=TASKS_BY_DUE_DATE_GSI,
+            )
+        except Exception:
+            # Fallback: filter client-side if GSI not available
+            items = await self.query_by_user(user_id)
+            return [
+                i for i in items
+                if i.get("dueDate") and start <= i["dueDate"] <= end
+            ]
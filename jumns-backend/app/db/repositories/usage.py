@@ -0,0 +1,269 @@
+"""Repository for jumns-usage table — per-user counters, scheduler delivery
+keys, leases and push connections, all expiring via TTL, and the per-user
+collection versions behind conditional GETs (which do not expire).
+"""
+
+from __future__ import annotations
+
+import os
+import time
+
+from boto3.dynamodb.conditions import Key
+from botocore.exceptions import ClientError
+
+from app.db.base_repository import BaseRepository, utc_now_iso
+from app.db.connection import get_table
+from app.db.table_config import USAGE_TABLE
+
+# Counter items outlive their day by one more, then DynamoDB TTL reaps them
+_COUNTER_TTL_SECONDS = 2 * 24 * 3600
+
+# usageKey of the item holding a user's collection versions
+_COLLECTIONS_KEY = "collections"
+
+# API Gateway closes WebSocket connections after two hours at most
+_PUSH_CONNECTION_TTL_SECONDS = 2 * 3600 + 600
+
+# Agent usage counters are kept for reporting
+_AGENT_USAGE_TTL_SECONDS = int(os.getenv("AGENT_USAGE_RETENTION_DAYS", "90")) * 24 * 3600
+
+
+class UsageRepository(BaseRepository):
+    def __init__(self):
+        super().__init__(get_table(USAGE_TABLE))
+
+    def increment_daily_messages(
+        self, user_id: str, day: str, limit: int,
+    ) -> int | None:
+        """Atomically take one message from today's allowance.
+
+        Returns the new count, or None if the limit was already reached.
+        The condition and ADD run in a single UpdateItem, so concurrent
+        requests can never push the counter past ``limit``.
+        """
+        try:
+            resp = self._table.update_item(
+                Key={"userId": user_id, "usageKey": f"messages#{day}"},
+                UpdateExpression="ADD #c :one SET expiresAt = if_not_exists(expiresAt, :ttl)",
+                ConditionExpression="attribute_not_exists(#c) OR #c < :limit",
+                ExpressionAttributeNames={"#c": "count"},
+                ExpressionAttributeValues={
+                    ":one": 1,
+                    ":limit": limit,
+                    ":ttl": int(time.time()) + _COUNTER_TTL_SECONDS,
+                },
+                ReturnValues="UPDATED_NEW",
+            )
+            return int(resp["Attributes"]["count"])
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                return None  # limit reached
+            raise
+
+    def refund_daily_message(self, user_id: str, day: str) -> None:
+        """Give back one message, e.g. when the agent call failed."""
+        self._table.update_item(
+            Key={"userId": user_id, "usageKey": f"messages#{day}"},
+            UpdateExpression="ADD #c :minus",
+            ConditionExpression="#c > :zero",
+            ExpressionAttributeNames={"#c": "count"},
+            ExpressionAttributeValues={":minus": -1, ":zero": 0},
+        )
+
+    # -- agent usage accounting ------------------------------------------------
+
+    def record_agent_usage(self, user_id: str, day: str, counters: dict[str, int]) -> None:
+        """ADD a turn's counters to the user's day and to the day's roll-up.
+
+        Two items per (user, day): agent#<day> under the user, for history,
+        and agent#<userId> under the day#<day> partition, so a day's users
+        can be listed with one query.
+        """
+        names = {f"#c{i}": k for i, k in enumerate(counters)}
+        values: dict = {f":c{i}": v for i, v in enumerate(counters.values())}
+        values[":ttl"] = int(time.time()) + _AGENT_USAGE_TTL_SECONDS
+        add = ", ".join(f"#c{i} :c{i}" for i in range(len(counters)))
+        for key, owner in (
+            ({"userId": user_id, "usageKey": f"agent#{day}"}, None),
+            ({"userId": f"day#{day}", "usageKey": f"agent#{user_id}"}, user_id),
+        ):
+            expression = f"ADD {add} SET expiresAt = if_not_exists(expiresAt, :ttl), #day = :day"
+            item_values = {**values, ":day": day}
+            item_names = {**names, "#day": "day"}
+            if owner:
+                expression += ", #owner = :owner"
+                item_values[":owner"] = owner
+                item_names["#owner"] = "forUser"
+            self._table.update_item(
+                Key=key,
+                UpdateExpression=expression,
+                ExpressionAttributeNames=item_names,
+                ExpressionAttributeValues=item_values,
+            )
+
+    def list_agent_usage(self, user_id: str, start_day: str, end_day: str) -> list[dict]:
+        """A user's daily usage items for start_day..end_day (ISO dates)."""
+        return self.query_all(
+            Key("userId").eq(user_id)
+            & Key("usageKey").between(f"agent#{start_day}", f"agent#{end_day}"),
+        )
+
+    def list_agent_usage_for_day(self, day: str) -> list[dict]:
+        """Every user's usage item for one day."""
+        return self.query_all(
+            Key("userId").eq(f"day#{day}") & Key("usageKey").begins_with("agent#"),
+        )
+
+    # -- scheduler delivery keys and leases ------------------------------------
+
+    def claim_key(self, user_id: str, key: str, ttl_seconds: int) -> bool:
+        """Record ``key`` once. Returns False if it was already recorded."""
+        try:
+            self._table.put_item(
+                Item={
+                    "userId": user_id,
+                    "usageKey": key,
+                    "createdAt": int(time.time()),
+                    "expiresAt": int(time.time()) + ttl_seconds,
+                },
+                ConditionExpression="attribute_not_exists(usageKey)",
+            )
+            return True
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                return False
+            raise
+
+    def release_key(self, user_id: str, key: str) -> None:
+        self._table.delete_item(Key={"userId": user_id, "usageKey": key})
+
+    def acquire_lease(
+        self, user_id: str, name: str, owner: str, seconds: int,
+    ) -> bool:
+        """Take (or extend) a lease unless another owner holds an unexpired one."""
+        now = int(time.time())
+        try:
+            self._table.update_item(
+                Key={"userId": user_id, "usageKey": f"lease#{name}"},
+                UpdateExpression="SET leaseOwner = :owner, leaseUntil = :until, expiresAt = :ttl",
+                ConditionExpression=(
+                    "attribute_not_exists(leaseOwner) OR leaseOwner = :owner "
+                    "OR leaseUntil < :now"
+                ),
+                ExpressionAttributeValues={
+                    ":owner": owner,
+                    ":until": now + seconds,
+                    ":now": now,
+                    # Expired leases are reaped by TTL a day later
+                    ":ttl": now + seconds + 24 * 3600,
+                },
+            )
+            return True
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                return False
+            raise
+
+    def release_lease(self, user_id: str, name: str, owner: str) -> None:
+        """Drop a lease if ``owner`` still holds it."""
+        try:
+            self._table.delete_item(
+                Key={"userId": user_id, "usageKey": f"lease#{name}"},
+                ConditionExpression="leaseOwner = :owner",
+                ExpressionAttributeValues={":owner": owner},
+            )
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                raise
+
+    # -- collection versions -----------------------------------------------------
+
+    def touch_collection(
+        self, user_id: str, collection: str, deleted: bool = False,
+    ) -> int:
+        """Bump a user's version of ``collection`` after a write.
+
+        ``deleted`` also records when the collection last lost an item,
+        which ?since= deltas cannot express. Returns the new version.
+        """
+        expression = "ADD #v :one"
+        names = {"#v": f"{collection}Version"}
+        values: dict = {":one": 1}
+        if deleted:
+            expression += " SET #d = :now"
+            names["#d"] = f"{collection}DeletedAt"
+            values[":now"] = utc_now_iso()
+        resp = self._table.update_item(
+            Key={"userId": user_id, "usageKey": _COLLECTIONS_KEY},
+            UpdateExpression=expression,
+            ExpressionAttributeNames=names,
+            ExpressionAttributeValues=values,
+            ReturnValues="UPDATED_NEW",
+        )
+        return int(resp["Attributes"][f"{collection}Version"])
+
+    def get_collection_version(
+        self, user_id: str, collection: str,
+    ) -> tuple[int, str | None]:
+        """(version, last deletion time) of a user's collection.
+
+        Strongly consistent, so a write is never followed by a 304 for the
+        version before it. Collections never written report (0, None).
+        """
+        resp = self._table.get_item(
+            Key={"userId": user_id, "usageKey": _COLLECTIONS_KEY},
+            ProjectionExpression="#v, #d",
+            ExpressionAttributeNames={
+                "#v": f"{collection}Version",
+                "#d": f"{collection}DeletedAt",
+            },
+            ConsistentRead=True,
+        )
+        item = resp.get("Item", {})
+        return (
+            int(item.get(f"{collection}Version", 0)),
+            item.get(f"{collection}DeletedAt"),
+        )
+
+    # -- push connections ------------------------------------------------------
+
+    def add_push_connection(self, user_id: str, connection_id: str) -> None:
+        """Record a WebSocket connection (app.push) for a user.
+
+        Two items: push#<id> under the user, for fan-out, and owner under
+        the push#<id> partition, since $disconnect only knows the id.
+        """
+        ttl = int(time.time()) + _PUSH_CONNECTION_TTL_SECONDS
+        self._table.put_item(Item={
+            "userId": user_id,
+            "usageKey": f"push#{connection_id}",
+            "connectionId": connection_id,
+            "expiresAt": ttl,
+        })
+        self._table.put_item(Item={
+            "userId": f"push#{connection_id}",
+            "usageKey": "owner",
+            "forUser": user_id,
+            "expiresAt": ttl,
+        })
+
+    def list_push_connections(self, user_id: str) -> list[str]:
+        """Connection ids of a user's open WebSockets."""
+        items = self.query_all(
+            Key("userId").eq(user_id) & Key("usageKey").begins_with("push#"),
+        )
+        return [i["connectionId"] for i in items]
+
+    def remove_push_connection(
+        self, connection_id: str, user_id: str | None = None,
+    ) -> None:
+        """Forget a connection (on $disconnect, or when it is gone)."""
+        owner_key = {"userId": f"push#{connection_id}", "usageKey": "owner"}
+        if user_id is None:
+            owner = self._table.get_item(Key=owner_key).get("Item")
+            user_id = owner.get("forUser") if owner else None
+        self._table.delete_item(Key=owner_key)
+        if user_id:
+            self._table.delete_item(
+                Key={"userId": user_id, "usageKey": f"push#{connection_id}"},
+            )
@@ -2,9 +2,40 @@
 
 from __future__ import annotations
 
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+from boto3.dynamodb.conditions import Key
+
 from app.db.base_repository import BaseRepository, utc_now_iso
 from app.db.connection import get_table
-from app.db.table_config import USERS_TABLE
+from app.db.table_config import USERS_BY_SLOT_GSI, USERS_TABLE
+
+# Slot value for an unparseable time: matches no hour, but keeps the user
+# in the UsersBySlot index for their other slot
+NO_SLOT = "-"
+
+# UsersBySlot partitions (morning slots); evening reads query each one
+_MORNING_SLOTS = [f"{h:02d}" for h in range(24)] + [NO_SLOT]
+
+
+def utc_slot(local_time: str, tz_name: str) -> str:
+    """Return the UTC hour ("00"-"23") at which a local HH:MM falls today.
+
+    Unknown timezones are treated as UTC; unparseable times return "".
+    The slot is recomputed on every settings write, so it follows DST once
+    the user's settings are saved.
+    """
+    try:
+        tz = ZoneInfo(tz_name)
+    except Exception:
+        tz = timezone.utc
+    try:
+        hour, minute = (int(p) for p in local_time.split(":")[:2])
+    except ValueError:
+        return ""
+    local = datetime.now(tz).replace(hour=hour, minute=minute, second=0, microsecond=0)
+    return local.astimezone(timezone.utc).strftime("%H")
 
 
 class UsersRepository(BaseRepository):
@@ -25,6 +56,8 @@ class UsersRepository(BaseRepository):
                 "onboardingCompleted": False,
                 "morningTime": "07:00",
                 "eveningTime": "21:00",
+                "morningSlotUtc": "07",
+                "eveningSlotUtc": "21",
                 "createdAt": utc_now_iso(),
             }
             return self.put_item(item)
@@ -32,6 +65,72 @@ class UsersRepository(BaseRepository):
     def get_settings(self, user_id: str) -> dict:
         """Return user settings (stored as attributes on user item)."""
         user = self.get_or_create_user(user_id)
+        return self._settings_from(user)
+
+    def get_settings_many(self, user_ids: list[str]) -> dict[str, dict]:
+        """Settings for many users in BatchGetItem round-trips.
+
+        Users without an item get the default settings (no item is created).
+        """
+        users = {
+            u["userId"]: u
+            for u in self.batch_get([{"userId": uid} for uid in dict.fromkeys(user_ids)])
+        }
+        return {uid: self._settings_from(users.get(uid, {})) for uid in user_ids}
+
+    def upsert_settings(self, user_id: str, data: dict) -> dict:
+        """Update user settings. Creates user if not exists.
+
+        Keeps morningSlotUtc/eveningSlotUtc (the UsersBySlot index keys)
+        in step with timezone, morningTime and eveningTime.
+        """
+        user = self.get_or_create_user(user_id)
+        updates = {k: v for k, v in data.items() if v is not None}
+        if not updates:
+            return self._settings_from(user)
+        if {"timezone", "morningTime", "eveningTime"} & updates.keys():
+            merged = {**self._settings_from(user), **updates}
+            for slot in ("morning", "evening"):
+                hour = utc_slot(merged[f"{slot}Time"], merged["timezone"])
+                updates[f"{slot}SlotUtc"] = hour or NO_SLOT
+        return self._settings_from(self.update_item({"userId": user_id}, updates))
+
+    def list_ids_in_slot(self, slot: str, hour: str) -> list[str]:
+        """User IDs whose morning/evening slot is the given UTC hour.
+
+        Morning is one UsersBySlot partition; evening is the sort key, so it
+        takes one keys-only query per morning slot.
+        """
+        if slot == "morning":
+            conditions = [Key("morningSlotUtc").eq(hour)]
+        else:
+            conditions = [
+                Key("morningSlotUtc").eq(m) & Key("eveningSlotUtc").eq(hour)
+                for m in _MORNING_SLOTS
+            ]
+        return [
+            i["userId"]
+            for condition in conditions
+            for i in self.query_all(condition, index_name=USERS_BY_SLOT_GSI)
+        ]
+
+    def list_all_ids(self, segment: int = 0, total_segments: int = 1) -> list[str]:
+        """All user IDs in one parallel-scan segment, fully paginated."""
+        kwargs: dict = {"ProjectionExpression": "userId"}
+        if total_segments > 1:
+            kwargs["Segment"] = segment
+            kwargs["TotalSegments"] = total_segments
+        user_ids: list[str] = []
+        while True:
+            resp = self._table.scan(**kwargs)
+            user_ids.extend(i["userId"] for i in resp.get("Items", []) if i.get("userId"))
+            last_key = resp.get("LastEvaluatedKey")
+            if not last_key:
+                return user_ids
+            kwargs["ExclusiveStartKey"] = last_key
+
+    @staticmethod
+    def _settings_from(user: dict) -> dict:
         return {
             "agentName": user.get("agentName", "Jumns"),
             "agentBehavior": user.get("agentBehavior", "Friendly & Supportive"),
@@ -40,12 +139,3 @@ class UsersRepository(BaseRepository):
             "morningTime": user.get("morningTime", "07:00"),
             "eveningTime": user.get("eveningTime", "21:00"),
         }
-
-    def upsert_settings(self, user_id: str, data: dict) -> dict:
-        """Update user settings. Creates user if not exists."""
-        self.get_or_create_user(user_id)
-        updates = {k: v for k, v in data.items() if v is not None}
-        if not updates:
-            return self.get_settings(user_id)
-        self.update_item({"userId": user_id}, updates)
-        return self.get_settings(user_id)
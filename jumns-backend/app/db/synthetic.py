@@ -0,0 +1,407 @@
+"""Synthetic users and data for scaling tests, reproducible from a seed.
+
+Generates users with goals, tasks, reminders, messages and memories
+(with 768-d embeddings) in the same item shapes the repositories write,
+and loads them with bulk writes: BatchWriteItem for the tables and
+parallel puts for the S3 memory docs. The same seed, anchor date and
+sizes always give the same ids, text and timestamps.
+
+Sizes come from a scale preset (SCALES) per user; the distribution
+spreads them over users:
+
+    uniform   every user gets the full preset
+    zipf      user k (1-based) gets preset / k**skew — a few heavy users
+              and a long tail of light ones
+
+Usage (against DynamoDB Local / the configured tables and MEMORY_BUCKET):
+
+    DYNAMODB_ENDPOINT=http://localhost:8000 MEMORY_BUCKET=... \\
+        python -m app.db.synthetic --users 5 --scale large --seed 42
+
+local_server.py's POST /api/seed loads the same data into its in-memory db.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import uuid
+import zlib
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Iterator
+
+from app.db.repositories.users import utc_slot
+from app.db.table_config import fire_shard
+from app.scheduling.recurrence import fire_key, next_fire_at, parse_schedule
+
+# Per-user sizes at each scale
+SCALES: dict[str, dict[str, int]] = {
+    "small": {"goals": 10, "tasks": 50, "reminders": 10, "messages": 200, "memories": 200},
+    "medium": {"goals": 50, "tasks": 250, "reminders": 50, "messages": 2_000, "memories": 5_000},
+    "large": {"goals": 300, "tasks": 1_000, "reminders": 200, "messages": 10_000, "memories": 50_000},
+}
+DISTRIBUTIONS = ("uniform", "zipf")
+
+EMBEDDING_DIM = 768
+# Memories are drawn around this many topic centroids, so nearest-neighbour
+# search has real structure to find
+MEMORY_TOPICS = 32
+
+_TIMEZONES = [
+    "UTC", "America/New_York", "America/Los_Angeles", "Europe/London",
+    "Europe/Berlin", "Asia/Kolkata", "Asia/Tokyo", "Australia/Sydney",
+]
+_CATEGORIES = ["Health", "Learning", "Finance", "Personal", "Professional", "Creative"]
+_VERBS = ["Run", "Read", "Write", "Practice", "Plan", "Review", "Call", "Cook", "Study", "Ship"]
+_NOUNS = [
+    "marathon", "novel", "budget", "piano", "garden", "portfolio", "essay",
+    "presentation", "meal prep", "Spanish", "side project", "backlog",
+]
+_REMINDER_TIMES = [
+    "08:00", "every day at 9am", "every monday at 18:30", "weekdays 7:15",
+    "in the morning", "every friday at 17:00", "21:30", "someday",
+]
+_CARD_TYPES = ["daily_briefing", "journal_prompt", "goal_progress", "task_list"]
+_FILLER = (
+    "today I want to focus on staying consistent with my routine and "
+    "making small progress every day even when it feels slow"
+).split()
+
+
+def user_counts(
+    users: int,
+    base: dict[str, int],
+    distribution: str = "uniform",
+    skew: float = 1.0,
+) -> list[dict[str, int]]:
+    """Per-user sizes for ``users`` users from a base preset."""
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"unknown distribution: {distribution}")
+    counts = []
+    for rank in range(1, users + 1):
+        factor = 1.0 if distribution == "uniform" else 1.0 / rank ** skew
+        counts.append({k: max(1 if v else 0, round(v * factor)) for k, v in base.items()})
+    return counts
+
+
+class SyntheticData:
+    """Deterministic generator of one user's items at a time.
+
+    Every user draws from its own RNG (seed + user id), so a user's data
+    does not depend on which other users were generated before it.
+    """
+
+    def __init__(self, seed: int = 0, anchor: date | None = None):
+        self.seed = seed
+        self.anchor = datetime.combine(
+            anchor or datetime.now(timezone.utc).date(), time(12), tzinfo=timezone.utc,
+        )
+
+    def _rng(self, user_id: str, stream: str) -> random.Random:
+        return random.Random(f"{self.seed}:{user_id}:{stream}")
+
+    @staticmethod
+    def _id(rng: random.Random) -> str:
+        return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+    def _ago(self, rng: random.Random, max_days: int) -> datetime:
+        return self.anchor - timedelta(seconds=rng.randint(0, max_days * 86400))
+
+    @staticmethod
+    def _sentence(rng: random.Random, words: int) -> str:
+        return " ".join(rng.choice(_FILLER) for _ in range(words)).capitalize()
+
+    # -- table items ---------------------------------------------------------
+
+    def user(self, user_id: str, counts: dict[str, int]) -> dict[str, list[dict]]:
+        """users/goals/tasks/reminders/messages items for one user."""
+        rng = self._rng(user_id, "tables")
+        settings = self._settings(user_id, rng)
+        goals = [self._goal(user_id, rng) for _ in range(counts.get("goals", 0))]
+        goal_ids = [g["goalId"] for g in goals]
+        return {
+            "users": [settings],
+            "goals": goals,
+            "tasks": [self._task(user_id, rng, goal_ids) for _ in range(counts.get("tasks", 0))],
+            "reminders": [
+                self._reminder(user_id, rng, settings, goal_ids)
+                for _ in range(counts.get("reminders", 0))
+            ],
+            "messages": self._messages(user_id, rng, counts.get("messages", 0)),
+        }
+
+    def _settings(self, user_id: str, rng: random.Random) -> dict:
+        tz = rng.choice(_TIMEZONES)
+        morning = f"{rng.randint(6, 9):02d}:{rng.choice(['00', '30'])}"
+        evening = f"{rng.randint(19, 22):02d}:{rng.choice(['00', '30'])}"
+        return {
+            "userId": user_id,
+            "email": f"{user_id}@example.com",
+            "timezone": tz,
+            "agentName": "Jumns",
+            "agentBehavior": "Friendly & Supportive",
+            "onboardingCompleted": True,
+            "morningTime": morning,
+            "eveningTime": evening,
+            "morningSlotUtc": utc_slot(morning, tz),
+            "eveningSlotUtc": utc_slot(evening, tz),
+            "createdAt": self._ago(rng, 365).isoformat(),
+        }
+
+    def _goal(self, user_id: str, rng: random.Random) -> dict:
+        goal_id = self._id(rng)
+        total = rng.choice([10, 30, 100])
+        progress = rng.randint(0, total)
+        return {
+            "userId": user_id,
+            "goalId": goal_id,
+            "id": goal_id,
+            "title": f"{rng.choice(_VERBS)} {rng.choice(_NOUNS)}",
+            "category": rng.choice(_CATEGORIES),
+            "progress": progress,
+            "total": total,
+            "unit": rng.choice(["", "sessions", "pages", "km", "%"]),
+            "insight": "",
+            "activeAgent": "",
+            "completed": progress >= total,
+            "createdAt": self._ago(rng, 180).isoformat(),
+        }
+
+    def _task(self, user_id: str, rng: random.Random, goal_ids: list[str]) -> dict:
+        task_id = self._id(rng)
+        completed = rng.random() < 0.4
+        due = None
+        if rng.random() < 0.5:
+            due = (self.anchor.date() + timedelta(days=rng.randint(-14, 14))).isoformat()
+        item = {
+            "userId": user_id,
+            "taskId": task_id,
+            "id": task_id,
+            "title": f"{rng.choice(_VERBS)} {rng.choice(_NOUNS)}",
+            "time": rng.choice(["", "09:00", "13:30", "18:00"]),
+            "detail": self._sentence(rng, rng.randint(0, 12)),
+            "type": "task",
+            "completed": completed,
+            "active": not completed and rng.random() < 0.1,
+            "goalId": rng.choice(goal_ids) if goal_ids and rng.random() < 0.6 else None,
+            "priority": rng.choice(["low", "medium", "medium", "high"]),
+            "requiresProof": False,
+            "dueDate": due,
+            "proofStatus": "pending",
+            "completedAt": self._ago(rng, 30).isoformat() if completed else None,
+            "createdAt": self._ago(rng, 90).isoformat(),
+        }
+        return {k: v for k, v in item.items() if v is not None}
+
+    def _reminder(
+        self, user_id: str, rng: random.Random, settings: dict, goal_ids: list[str],
+    ) -> dict:
+        reminder_id = self._id(rng)
+        text = rng.choice(_REMINDER_TIMES)
+        created = self._ago(rng, 60).isoformat()
+        active = rng.random() < 0.8
+        item = {
+            "userId": user_id,
+            "reminderId": reminder_id,
+            "id": reminder_id,
+            "title": f"{rng.choice(_VERBS)} {rng.choice(_NOUNS)}",
+            "time": text,
+            "active": active,
+            "goalId": rng.choice(goal_ids) if goal_ids and rng.random() < 0.3 else None,
+            "snoozeCount": 0,
+            "originalTime": text,
+            "createdAt": created,
+            "fireShard": fire_shard(user_id),
+        }
+        recurrence = parse_schedule(text, settings, self.anchor)
+        if recurrence:
+            item["recurrence"] = recurrence
+            next_fire = next_fire_at(recurrence, self.anchor)
+            if active and next_fire:
+                item["nextFireAt"] = fire_key(next_fire)
+        return {k: v for k, v in item.items() if v is not None}
+
+    def _messages(self, user_id: str, rng: random.Random, count: int) -> list[dict]:
+        """A conversation ending at the anchor, oldest first, ~5% cards."""
+        messages = []
+        at = self.anchor - timedelta(minutes=7 * count)
+        for i in range(count):
+            at += timedelta(seconds=rng.randint(60, 780))
+            msg_id = self._id(rng)
+            now = at.isoformat()
+            item = {
+                "userId": user_id,
+                "createdAt#msgId": f"{now}#{msg_id}",
+                "id": msg_id,
+                "role": "user" if i % 2 == 0 else "assistant",
+                "type": "text",
+                "content": self._sentence(rng, rng.randint(4, 40)),
+                "timestamp": now,
+                "createdAt": now,
+            }
+            if item["role"] == "assistant" and rng.random() < 0.1:
+                card_type = rng.choice(_CARD_TYPES)
+                item.update(
+                    type="card",
+                    cardType=card_type,
+                    cardData={"title": item["content"][:40], "items": ["-"]},
+                    cardKey=f"{card_type}#{now}",
+                )
+            messages.append(item)
+        return messages
+
+    # -- memories ------------------------------------------------------------
+
+    def memories(
+        self, user_id: str, count: int, batch_size: int = 1000,
+    ) -> Iterator[list[dict]]:
+        """Memory docs with embeddings, in batches (50k x 768 floats is large)."""
+        import numpy as np
+
+        rng = self._rng(user_id, "memories")
+        vectors = np.random.default_rng(zlib.crc32(f"{self.seed}:{user_id}".encode()))
+        # Topic centroids are shared by all users of a seed
+        centroids = np.random.default_rng(self.seed).standard_normal(
+            (MEMORY_TOPICS, EMBEDDING_DIM), dtype=np.float32,
+        )
+        for start in range(0, count, batch_size):
+            size = min(batch_size, count - start)
+            topics = vectors.integers(0, MEMORY_TOPICS, size)
+            embeddings = centroids[topics] + 0.5 * vectors.standard_normal(
+                (size, EMBEDDING_DIM), dtype=np.float32,
+            )
+            batch = []
+            for topic, embedding in zip(topics.tolist(), embeddings.round(4).tolist()):
+                batch.append({
+                    "id": self._id(rng),
+                    "userId": user_id,
+                    "content": f"{_NOUNS[topic % len(_NOUNS)]}: {self._sentence(rng, rng.randint(5, 20))}",
+                    "embedding": embedding,
+                    "metadata": {"topic": topic, "synthetic": True},
+                    "createdAt": self._ago(rng, 365).isoformat(),
+                })
+            yield batch
+
+
+# ---------------------------------------------------------------------------
+# Loaders
+# ---------------------------------------------------------------------------
+
+
+def seed_backend(
+    user_ids: list[str],
+    counts: list[dict[str, int]],
+    data: SyntheticData,
+    concurrency: int = 16,
+) -> dict[str, int]:
+    """Bulk-load users into the DynamoDB tables and the S3 memory bucket."""
+    from app.db import table_config as tc
+    from app.db.base_repository import BaseRepository
+    from app.db.connection import get_table
+    from app.memory.memory_service import MemoryService
+
+    tables = {
+        "users": tc.USERS_TABLE,
+        "goals": tc.GOALS_TABLE,
+        "tasks": tc.TASKS_TABLE,
+        "reminders": tc.REMINDERS_TABLE,
+        "messages": tc.MESSAGES_TABLE,
+    }
+    repos = {name: BaseRepository(get_table(table)) for name, table in tables.items()}
+    memory = MemoryService()
+    written = dict.fromkeys([*tables, "memories"], 0)
+    for user_id, sizes in zip(user_ids, counts):
+        for name, items in data.user(user_id, sizes).items():
+            written[name] += repos[name].batch_put(items)
+        for batch in data.memories(user_id, sizes.get("memories", 0)):
+            written["memories"] += memory.store_many(batch, concurrency)
+    return written
+
+
+# DynamoDB key attributes that local_server.py's items don't have
+_LOCAL_DROP = {
+    "goals": {"goalId"},
+    "tasks": {"taskId"},
+    "reminders": {"reminderId", "fireShard"},
+    "messages": {"createdAt#msgId", "cardKey"},
+}
+
+
+def seed_local(
+    db: dict[str, list[dict]],
+    user_settings: dict[str, dict],
+    user_ids: list[str],
+    counts: list[dict[str, int]],
+    data: SyntheticData,
+) -> dict[str, int]:
+    """Load users into local_server.py's in-memory ``db`` (no embeddings)."""
+    written: dict[str, int] = {}
+    for user_id, sizes in zip(user_ids, counts):
+        for name, items in data.user(user_id, sizes).items():
+            if name == "users":
+                user_settings[user_id] = {
+                    k: v for k, v in items[0].items()
+                    if k not in ("userId", "email", "morningSlotUtc", "eveningSlotUtc", "createdAt")
+                }
+                continue
+            drop = _LOCAL_DROP.get(name, set())
+            db[name].extend({k: v for k, v in item.items() if k not in drop} for item in items)
+            written[name] = written.get(name, 0) + len(items)
+        for batch in data.memories(user_id, sizes.get("memories", 0)):
+            db["memories"].extend(
+                {
+                    "id": m["id"], "userId": user_id, "content": m["content"],
+                    "category": "synthetic", "importance": "medium",
+                    "createdAt": m["createdAt"],
+                }
+                for m in batch
+            )
+            written["memories"] = written.get("memories", 0) + len(batch)
+    return written
+
+
+def plan(
+    users: int,
+    scale: str = "small",
+    distribution: str = "uniform",
+    skew: float = 1.0,
+    prefix: str = "synthetic-user",
+    overrides: dict[str, int] | None = None,
+) -> tuple[list[str], list[dict[str, int]]]:
+    """User ids and per-user sizes for a seeding run."""
+    if scale not in SCALES:
+        raise ValueError(f"unknown scale: {scale}")
+    base = {**SCALES[scale], **(overrides or {})}
+    user_ids = [f"{prefix}-{i:05d}" for i in range(users)]
+    return user_ids, user_counts(users, base, distribution, skew)
+
+
+if __name__ == "__main__":
+    import time as _time
+
+    parser = argparse.ArgumentParser(description="Load synthetic users into DynamoDB/S3")
+    parser.add_argument("--users", type=int, default=1)
+    parser.add_argument("--scale", choices=sorted(SCALES), default="small")
+    parser.add_argument("--distribution", choices=DISTRIBUTIONS, default="uniform")
+    parser.add_argument("--skew", type=float, default=1.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--anchor", type=date.fromisoformat, default=None,
+                        help="date the data is generated around (default: today)")
+    parser.add_argument("--prefix", default="synthetic-user")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--create-tables", action="store_true")
+    for name in SCALES["small"]:
+        parser.add_argument(f"--{name}", type=int, default=None, help=f"{name} per user (overrides --scale)")
+    args = parser.parse_args()
+
+    if args.create_tables:
+        from app.db.local_tables import create_tables
+
+        create_tables()
+    ids, sizes = plan(
+        args.users, args.scale, args.distribution, args.skew, args.prefix,
+        {k: getattr(args, k) for k in SCALES["small"] if getattr(args, k) is not None},
+    )
+    started = _time.monotonic()
+    totals = seed_backend(ids, sizes, SyntheticData(args.seed, args.anchor), args.concurrency)
+    print(f"Seeded {len(ids)} users in {_time.monotonic() - started:.1f}s:", totals)
@@ -1,6 +1,7 @@
 """DynamoDB table names and key schemas — read from environment variables."""
 
 import os
+import zlib
 
 # Table names (set by CDK via Lambda env vars, defaults for local dev)
 USERS_TABLE = os.getenv("USERS_TABLE", "jumns-users")
@@ -11,8 +12,23 @@ REMINDERS_TABLE = os.getenv("REMINDERS_TABLE", "jumns-reminders")
 SKILLS_TABLE = os.getenv("SKILLS_TABLE", "jumns-skills")
 INSIGHTS_TABLE = os.getenv("INSIGHTS_TABLE", "jumns-insights")
 ACCESS_CODES_TABLE = os.getenv("ACCESS_CODES_TABLE", "jumns-access-codes")
+USAGE_TABLE = os.getenv("USAGE_TABLE", "jumns-usage")
+CRON_JOBS_TABLE = os.getenv("CRON_JOBS_TABLE", "jumns-cron-jobs")
 
 # GSI names
 TASKS_BY_GOAL_GSI = "TasksByGoal"
-ACTIVE_REMINDERS_GSI = "ActiveReminders"
+TASKS_BY_DUE_DATE_GSI = "TasksByDueDate"
+DUE_REMINDERS_GSI = "DueReminders"
+DUE_JOBS_GSI = "DueJobs"
 MESSAGES_BY_TYPE_GSI = "MessagesByType"
+ACCESS_CODES_BY_USER_GSI = "CodesByUser"
+USERS_BY_SLOT_GSI = "UsersBySlot"
+
+# DueReminders / DueJobs are partitioned by fireShard ("0".."N-1", from the
+# userId) so the dispatchers' time-range reads are spread over partitions
+REMINDER_FIRE_SHARDS = int(os.getenv("REMINDER_FIRE_SHARDS", "8"))
+
+
+def fire_shard(user_id: str) -> str:
+    """DueReminders / DueJobs partition key for a user's items."""
+    return str(zlib.crc32(user_id.encode()) % REMINDER_FIRE_SHARDS)
@@ -0,0 +1,144 @@
+"""Process-level repositories and services.
+
+Every get_* returns one shared instance per process (per Lambda
+container), so requests and sweeps stop rebuilding Table resources, S3
+clients and services. Repositories are stateless wrappers around a
+cached Table and are safe to share across threads.
+
+Routes receive these through FastAPI Depends (app.routes.deps); tools,
+the scheduler and middleware call the getters directly. This module
+does not import FastAPI, so the scheduler function can use it.
+
+The get_async_* repositories (app.db.aio) serve reads that async code
+fans out with asyncio.gather.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Callable, TypeVar
+
+from app.db.repositories.access_codes import AccessCodesRepository
+from app.db.repositories.cron_jobs import CronJobsRepository
+from app.db.repositories.goals import AsyncGoalsRepository, GoalsRepository
+from app.db.repositories.insights import InsightsRepository
+from app.db.repositories.messages import MessagesRepository
+from app.db.repositories.reminders import AsyncRemindersRepository, RemindersRepository
+from app.db.repositories.skills import SkillsRepository
+from app.db.repositories.tasks import AsyncTasksRepository, TasksRepository
+from app.db.repositories.usage import UsageRepository
+from app.db.repositories.users import UsersRepository
+from app.memory.memory_service import MemoryService
+
+if TYPE_CHECKING:
+    from app.agent.agent_service import AgentService
+
+T = TypeVar("T")
+
+_instances: dict[Callable, object] = {}
+_lock = threading.RLock()  # factories may fetch other shared instances
+
+
+def _shared(factory: Callable[[], T]) -> T:
+    """The process-wide instance built by ``factory`` (built once)."""
+    instance = _instances.get(factory)
+    if instance is None:
+        with _lock:
+            instance = _instances.get(factory)
+            if instance is None:
+                instance = _instances[factory] = factory()
+    return instance
+
+
+def reset_instances() -> None:
+    """Forget every shared instance (tests, after reset_connection())."""
+    with _lock:
+        _instances.clear()
+
+
+# ---------------------------------------------------------------------------
+# Getters
+# ---------------------------------------------------------------------------
+
+
+def get_access_codes_repo() -> AccessCodesRepository:
+    return _shared(AccessCodesRepository)
+
+
+def get_cron_jobs_repo() -> CronJobsRepository:
+    return _shared(CronJobsRepository)
+
+
+def get_goals_repo() -> GoalsRepository:
+    return _shared(GoalsRepository)
+
+
+def get_insights_repo() -> InsightsRepository:
+    return _shared(InsightsRepository)
+
+
+def get_messages_repo() -> MessagesRepository:
+    return _shared(MessagesRepository)
+
+
+def get_reminders_repo() -> RemindersRepository:
+    return _shared(RemindersRepository)
+
+
+def get_skills_repo() -> SkillsRepository:
+    return _shared(SkillsRepository)
+
+
+def get_tasks_repo() -> TasksRepository:
+    return _shared(TasksRepository)
+
+
+def get_usage_repo() -> UsageRepository:
+    return _shared(UsageRepository)
+
+
+def get_users_repo() -> UsersRepository:
+    return _shared(UsersRepository)
+
+
+def get_async_goals_repo() -> AsyncGoalsRepository:
+    return _shared(AsyncGoalsRepository)
+
+
+def get_async_reminders_repo() -> AsyncRemindersRepository:
+    return _shared(AsyncRemindersRepository)
+
+
+def get_async_tasks_repo() -> AsyncTasksRepository:
+    return _shared(AsyncTasksRepository)
+
+
+def get_memory_service() -> MemoryService:
+    return _shared(MemoryService)
+
+
+def _agent_service() -> AgentService:
+    # Imported on first use: the agent stack stays out of the CRUD function
+    from app.agent.agent_service import AgentService
+
+    return AgentService()
+
+
+def get_agent_service() -> AgentService:
+    return _shared(_agent_service)
+
+
+def _push_broker():
+    from app.push import create_broker
+
+    return create_broker() or _NO_BROKER
+
+
+_NO_BROKER = object()
+
+
+def get_push_broker():
+    """The app.push broker, or None when push is off."""
+    broker = _shared(_push_broker)
+    return None if broker is _NO_BROKER else broker
+
@@ -0,0 +1,144 @@
+"""Entitlement resolution — Pro subscription or activated access code.
+
+Single source of truth for "is this user unlimited?", consulted by the
+subscription and access-code routes and by the chat rate limiter.
+Unlimited results are cached per process for ENTITLEMENT_TTL_SECONDS;
+free-tier (and failed) lookups only for FREE_TTL_SECONDS, so an upgrade
+shows up almost at once. The cache is an LRU bounded to
+MAX_CACHED_USERS. RevenueCat is called through one pooled httpx client
+per event loop instead of a new client per request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any
+
+import httpx
+
+from app.dependencies import get_access_codes_repo
+
+logger = logging.getLogger(__name__)
+
+REVENUECAT_API_KEY = os.getenv("REVENUECAT_API_KEY", "")
+REVENUECAT_BASE = "https://api.revenuecat.com/v1"
+ENTITLEMENT_TTL_SECONDS = int(os.getenv("ENTITLEMENT_TTL_SECONDS", "300"))
+# Free-tier results, including failed lookups, are rechecked after this,
+# so a purchase or a RevenueCat blip doesn't leave a Pro user limited
+FREE_TTL_SECONDS = int(os.getenv("ENTITLEMENT_FREE_TTL_SECONDS", "5"))
+MAX_CACHED_USERS = int(os.getenv("ENTITLEMENT_CACHE_SIZE", "10000"))
+
+FREE_ENTITLEMENT: dict[str, Any] = {
+    "plan": "free",
+    "isPro": False,
+    "expiresAt": None,
+    "accessCode": False,
+}
+
+
+class EntitlementService:
+    """Resolves and caches per-user entitlements."""
+
+    def __init__(self):
+        self._access_codes_repo = get_access_codes_repo()
+        self._cache: OrderedDict[str, tuple[dict[str, Any], float]] = OrderedDict()
+        self._cache_lock = threading.Lock()  # scheduler workers share the cache
+        # One client per event loop (scheduler workers each run their own)
+        self._clients: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+    # -- public API ----------------------------------------------------------
+
+    async def get_entitlement(self, user_id: str) -> dict[str, Any]:
+        """Return plan, isPro, expiresAt and accessCode for a user."""
+        now = time.monotonic()
+        with self._cache_lock:
+            cached = self._cache.get(user_id)
+            if cached and cached[1] > now:
+                self._cache.move_to_end(user_id)
+                return cached[0]
+
+        entitlement = dict(FREE_ENTITLEMENT)
+        try:
+            pro = await self._fetch_revenuecat_pro(user_id)
+        except Exception:
+            logger.warning("RevenueCat lookup failed for user %s", user_id)
+            pro = None  # fail closed — free tier until the short TTL lapses
+        if pro:
+            entitlement.update(plan="pro", isPro=True, expiresAt=pro)
+        entitlement["accessCode"] = self._access_codes_repo.get_activation_status(
+            user_id
+        )
+
+        unlimited = entitlement["isPro"] or entitlement["accessCode"]
+        ttl = ENTITLEMENT_TTL_SECONDS if unlimited else FREE_TTL_SECONDS
+        with self._cache_lock:
+            self._cache[user_id] = (entitlement, now + ttl)
+            self._cache.move_to_end(user_id)
+            while len(self._cache) > MAX_CACHED_USERS:
+                self._cache.popitem(last=False)
+        return entitlement
+
+    async def is_unlimited(self, user_id: str) -> bool:
+        """True for Pro subscribers and access-code holders."""
+        entitlement = await self.get_entitlement(user_id)
+        return entitlement["isPro"] or entitlement["accessCode"]
+
+    def invalidate(self, user_id: str) -> None:
+        """Drop the cached entitlement, e.g. after a code is activated."""
+        with self._cache_lock:
+            self._cache.pop(user_id, None)
+
+    # -- private helpers -----------------------------------------------------
+
+    def _http_client(self) -> httpx.AsyncClient:
+        """The running loop's pooled client, created on first use.
+
+        Clients of loops that have since closed can no longer be awaited,
+        so they are just dropped.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            for other in list(self._clients):
+                if other.is_closed():
+                    self._clients.pop(other, None)
+            client = self._clients[loop] = httpx.AsyncClient(
+                base_url=REVENUECAT_BASE,
+                headers={"Authorization": f"Bearer {REVENUECAT_API_KEY}"},
+                timeout=5.0,
+            )
+        return client
+
+    async def _fetch_revenuecat_pro(self, user_id: str) -> str | None:
+        """Return the Pro expiry date if the entitlement is active."""
+        if not REVENUECAT_API_KEY:
+            return None
+        resp = await self._http_client().get(f"/subscribers/{user_id}")
+        if resp.status_code == 404:
+            return None  # unknown subscriber — free tier
+        resp.raise_for_status()
+        entitlements = resp.json().get("subscriber", {}).get("entitlements", {})
+        expires = (entitlements.get("pro") or {}).get("expires_date")
+        if not expires:
+            return None
+        expires_dt = datetime.fromisoformat(expires.replace("Z", "+00:00"))
+        if expires_dt <= datetime.now(timezone.utc):
+            return None
+        return expires
+
+
+_service: EntitlementService | None = None
+
+
+def get_entitlement_service() -> EntitlementService:
+    """Return the process-wide EntitlementService (cache shared per container)."""
+    global _service
+    if _service is None:
+        _service = EntitlementService()
+    return _service
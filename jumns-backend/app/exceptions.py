@@ -9,6 +9,14 @@ class ResourceNotFoundError(Exception):
         super().__init__(f"{resource} not found")
 
 
+class ConcurrentModificationError(Exception):
+    """Raised when a versioned update loses a race with another writer."""
+
+    def __init__(self, resource: str = "Resource"):
+        self.resource = resource
+        super().__init__(f"{resource} was modified concurrently")
+
+
 class AgentUnavailableError(Exception):
     """Raised when all AI models fail."""
 
@@ -27,3 +35,17 @@ class UnauthorizedError(Exception):
     """Raised when JWT validation fails."""
 
     pass
+
+
+class ForbiddenError(Exception):
+    """Raised when an authenticated user lacks access (e.g. admin routes)."""
+
+    pass
+
+
+class NotModifiedError(Exception):
+    """Raised when a conditional GET matches the client's ETag (304)."""
+
+    def __init__(self, etag: str):
+        self.etag = etag
+        super().__init__(f"Not modified: {etag}")
@@ -0,0 +1,7 @@
+"""Per-workload Lambda entry points (slim imports, own requirements).
+
+    app.handlers.crud.handler        CRUD routes        requirements-crud.txt
+    app.handlers.chat.handler        chat + agent       requirements-chat.txt
+    app.handlers.push.handler        push WebSockets    requirements-crud.txt
+    app.scheduler.handler.handler    scheduled sweeps   requirements-scheduler.txt
+"""
@@ -0,0 +1,8 @@
+"""Chat Lambda — /api/chat and /api/insights (agent-backed routes)."""
+
+from mangum import Mangum
+
+from app.application import CHAT_ROUTES, create_app
+
+app = create_app(CHAT_ROUTES)
+handler = Mangum(app)
@@ -0,0 +1,8 @@
+"""CRUD Lambda — every /api route except chat, without the agent stack."""
+
+from mangum import Mangum
+
+from app.application import CRUD_ROUTES, create_app
+
+app = create_app(CRUD_ROUTES)
+handler = Mangum(app)
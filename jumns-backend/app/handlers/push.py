@@ -0,0 +1,29 @@
+"""API Gateway WebSocket entry point — connections for app.push.
+
+$connect authenticates ?token=<Cognito JWT> and records the connection
+under its user; $disconnect forgets it. Clients send nothing else; any
+frame (routed to $default) just keeps the connection under API Gateway's
+idle timeout.
+"""
+
+from app.dependencies import get_usage_repo
+from app.middleware.auth import decode_token
+
+
+def handler(event, context):
+    request = event["requestContext"]
+    route = request["routeKey"]
+    connection_id = request["connectionId"]
+
+    if route == "$connect":
+        token = (event.get("queryStringParameters") or {}).get("token", "")
+        try:
+            user_id = decode_token(token).get("sub")
+        except Exception:  # jose.JWTError and JWKS fetch failures
+            user_id = None
+        if not user_id:
+            return {"statusCode": 401}
+        get_usage_repo().add_push_connection(user_id, connection_id)
+    elif route == "$disconnect":
+        get_usage_repo().remove_push_connection(connection_id)
+    return {"statusCode": 200}
@@ -14,6 +14,8 @@ from typing import Any
 
 import boto3
 
+from app.tracing import instrument_boto_client, traced
+
 
 class MemoryService:
     """Manages vector memory in S3 with faiss-cpu for search."""
@@ -21,7 +23,10 @@ class MemoryService:
     def __init__(self):
         self._bucket = os.getenv("MEMORY_BUCKET", "")
         self._s3 = boto3.client("s3") if self._bucket else None
+        if self._s3:
+            instrument_boto_client(self._s3)
 
+    @traced("memory.search")
     def search(
         self, user_id: str, query: str, top_k: int = 5,
     ) -> list[dict[str, Any]]:
@@ -124,6 +129,7 @@ class MemoryService:
             for score, mem in scored[:top_k]
         ]
 
+    @traced("memory.store")
     def extract_and_store(self, user_id: str, conversation_turn: str) -> None:
         """Extract key facts from a conversation turn and store in S3."""
         if not self._s3 or not self._bucket:
@@ -154,6 +160,28 @@ class MemoryService:
         except Exception:
             pass
 
+    def store_many(self, docs: list[dict], concurrency: int = 16) -> int:
+        """Write prepared memory docs (with embeddings) in parallel.
+
+        Each doc needs id and userId; it is stored at the same key as
+        extract_and_store uses. Returns the number written.
+        """
+        if not self._s3 or not self._bucket or not docs:
+            return 0
+        from concurrent.futures import ThreadPoolExecutor
+
+        def put(doc: dict) -> None:
+            self._s3.put_object(
+                Bucket=self._bucket,
+                Key=f"memories/{doc['userId']}/{doc['id']}.json",
+                Body=json.dumps(doc),
+                ContentType="application/json",
+            )
+
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(put, docs))
+        return len(docs)
+
     def list_memories(self, user_id: str) -> list[dict]:
         """Return all memory entries for a user (without embeddings)."""
         if not self._s3 or not self._bucket:
@@ -175,6 +203,7 @@ class MemoryService:
         except Exception:
             pass
 
+    @traced("memory.load")
     def _load_user_memories(self, user_id: str) -> list[dict]:
         """Load all memory JSON files for a user from S3."""
         if not self._s3 or not self._bucket:
@@ -198,6 +227,7 @@ class MemoryService:
             pass
         return memories
 
+    @traced("memory.embed")
     def _generate_embedding(self, text: str) -> list[float] | None:
         """Generate a 768-d embedding via Gemini embedding model."""
         api_key = os.getenv("GEMINI_API_KEY", "")
@@ -10,9 +10,7 @@ from __future__ import annotations
 import os
 from typing import Any
 
-import httpx
 from fastapi import Request
-from jose import JWTError, jwk, jwt
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import JSONResponse
 
@@ -39,6 +37,8 @@ def _get_jwks() -> dict[str, Any]:
     """Fetch JWKS from Cognito (cached on cold start)."""
     global _jwks_cache
     if _jwks_cache is None:
+        import httpx
+
         resp = httpx.get(JWKS_URL, timeout=5.0)
         resp.raise_for_status()
         _jwks_cache = resp.json()
@@ -47,6 +47,8 @@ def _get_jwks() -> dict[str, Any]:
 
 def _find_key(token: str) -> dict[str, Any]:
     """Find the matching JWK for the token's kid header."""
+    from jose import JWTError, jwt
+
     headers = jwt.get_unverified_headers(token)
     kid = headers.get("kid")
     keys = _get_jwks().get("keys", [])
@@ -58,6 +60,9 @@ def _find_key(token: str) -> dict[str, Any]:
 
 def decode_token(token: str) -> dict[str, Any]:
     """Validate and decode a Cognito JWT, returning the claims dict."""
+    # jose and httpx are imported on first use, keeping /health cold starts light
+    from jose import jwk, jwt
+
     signing_key = _find_key(token)
     public_key = jwk.construct(signing_key)
     claims = jwt.decode(
@@ -93,7 +98,7 @@ class CognitoAuthMiddleware(BaseHTTPMiddleware):
         token = auth_header[7:]  # strip "Bearer "
         try:
             claims = decode_token(token)
-        except (JWTError, Exception):
+        except Exception:  # jose.JWTError and JWKS fetch failures
             return JSONResponse(status_code=401, content={"error": "Unauthorized"})
 
         user_id = claims.get("sub")
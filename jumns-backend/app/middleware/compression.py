@@ -0,0 +1,100 @@
+"""Response compression — brotli or gzip, by Accept-Encoding.
+
+Bodies of at least COMPRESS_MIN_BYTES with a JSON or text content type
+are compressed, brotli preferred when the brotli package is installed.
+Smaller bodies aren't worth the CPU or the extra headers. Streaming
+responses pass through unchanged.
+
+Deployed stages set COMPRESS_RESPONSES=0 and let the REST API gateway
+gzip instead: passing a compressed Lambda body through it would need
+binaryMediaTypes "*/*" (see infra/infra_constructs/api.py).
+"""
+
+from __future__ import annotations
+
+import gzip
+import os
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - gzip only
+    brotli = None
+
+COMPRESS_MIN_BYTES = int(os.getenv("COMPRESS_MIN_BYTES", "1024"))
+# Dynamic responses: mid-range levels give most of the ratio for far less CPU
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+_COMPRESSIBLE = ("application/json", "text/")
+
+
+def _choose_encoding(accept_encoding: str) -> str | None:
+    """br or gzip if the client accepts it (q > 0), else None."""
+    accepted = set()
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        q = params.strip().removeprefix("q=")
+        if params and q.replace(".", "", 1).isdigit() and float(q) == 0:
+            continue
+        accepted.add(coding.strip())
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted or "*" in accepted:
+        return "gzip"
+    return None
+
+
+def _compress(encoding: str, body: bytes) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL)
+
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp, minimum_size: int = COMPRESS_MIN_BYTES):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = _choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Message | None = None
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message  # held until the body shows whether to compress
+                return
+            if start is None:
+                await send(message)
+                return
+            held, start = start, None
+            headers = MutableHeaders(raw=held["headers"])
+            body = message.get("body", b"")
+            if (
+                message["type"] != "http.response.body"
+                or message.get("more_body", False)
+                or len(body) < self.minimum_size
+                or "content-encoding" in headers
+                or not headers.get("content-type", "").startswith(_COMPRESSIBLE)
+            ):
+                await send(held)
+                await send(message)
+                return
+            body = _compress(encoding, body)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(body))
+            headers.add_vary_header("Accept-Encoding")
+            await send(held)
+            await send({**message, "body": body})
+
+        await self.app(scope, receive, send_compressed)
@@ -1,23 +1,74 @@
-"""Free-tier rate limiting — 10 chat messages per calendar day."""
+"""Free-tier rate limiting — 10 chat messages per calendar day.
+
+Each chat request takes one unit from an atomic per-user-per-day counter
+in jumns-usage. Pro/access-code holders are recognized through the cached
+EntitlementService and skip the counter entirely; users already exhausted
+for today are rejected without a DynamoDB call. check_rate_limit returns
+the day it charged, and a refund goes back to that day's counter even if
+the request finished after midnight.
+"""
 
 from __future__ import annotations
 
+import logging
 from datetime import datetime, timezone
 
-from app.db.repositories.messages import MessagesRepository
+from app.dependencies import get_usage_repo
+from app.entitlements.entitlement_service import get_entitlement_service
 from app.exceptions import RateLimitExceededError
 
+logger = logging.getLogger(__name__)
+
 FREE_TIER_LIMIT = 10
 
+# Module-level cache — survives across Lambda invocations in the same container.
+# day -> users who hit the limit that day; only the current day is kept.
+_exhausted: dict[str, set[str]] = {}
+
+
+def _today() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+
+def _mark_exhausted(user_id: str, day: str) -> None:
+    if day not in _exhausted:
+        _exhausted.clear()  # a new day: earlier days' entries are stale
+    _exhausted.setdefault(day, set()).add(user_id)
+
 
-async def check_rate_limit(user_id: str) -> None:
+async def check_rate_limit(user_id: str) -> str | None:
     """Raise RateLimitExceededError if free-tier daily limit is reached.
 
-    Pro subscribers and access-code holders get unlimited messages.
-    For MVP, we just count messages — subscription check comes later.
+    Pro subscribers and access-code holders get unlimited messages and
+    None is returned. Otherwise one message is consumed from today's
+    counter and the day charged is returned, for refund_rate_limit.
     """
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    repo = MessagesRepository()
-    count = repo.count_user_messages_today(user_id, today)
-    if count >= FREE_TIER_LIMIT:
+    if await get_entitlement_service().is_unlimited(user_id):
+        return None
+
+    today = _today()
+    if user_id in _exhausted.get(today, ()):
+        raise RateLimitExceededError(FREE_TIER_LIMIT)
+
+    count = get_usage_repo().increment_daily_messages(
+        user_id, today, FREE_TIER_LIMIT,
+    )
+    if count is None:
+        _mark_exhausted(user_id, today)
         raise RateLimitExceededError(FREE_TIER_LIMIT)
+    return today
+
+
+async def refund_rate_limit(user_id: str, day: str | None) -> None:
+    """Return the message check_rate_limit took on ``day`` (best-effort).
+
+    ``day`` is check_rate_limit's return value; None means nothing was
+    charged.
+    """
+    if day is None:
+        return
+    try:
+        get_usage_repo().refund_daily_message(user_id, day)
+        _exhausted.get(day, set()).discard(user_id)
+    except Exception:
+        logger.warning("Rate limit refund failed for user %s", user_id)
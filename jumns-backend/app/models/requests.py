@@ -70,6 +70,24 @@ class SnoozeReminderRequest(BaseModel):
     minutes: int = Field(30, ge=5, le=1440)  # 5 min to 24 hours
 
 
+class CreateCronJobRequest(BaseModel):
+    name: str = "Untitled Job"
+    description: str = ""
+    enabled: bool = True
+    schedule_type: str = Field("daily", alias="scheduleType")
+    schedule_value: str = Field("08:00", alias="scheduleValue")
+    action_message: str = Field(..., min_length=1, alias="actionMessage")
+
+
+class UpdateCronJobRequest(BaseModel):
+    name: str | None = None
+    description: str | None = None
+    enabled: bool | None = None
+    schedule_type: str | None = Field(None, alias="scheduleType")
+    schedule_value: str | None = Field(None, alias="scheduleValue")
+    action_message: str | None = Field(None, alias="actionMessage")
+
+
 class CreateSkillRequest(BaseModel):
     name: str = Field(..., min_length=1)
     type: str = "mcp"
@@ -1,5 +1,7 @@
 """Pydantic response models — camelCase JSON for Flutter."""
 
+from typing import Any, Iterable
+
 from pydantic import BaseModel, ConfigDict
 from pydantic.alias_generators import to_camel
 
@@ -11,6 +13,57 @@ class CamelModel(BaseModel):
     )
 
 
+class ItemView:
+    """Pre-built DynamoDB item -> camelCase response dict for one model.
+
+    Each field is read from the first of its ``sources`` present on the
+    item (default: the camelCase name, which is how items are stored),
+    else takes its ``defaults`` entry or the model's default. List routes
+    return ``view.many(items)`` (app.routes.bulk) without building a model
+    per item; single-item routes ``Model.model_validate(view(item))``.
+
+    For items the repositories write, both give the same JSON
+    (tests/test_item_views.py). The view does not validate, though:
+
+    - a required field with no source and no ``defaults`` entry is null,
+      where the model raises ValidationError;
+    - values are passed through as stored, with no type coercion (a
+      Decimal is written as a JSON number by app.serialization, a
+      mistyped attribute is returned as it is).
+    """
+
+    def __init__(
+        self,
+        model: type[CamelModel],
+        sources: dict[str, tuple[str, ...]] | None = None,
+        defaults: dict[str, Any] | None = None,
+    ):
+        sources = sources or {}
+        defaults = defaults or {}
+        self._fields: list[tuple[str, tuple[str, ...], Any]] = []
+        for name, field in model.model_fields.items():
+            alias = field.alias or name
+            if name in defaults:
+                default = defaults[name]
+            else:
+                default = None if field.is_required() else field.default
+            self._fields.append((alias, sources.get(name, (alias,)), default))
+
+    def __call__(self, item: dict) -> dict:
+        out = {}
+        for alias, keys, default in self._fields:
+            for key in keys:
+                if key in item:
+                    out[alias] = item[key]
+                    break
+            else:
+                out[alias] = default
+        return out
+
+    def many(self, items: Iterable[dict]) -> list[dict]:
+        return [self(item) for item in items]
+
+
 class MessageResponse(CamelModel):
     id: str
     user_id: str
@@ -19,6 +72,7 @@ class MessageResponse(CamelModel):
     content: str | None = None
     card_type: str | None = None
     card_data: dict | None = None
+    proactive: bool = False
     timestamp: str
     created_at: str | None = None
 
@@ -67,7 +121,26 @@ class ReminderResponse(CamelModel):
     snooze_count: int = 0
     snoozed_until: str | None = None
     original_time: str | None = None
+    next_fire_at: str | None = None
+    created_at: str | None = None
+
+
+class CronJobResponse(CamelModel):
+    id: str
+    user_id: str
+    name: str
+    description: str = ""
+    enabled: bool = True
+    schedule_type: str
+    schedule_value: str = ""
+    action_message: str = ""
+    timezone: str = "UTC"
+    next_run_at: str | None = None
+    last_run_at: str | None = None
+    run_count: int = 0
+    last_status: str | None = None
     created_at: str | None = None
+    updated_at: str | None = None
 
 
 class SkillResponse(CamelModel):
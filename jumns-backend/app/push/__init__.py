@@ -0,0 +1,97 @@
+"""Real-time push of entity changes and proactive cards.
+
+Every write through a repository with a ``collection`` publishes a change
+event for the user (app.db.base_repository.touch_collection), and
+proactive messages publish a card event with the message itself. Events
+go to the broker chosen by PUSH_BROKER:
+
+    apigateway  (default when PUSH_ENDPOINT is set) API Gateway WebSocket
+                connections recorded by app.handlers.push. Events are
+                buffered per user and posted on flush(): after each HTTP
+                request and after each scheduler delivery.
+    local       in-process subscribers (local_server.py, or app.main under
+                uvicorn), delivered at once on the /api/push WebSocket.
+    none        (default otherwise) events are dropped.
+
+Each WebSocket frame is one JSON event:
+
+    {"type": "change", "collection": "tasks", "ids": ["..."], "version": 7}
+    {"type": "change", "collection": "tasks", "version": 8}
+    {"type": "card", "message": {...}}
+
+``ids`` lists at most MAX_EVENT_IDS changed items. A bulk write (delete
+all messages, a batch put, rescheduling every reminder) touching more
+sends the change without ``ids``, meaning "refetch the collection": one
+frame must stay under API Gateway's 128 KB WebSocket limit.
+
+A change's ``version`` is the collection version behind the list ETags
+(app.routes.conditional): a client holding W/"tasks.7" is already
+current; otherwise it re-polls the list with If-None-Match or ?since=.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+
+from app.serialization import dumps
+
+logger = logging.getLogger(__name__)
+
+PUSH_ENDPOINT = os.getenv("PUSH_ENDPOINT", "")
+PUSH_BROKER = os.getenv("PUSH_BROKER", "apigateway" if PUSH_ENDPOINT else "none")
+
+
+# Changed ids one change event may list (~40 bytes each)
+MAX_EVENT_IDS = 100
+
+
+def change_event(collection: str, ids: list[str] | None, version: int | None = None) -> dict:
+    """A change event; ``ids`` is left out (refetch) past MAX_EVENT_IDS."""
+    if ids is None or len(ids) > MAX_EVENT_IDS:
+        return {"type": "change", "collection": collection, "version": version}
+    return {"type": "change", "collection": collection, "ids": ids, "version": version}
+
+
+def card_event(message: dict) -> dict:
+    return {"type": "card", "message": message}
+
+
+def encode(event: dict) -> str:
+    """One event as a WebSocket text frame."""
+    return dumps(event).decode()
+
+
+def create_broker():
+    """The broker for PUSH_BROKER (None for ``none``)."""
+    if PUSH_BROKER == "local":
+        from app.push.local import LocalBroker
+
+        return LocalBroker()
+    if PUSH_BROKER == "apigateway":
+        from app.push.apigateway import ApiGatewayBroker
+
+        return ApiGatewayBroker(PUSH_ENDPOINT)
+    return None
+
+
+def publish(user_id: str, event: dict) -> None:
+    """Send ``event`` to the user's connected clients (best effort)."""
+    from app.dependencies import get_push_broker
+
+    broker = get_push_broker()
+    if broker is not None:
+        broker.publish(user_id, event)
+
+
+def flush(user_id: str | None = None) -> None:
+    """Deliver buffered events — one user's, or everyone's."""
+    from app.dependencies import get_push_broker
+
+    broker = get_push_broker()
+    if broker is None:
+        return
+    try:
+        broker.flush(user_id)
+    except Exception:
+        logger.exception("Push flush failed")
@@ -0,0 +1,92 @@
+"""Push broker over API Gateway WebSocket connections.
+
+app.handlers.push records each connection under its user (usage table);
+this broker buffers a user's events and posts them to every recorded
+connection through the API Gateway Management API. Change events for the
+same collection are merged, so an agent turn that writes ten tasks sends
+one frame; past MAX_EVENT_IDS the merged event drops its ids (refetch).
+Connections API Gateway reports as gone are forgotten.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+
+from app.push import MAX_EVENT_IDS, encode
+
+logger = logging.getLogger(__name__)
+
+
+class ApiGatewayBroker:
+    def __init__(self, endpoint: str):
+        self._endpoint = endpoint
+        self._client = None
+        self._pending: dict[str, list[dict]] = {}
+        self._lock = threading.Lock()
+
+    def _management_client(self):
+        if self._client is None:
+            import boto3
+
+            from app.db.connection import client_config
+            from app.tracing import instrument_boto_client
+
+            client = boto3.client(
+                "apigatewaymanagementapi",
+                endpoint_url=self._endpoint,
+                config=client_config(),
+            )
+            instrument_boto_client(client)
+            self._client = client
+        return self._client
+
+    def publish(self, user_id: str, event: dict) -> None:
+        with self._lock:
+            events = self._pending.setdefault(user_id, [])
+            if event["type"] == "change":
+                for queued in events:
+                    if queued["type"] == "change" and queued["collection"] == event["collection"]:
+                        ids = None
+                        if "ids" in queued and "ids" in event:
+                            ids = list(dict.fromkeys(queued["ids"] + event["ids"]))
+                        if ids is None or len(ids) > MAX_EVENT_IDS:
+                            queued.pop("ids", None)
+                        else:
+                            queued["ids"] = ids
+                        queued["version"] = max(
+                            queued["version"] or 0, event["version"] or 0,
+                        ) or None
+                        return
+                event = dict(event)
+            events.append(event)
+
+    def flush(self, user_id: str | None = None) -> None:
+        with self._lock:
+            if user_id is None:
+                pending, self._pending = self._pending, {}
+            else:
+                pending = {user_id: self._pending.pop(user_id, [])}
+        for uid, events in pending.items():
+            if events:
+                self._deliver(uid, events)
+
+    def _deliver(self, user_id: str, events: list[dict]) -> None:
+        from app.dependencies import get_usage_repo
+
+        usage = get_usage_repo()
+        connection_ids = usage.list_push_connections(user_id)
+        if not connection_ids:
+            return
+        client = self._management_client()
+        frames = [encode(event).encode() for event in events]
+        for connection_id in connection_ids:
+            for frame in frames:
+                try:
+                    client.post_to_connection(ConnectionId=connection_id, Data=frame)
+                except client.exceptions.GoneException:
+                    usage.remove_push_connection(connection_id, user_id)
+                    break
+                except Exception:
+                    logger.exception("Push to %s failed", connection_id)
+                    break
@@ -0,0 +1,68 @@
+"""In-process push broker for local development.
+
+Subscribers are WebSocket connections served by this process; publish()
+delivers immediately from any thread, onto each subscriber's event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+
+from app.push import encode
+
+logger = logging.getLogger(__name__)
+
+# Events a slow client may fall behind by before new ones are dropped
+QUEUE_SIZE = 256
+
+
+class LocalBroker:
+    def __init__(self):
+        self._subscribers: dict[str, set[tuple[asyncio.AbstractEventLoop, asyncio.Queue]]] = {}
+        self._lock = threading.Lock()
+
+    def publish(self, user_id: str, event: dict) -> None:
+        frame = encode(event)
+        with self._lock:
+            subscribers = list(self._subscribers.get(user_id, ()))
+        for loop, queue in subscribers:
+            loop.call_soon_threadsafe(self._offer, queue, frame)
+
+    def flush(self, user_id: str | None = None) -> None:
+        """Nothing is buffered locally."""
+
+    @staticmethod
+    def _offer(queue: asyncio.Queue, frame: str) -> None:
+        try:
+            queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            logger.warning("Push queue full; dropping an event")
+
+    def subscribers(self, user_id: str) -> int:
+        with self._lock:
+            return len(self._subscribers.get(user_id, ()))
+
+    async def serve(self, websocket, user_id: str) -> None:
+        """Stream the user's events to an accepted-on-entry WebSocket.
+
+        Incoming frames are ignored; returns when the client disconnects.
+        """
+        await websocket.accept()
+        subscriber = (asyncio.get_running_loop(), asyncio.Queue(QUEUE_SIZE))
+        with self._lock:
+            self._subscribers.setdefault(user_id, set()).add(subscriber)
+
+        async def send() -> None:
+            while True:
+                await websocket.send_text(await subscriber[1].get())
+
+        sender = asyncio.create_task(send())
+        try:
+            while (await websocket.receive())["type"] != "websocket.disconnect":
+                pass
+        finally:
+            sender.cancel()
+            with self._lock:
+                self._subscribers.get(user_id, set()).discard(subscriber)
@@ -2,7 +2,8 @@
 
 from fastapi import APIRouter, Request
 
-from app.db.repositories.access_codes import AccessCodesRepository
+from app.routes.deps import AccessCodesRepo
+from app.entitlements.entitlement_service import get_entitlement_service
 from app.models.requests import ActivateCodeRequest
 from app.models.responses import AccessCodeStatusResponse, ErrorResponse
 
@@ -11,16 +12,19 @@ router = APIRouter(prefix="/access-code", tags=["access-code"])
 
 @router.get("/status")
 async def get_status(request: Request) -> AccessCodeStatusResponse:
-    repo = AccessCodesRepository()
-    activated = repo.get_activation_status(request.state.user_id)
-    return AccessCodeStatusResponse(activated=activated)
+    entitlement = await get_entitlement_service().get_entitlement(
+        request.state.user_id
+    )
+    return AccessCodeStatusResponse(activated=entitlement["accessCode"])
 
 
 @router.post("/activate")
-async def activate_code(request: Request, body: ActivateCodeRequest):
-    repo = AccessCodesRepository()
+async def activate_code(
+    request: Request, body: ActivateCodeRequest, repo: AccessCodesRepo,
+):
     success = repo.activate_code(request.state.user_id, body.code)
     if success:
+        get_entitlement_service().invalidate(request.state.user_id)
         return AccessCodeStatusResponse(activated=True)
     from fastapi.responses import JSONResponse
     return JSONResponse(
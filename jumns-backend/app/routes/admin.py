@@ -0,0 +1,53 @@
+"""Routes for /api/admin — operator views (ADMIN_USER_IDS only)."""
+
+import os
+from datetime import datetime, timezone
+
+from fastapi import APIRouter, Request
+
+from app.agent.usage import summarize_usage, user_usage_report
+from app.routes.deps import UsageRepo
+from app.exceptions import ForbiddenError
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+# Comma-separated Cognito subs allowed to use these routes
+ADMIN_USER_IDS = {
+    u.strip() for u in os.getenv("ADMIN_USER_IDS", "").split(",") if u.strip()
+}
+
+
+def _require_admin(request: Request) -> None:
+    if request.state.user_id not in ADMIN_USER_IDS:
+        raise ForbiddenError()
+
+
+@router.get("/usage")
+async def usage_by_day(
+    request: Request, repo: UsageRepo, day: str | None = None, limit: int = 50,
+) -> dict:
+    """Agent usage for one UTC day: totals plus the top users by tokens."""
+    _require_admin(request)
+    day = day or datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    items = repo.list_agent_usage_for_day(day)
+    users = sorted(
+        (
+            {
+                "userId": item.get("forUser", item["usageKey"].split("#", 1)[-1]),
+                **summarize_usage([item])["totals"],
+            }
+            for item in items
+        ),
+        key=lambda u: u.get("inputTokens", 0) + u.get("outputTokens", 0),
+        reverse=True,
+    )
+    report = summarize_usage(items)
+    report.update({"day": day, "userCount": len(users), "topUsers": users[:limit]})
+    return report
+
+
+@router.get("/usage/{user_id}")
+async def usage_for_user(request: Request, user_id: str, days: int = 7) -> dict:
+    """One user's agent usage over the last ``days`` days."""
+    _require_admin(request)
+    return user_usage_report(user_id, days)
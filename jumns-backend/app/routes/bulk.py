@@ -0,0 +1,36 @@
+"""Bulk list responses without per-item Pydantic models.
+
+A list route maps its items with a pre-built ItemView
+(app.models.responses) and returns bulk_response(...). That skips
+building and validating one response model per item and FastAPI's
+re-serialisation of them, which dominate CPU for lists of hundreds of
+items; the JSON is the same. Keep ``response_model=`` on the route so
+the schema is still documented.
+"""
+
+from typing import Any
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+
+from app.serialization import dumps
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with app.serialization.dumps (orjson)."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def bulk_response(content: Any, response: Response | None = None) -> FastJSONResponse:
+    """``content`` as JSON, with the headers dependencies set on ``response``.
+
+    Returning a Response bypasses FastAPI's copying of headers from the
+    injected one (the ETag from app.routes.conditional, say), so they are
+    copied here.
+    """
+    rendered = FastJSONResponse(content)
+    if response is not None:
+        rendered.raw_headers.extend(response.raw_headers)
+    return rendered
@@ -2,9 +2,9 @@
 
 from fastapi import APIRouter, Request
 
-from app.agent.agent_service import AgentService
 from app.db.base_repository import utc_now_iso, new_id
-from app.middleware.rate_limiter import check_rate_limit
+from app.routes.deps import Agent
+from app.middleware.rate_limiter import check_rate_limit, refund_rate_limit
 from app.models.requests import ChatRequest
 from app.models.responses import MessageResponse
 
@@ -12,17 +12,21 @@ router = APIRouter(tags=["chat"])
 
 
 @router.post("/chat")
-async def chat(request: Request, body: ChatRequest) -> MessageResponse:
+async def chat(request: Request, body: ChatRequest, agent: Agent) -> MessageResponse:
     """Send a message to the AI agent and get a response."""
     user_id = request.state.user_id
 
     # Rate limiting — 10 msgs/day for free users
-    await check_rate_limit(user_id)
+    charged_day = await check_rate_limit(user_id)
 
     # Invoke the agent (returns dict with content, cardType, cardData)
     # Messages are persisted inside agent_service.invoke()
-    agent = AgentService()
-    result = await agent.invoke(user_id, body.message)
+    try:
+        result = await agent.invoke(user_id, body.message)
+    except Exception:
+        # Failed turns don't count against the daily allowance
+        await refund_rate_limit(user_id, charged_day)
+        raise
 
     now = utc_now_iso()
     return MessageResponse(
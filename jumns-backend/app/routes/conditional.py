@@ -0,0 +1,73 @@
+"""Conditional GET and ?since= deltas for the polled list endpoints.
+
+Every write through a repository with a ``collection`` bumps the user's
+version of it (UsageRepository.touch_collection). A list route declares
+``since: GoalsSince`` (app.routes.deps), which before any item is read:
+
+- sends ``ETag: W/"goals.<version>"`` and answers a matching
+  If-None-Match with 304 — one consistent GetItem instead of a
+  partition read and re-serialisation;
+- resolves ``?since=<ISO time>`` to the bound the repository filters on,
+  so only items created or updated after it are returned. Deletions
+  cannot be expressed that way, so after a delete the full list is sent.
+  ``X-Delta: changes|full`` tells the client to merge or replace, and
+  ``X-Sync-Time`` is the ``since`` to send on its next poll.
+"""
+
+from datetime import datetime, timedelta, timezone
+
+from fastapi import Query, Request, Response
+
+from app.dependencies import get_usage_repo
+from app.exceptions import NotModifiedError
+
+# X-Sync-Time trails the read, so writes still in flight while the list
+# was read are picked up by the next delta (at worst twice)
+SYNC_OVERLAP = timedelta(seconds=10)
+
+
+def _matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak If-None-Match comparison against our ETag."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(",")
+    )
+
+
+def _iso(moment: datetime) -> str:
+    """``moment`` in the format items are stamped with (utc_now_iso)."""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc).isoformat()
+
+
+def conditional(collection: str):
+    """Dependency for a list route over one of the user's collections."""
+
+    async def check(
+        request: Request,
+        response: Response,
+        since: datetime | None = Query(None),
+    ) -> str | None:
+        read_at = datetime.now(timezone.utc)
+        version, deleted_at = get_usage_repo().get_collection_version(
+            request.state.user_id, collection,
+        )
+        etag = f'W/"{collection}.{version}"'
+        if _matches(request.headers.get("if-none-match"), etag):
+            raise NotModifiedError(etag)
+
+        bound = _iso(since) if since else None
+        if bound and deleted_at and deleted_at > bound:
+            bound = None
+        response.headers["ETag"] = etag
+        response.headers["X-Delta"] = "changes" if bound else "full"
+        response.headers["X-Sync-Time"] = _iso(read_at - SYNC_OVERLAP)
+        return bound
+
+    check.__name__ = f"{collection}_since"
+    return check
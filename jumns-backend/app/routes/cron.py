@@ -0,0 +1,85 @@
+"""CRUD routes for /api/cron — user-defined scheduled jobs + run now."""
+
+from fastapi import APIRouter, Request, Response
+from fastapi.responses import JSONResponse
+
+from app.routes.deps import CronJobsRepo, UsersRepo
+from app.models.requests import CreateCronJobRequest, UpdateCronJobRequest
+from app.models.responses import CronJobResponse
+
+router = APIRouter(prefix="/cron", tags=["cron"])
+
+
+def _to_response(item: dict) -> CronJobResponse:
+    return CronJobResponse(
+        id=item.get("id", item.get("jobId", "")),
+        user_id=item["userId"],
+        name=item.get("name", ""),
+        description=item.get("description", ""),
+        enabled=item.get("enabled", True),
+        schedule_type=item.get("scheduleType", ""),
+        schedule_value=item.get("scheduleValue", ""),
+        action_message=item.get("actionMessage", ""),
+        timezone=item.get("timezone", "UTC"),
+        next_run_at=item.get("nextRunAt"),
+        last_run_at=item.get("lastRunAt"),
+        run_count=item.get("runCount", 0),
+        last_status=item.get("lastStatus"),
+        created_at=item.get("createdAt"),
+        updated_at=item.get("updatedAt"),
+    )
+
+
+def _invalid_schedule(exc: ValueError) -> JSONResponse:
+    return JSONResponse(status_code=422, content={"error": f"Invalid schedule: {exc}"})
+
+
+@router.get("/")
+async def list_cron_jobs(
+    request: Request, repo: CronJobsRepo, includeDisabled: bool = False,
+) -> list[CronJobResponse]:
+    jobs = repo.list_all(request.state.user_id, include_disabled=includeDisabled)
+    return [_to_response(j) for j in jobs]
+
+
+@router.post("/")
+async def create_cron_job(
+    request: Request, body: CreateCronJobRequest,
+    repo: CronJobsRepo, users_repo: UsersRepo,
+):
+    user_id = request.state.user_id
+    data = body.model_dump(by_alias=True)
+    data["timezone"] = users_repo.get_settings(user_id).get("timezone", "UTC")
+    try:
+        item = repo.create(user_id, data)
+    except ValueError as exc:
+        return _invalid_schedule(exc)
+    return _to_response(item)
+
+
+@router.patch("/{job_id}")
+async def update_cron_job(
+    request: Request, job_id: str, body: UpdateCronJobRequest, repo: CronJobsRepo,
+):
+    try:
+        item = repo.update(
+            request.state.user_id, job_id,
+            body.model_dump(exclude_none=True, by_alias=True),
+        )
+    except ValueError as exc:
+        return _invalid_schedule(exc)
+    return _to_response(item)
+
+
+@router.delete("/{job_id}")
+async def delete_cron_job(request: Request, job_id: str, repo: CronJobsRepo):
+    repo.delete(request.state.user_id, job_id)
+    return Response(status_code=204)
+
+
+@router.post("/{job_id}/run")
+async def run_cron_job(request: Request, job_id: str, repo: CronJobsRepo) -> dict:
+    """Queue a job to run on the next scheduler tick (within a minute),
+    or once MIN_RUN_INTERVAL has passed since its last run."""
+    item = repo.run_now(request.state.user_id, job_id)
+    return {"queued": True, "job": _to_response(item).model_dump(by_alias=True)}
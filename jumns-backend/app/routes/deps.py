@@ -0,0 +1,81 @@
+"""FastAPI dependencies for the shared repositories and services.
+
+Route handlers declare what they use with these aliases:
+
+    async def list_tasks(request: Request, repo: TasksRepo) -> ...
+
+Each resolves to the process-wide instance from app.dependencies. The
+providers are async so FastAPI does not dispatch them to its threadpool.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Annotated, Callable, TypeVar
+
+from fastapi import Depends
+
+from app.dependencies import (
+    get_access_codes_repo,
+    get_agent_service,
+    get_async_goals_repo,
+    get_async_reminders_repo,
+    get_async_tasks_repo,
+    get_cron_jobs_repo,
+    get_goals_repo,
+    get_insights_repo,
+    get_messages_repo,
+    get_reminders_repo,
+    get_skills_repo,
+    get_tasks_repo,
+    get_usage_repo,
+    get_users_repo,
+)
+from app.db.repositories.access_codes import AccessCodesRepository
+from app.db.repositories.cron_jobs import CronJobsRepository
+from app.db.repositories.goals import AsyncGoalsRepository, GoalsRepository
+from app.db.repositories.insights import InsightsRepository
+from app.db.repositories.messages import MessagesRepository
+from app.db.repositories.reminders import AsyncRemindersRepository, RemindersRepository
+from app.db.repositories.skills import SkillsRepository
+from app.db.repositories.tasks import AsyncTasksRepository, TasksRepository
+from app.db.repositories.usage import UsageRepository
+from app.db.repositories.users import UsersRepository
+from app.routes.conditional import conditional
+
+if TYPE_CHECKING:
+    from app.agent.agent_service import AgentService
+
+T = TypeVar("T")
+
+
+def _depends(getter: Callable[[], T]):
+    """Depends() on an async wrapper around ``getter``."""
+    async def provide() -> T:
+        return getter()
+
+    provide.__name__ = getter.__name__
+    return Depends(provide)
+
+
+AccessCodesRepo = Annotated[AccessCodesRepository, _depends(get_access_codes_repo)]
+CronJobsRepo = Annotated[CronJobsRepository, _depends(get_cron_jobs_repo)]
+GoalsRepo = Annotated[GoalsRepository, _depends(get_goals_repo)]
+InsightsRepo = Annotated[InsightsRepository, _depends(get_insights_repo)]
+MessagesRepo = Annotated[MessagesRepository, _depends(get_messages_repo)]
+RemindersRepo = Annotated[RemindersRepository, _depends(get_reminders_repo)]
+SkillsRepo = Annotated[SkillsRepository, _depends(get_skills_repo)]
+TasksRepo = Annotated[TasksRepository, _depends(get_tasks_repo)]
+UsageRepo = Annotated[UsageRepository, _depends(get_usage_repo)]
+UsersRepo = Annotated[UsersRepository, _depends(get_users_repo)]
+AsyncGoalsRepo = Annotated[AsyncGoalsRepository, _depends(get_async_goals_repo)]
+AsyncRemindersRepo = Annotated[AsyncRemindersRepository, _depends(get_async_reminders_repo)]
+AsyncTasksRepo = Annotated[AsyncTasksRepository, _depends(get_async_tasks_repo)]
+Agent = Annotated["AgentService", _depends(get_agent_service)]
+
+# Polled lists (app.routes.conditional): set the ETag, answer 304, and
+# resolve ?since= to the bound to read changes from (None = everything)
+GoalsSince = Annotated[str | None, Depends(conditional("goals"))]
+InsightsSince = Annotated[str | None, Depends(conditional("insights"))]
+MessagesSince = Annotated[str | None, Depends(conditional("messages"))]
+RemindersSince = Annotated[str | None, Depends(conditional("reminders"))]
+TasksSince = Annotated[str | None, Depends(conditional("tasks"))]
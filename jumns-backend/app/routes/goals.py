@@ -1,56 +1,83 @@
-"""CRUD routes for /api/goals."""
+"""CRUD routes for /api/goals + weekly progress."""
+
+from datetime import datetime, timedelta, timezone
 
 from fastapi import APIRouter, Request, Response
 
-from app.db.repositories.goals import GoalsRepository
+from app.routes.bulk import FastJSONResponse, bulk_response
+from app.routes.deps import AsyncGoalsRepo, AsyncTasksRepo, GoalsRepo, GoalsSince
 from app.models.requests import CreateGoalRequest, UpdateGoalRequest
-from app.models.responses import GoalResponse
+from app.models.responses import GoalResponse, ItemView
 
 router = APIRouter(prefix="/goals", tags=["goals"])
 
 
+_VIEW = ItemView(
+    GoalResponse,
+    sources={"id": ("id", "goalId")},
+    defaults={"id": "", "category": "personal"},
+)
+
+
 def _to_response(item: dict) -> GoalResponse:
-    return GoalResponse(
-        id=item.get("id", item.get("goalId", "")),
-        user_id=item["userId"],
-        title=item["title"],
-        category=item.get("category", "personal"),
-        progress=item.get("progress", 0),
-        total=item.get("total", 100),
-        unit=item.get("unit", ""),
-        insight=item.get("insight", ""),
-        active_agent=item.get("activeAgent", ""),
-        completed=item.get("completed", False),
-        created_at=item.get("createdAt"),
-    )
+    return GoalResponse.model_validate(_VIEW(item))
+
+
+@router.get("/", response_model=list[GoalResponse])
+async def list_goals(
+    request: Request, response: Response, repo: AsyncGoalsRepo, since: GoalsSince,
+) -> FastJSONResponse:
+    items = await repo.list_all(request.state.user_id, since=since)
+    return bulk_response(_VIEW.many(items), response)
 
 
-@router.get("/")
-async def list_goals(request: Request) -> list[GoalResponse]:
-    repo = GoalsRepository()
-    items = repo.list_all(request.state.user_id)
-    return [_to_response(i) for i in items]
+@router.get("/weekly-progress")
+async def weekly_progress(request: Request, repo: AsyncTasksRepo) -> dict:
+    """Completed-task counts per day of the current week (Mon-Sun).
+
+    Reads only this week's slice of the TasksByDueDate index.
+    """
+    now = datetime.now(timezone.utc)
+    monday = (now - timedelta(days=now.weekday())).date()
+    days = [(monday + timedelta(days=i)).isoformat() for i in range(7)]
+
+    tasks = await repo.list_due_between(request.state.user_id, days[0], days[-1])
+
+    counts = [0] * 7  # Mon=0 .. Sun=6
+    for t in tasks:
+        if not t.get("completed"):
+            continue
+        day = t.get("dueDate", "")[:10]
+        if day in days:
+            counts[days.index(day)] += 1
+
+    total = sum(counts)
+    return {
+        "counts": counts,
+        "total": total,
+        "bestDay": counts.index(max(counts)) if total > 0 else -1,
+        "weekStart": days[0],
+    }
 
 
 @router.get("/{goal_id}")
-async def get_goal(request: Request, goal_id: str) -> GoalResponse:
-    repo = GoalsRepository()
-    item = repo.get(request.state.user_id, goal_id)
+async def get_goal(request: Request, goal_id: str, repo: AsyncGoalsRepo) -> GoalResponse:
+    item = await repo.get(request.state.user_id, goal_id)
     return _to_response(item)
 
 
 @router.post("/")
-async def create_goal(request: Request, body: CreateGoalRequest) -> GoalResponse:
-    repo = GoalsRepository()
+async def create_goal(
+    request: Request, body: CreateGoalRequest, repo: GoalsRepo,
+) -> GoalResponse:
     item = repo.create(request.state.user_id, body.model_dump())
     return _to_response(item)
 
 
 @router.patch("/{goal_id}")
 async def update_goal(
-    request: Request, goal_id: str, body: UpdateGoalRequest
+    request: Request, goal_id: str, body: UpdateGoalRequest, repo: GoalsRepo,
 ) -> GoalResponse:
-    repo = GoalsRepository()
     item = repo.update(
         request.state.user_id, goal_id, body.model_dump(exclude_none=True)
     )
@@ -58,7 +85,6 @@ async def update_goal(
 
 
 @router.delete("/{goal_id}")
-async def delete_goal(request: Request, goal_id: str):
-    repo = GoalsRepository()
+async def delete_goal(request: Request, goal_id: str, repo: GoalsRepo):
     repo.delete(request.state.user_id, goal_id)
     return Response(status_code=204)
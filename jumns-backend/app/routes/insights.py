@@ -1,30 +1,28 @@
-"""Routes for /api/insights — list insights + trigger proactive engine."""
+"""Routes for /api/insights — list insights, trigger proactive engine, usage."""
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Request, Response
 
-from app.agent.agent_service import AgentService
-from app.db.repositories.insights import InsightsRepository
-from app.models.responses import InsightResponse
+from app.agent.usage import user_usage_report
+from app.dependencies import get_agent_service
+from app.models.responses import InsightResponse, ItemView
+from app.routes.bulk import FastJSONResponse, bulk_response
+from app.routes.deps import InsightsRepo, InsightsSince
 
 router = APIRouter(prefix="/insights", tags=["insights"])
 
 
-def _to_response(item: dict) -> InsightResponse:
-    return InsightResponse(
-        id=item.get("id", ""),
-        user_id=item["userId"],
-        type=item.get("type", "general"),
-        title=item.get("title", ""),
-        content=item.get("content", ""),
-        related_goal_id=item.get("relatedGoalId"),
-        created_at=item.get("createdAt"),
-    )
+_VIEW = ItemView(
+    InsightResponse,
+    defaults={"id": "", "type": "general", "title": "", "content": ""},
+)
 
 
-@router.get("/")
-async def list_insights(request: Request) -> list[InsightResponse]:
-    repo = InsightsRepository()
-    return [_to_response(i) for i in repo.list_all(request.state.user_id)]
+@router.get("/", response_model=list[InsightResponse])
+async def list_insights(
+    request: Request, response: Response, repo: InsightsRepo, since: InsightsSince,
+) -> FastJSONResponse:
+    items = repo.list_all(request.state.user_id, since=since)
+    return bulk_response(_VIEW.many(items), response)
 
 
 @router.post("/run")
@@ -34,7 +32,7 @@ async def trigger_proactive(request: Request) -> dict:
     Runs plan_review + smart_suggestions and returns any generated content.
     """
     user_id = request.state.user_id
-    agent = AgentService()
+    agent = get_agent_service()  # the agent stack loads on first use
     results = []
 
     for prompt_type in ("plan_review", "smart_suggestions"):
@@ -51,3 +49,9 @@ async def trigger_proactive(request: Request) -> dict:
             pass
 
     return {"triggered": True, "results": results}
+
+
+@router.get("/usage")
+async def usage_stats(request: Request, days: int = 7) -> dict:
+    """The current user's assistant usage over the last ``days`` days."""
+    return user_usage_report(request.state.user_id, days, include_cost=False)
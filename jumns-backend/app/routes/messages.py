@@ -1,36 +1,74 @@
-"""Routes for /api/messages — list and delete-all."""
+"""Routes for /api/messages — list (paged, optionally without cardData),
+get one, and delete-all.
 
-from fastapi import APIRouter, Request, Response
+``?limit=N`` (default DEFAULT_PAGE_SIZE) returns the newest N messages
+(still oldest first) and, when there are older ones, an ``X-Next-Cursor``
+header: pass it back as ``?before=`` for the page before. The last page
+has no cursor. ``?cardData=false`` leaves every
+message's cardData out (null); cards keep their cardType, and
+GET /api/messages/{id}?createdAt=... fetches one in full.
+"""
 
-from app.db.repositories.messages import MessagesRepository
-from app.models.responses import MessageResponse
+from fastapi import APIRouter, Query, Request, Response
+
+from app.routes.bulk import FastJSONResponse, bulk_response
+from app.routes.deps import MessagesRepo, MessagesSince
+from app.models.responses import ItemView, MessageResponse
 
 router = APIRouter(prefix="/messages", tags=["messages"])
 
+DEFAULT_PAGE_SIZE = 200
+MAX_PAGE_SIZE = 500
+
+_VIEW = ItemView(
+    MessageResponse,
+    sources={"timestamp": ("timestamp", "createdAt")},
+    defaults={"id": "", "role": "user", "type": "text", "timestamp": ""},
+)
+# Same, with cardData never read
+_VIEW_WITHOUT_CARD_DATA = ItemView(
+    MessageResponse,
+    sources={"timestamp": ("timestamp", "createdAt"), "card_data": ()},
+    defaults={"id": "", "role": "user", "type": "text", "timestamp": ""},
+)
+
 
-def _to_response(item: dict) -> MessageResponse:
-    return MessageResponse(
-        id=item.get("id", ""),
-        user_id=item["userId"],
-        role=item.get("role", "user"),
-        type=item.get("type", "text"),
-        content=item.get("content"),
-        card_type=item.get("cardType"),
-        card_data=item.get("cardData"),
-        timestamp=item.get("timestamp", item.get("createdAt", "")),
-        created_at=item.get("createdAt"),
-    )
+@router.get("/", response_model=list[MessageResponse])
+async def list_messages(
+    request: Request,
+    response: Response,
+    repo: MessagesRepo,
+    since: MessagesSince,
+    cardType: str | None = Query(None),
+    cardData: bool = Query(True),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    before: str | None = Query(None),
+) -> FastJSONResponse:
+    if cardType:
+        items = repo.list_cards(request.state.user_id, cardType, limit=limit, since=since)
+    else:
+        items, cursor = repo.list_page(
+            request.state.user_id, limit, since=since, before=before,
+        )
+        if cursor:
+            response.headers["X-Next-Cursor"] = cursor
+    view = _VIEW if cardData else _VIEW_WITHOUT_CARD_DATA
+    return bulk_response(view.many(items), response)
 
 
-@router.get("/")
-async def list_messages(request: Request) -> list[MessageResponse]:
-    repo = MessagesRepository()
-    items = repo.list_messages(request.state.user_id)
-    return [_to_response(i) for i in items]
+@router.get("/{message_id}", response_model=MessageResponse)
+async def get_message(
+    request: Request,
+    message_id: str,
+    repo: MessagesRepo,
+    createdAt: str | None = Query(None),
+) -> FastJSONResponse:
+    item = repo.get_message(request.state.user_id, message_id, created_at=createdAt)
+    # Same encoding as the list, so cardData numbers match
+    return bulk_response(_VIEW(item))
 
 
 @router.delete("/")
-async def delete_all_messages(request: Request):
-    repo = MessagesRepository()
+async def delete_all_messages(request: Request, repo: MessagesRepo):
     repo.delete_all_messages(request.state.user_id)
     return Response(status_code=204)
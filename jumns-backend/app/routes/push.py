@@ -0,0 +1,30 @@
+"""WebSocket /api/push — the in-process push channel (PUSH_BROKER=local).
+
+Deployed stages push through API Gateway WebSockets (app.handlers.push),
+so without a local broker the socket is closed. Browsers cannot set
+headers on a WebSocket, so the Cognito JWT comes as ?token=.
+"""
+
+from fastapi import APIRouter, WebSocket
+
+from app.dependencies import get_push_broker
+from app.middleware.auth import decode_token
+from app.push.local import LocalBroker
+
+router = APIRouter(prefix="/push", tags=["push"])
+
+
+@router.websocket("")
+async def push_events(websocket: WebSocket, token: str = ""):
+    broker = get_push_broker()
+    if not isinstance(broker, LocalBroker):
+        await websocket.close(code=1011)
+        return
+    try:
+        user_id = decode_token(token).get("sub")
+    except Exception:  # jose.JWTError and JWKS fetch failures
+        user_id = None
+    if not user_id:
+        await websocket.close(code=1008)
+        return
+    await broker.serve(websocket, user_id)
@@ -2,7 +2,7 @@
 
 from fastapi import APIRouter, Request
 
-from app.db.repositories.users import UsersRepository
+from app.routes.deps import RemindersRepo, UsersRepo
 from app.models.requests import UserSettingsRequest
 from app.models.responses import UserSettingsResponse
 
@@ -21,8 +21,7 @@ def _to_response(data: dict) -> UserSettingsResponse:
 
 
 @router.get("/")
-async def get_settings(request: Request) -> UserSettingsResponse:
-    repo = UsersRepository()
+async def get_settings(request: Request, repo: UsersRepo) -> UserSettingsResponse:
     data = repo.get_settings(request.state.user_id)
     return _to_response(data)
 
@@ -30,9 +29,11 @@ async def get_settings(request: Request) -> UserSettingsResponse:
 @router.post("/")
 async def upsert_settings(
     request: Request, body: UserSettingsRequest,
+    repo: UsersRepo, reminders_repo: RemindersRepo,
 ) -> UserSettingsResponse:
-    repo = UsersRepository()
-    data = repo.upsert_settings(
-        request.state.user_id, body.model_dump(exclude_none=True),
-    )
+    updates = body.model_dump(exclude_none=True, by_alias=True)
+    data = repo.upsert_settings(request.state.user_id, updates)
+    # Reminder fire times are local to the user's timezone and default times
+    if {"timezone", "morningTime", "eveningTime"} & updates.keys():
+        reminders_repo.reschedule_all(request.state.user_id, data)
     return _to_response(data)
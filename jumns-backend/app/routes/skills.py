@@ -2,7 +2,7 @@
 
 from fastapi import APIRouter, Request, Response
 
-from app.db.repositories.skills import SkillsRepository
+from app.routes.deps import SkillsRepo
 from app.models.requests import CreateSkillRequest, UpdateSkillRequest
 from app.models.responses import SkillResponse
 
@@ -23,22 +23,21 @@ def _to_response(item: dict) -> SkillResponse:
 
 
 @router.get("/")
-async def list_skills(request: Request) -> list[SkillResponse]:
-    repo = SkillsRepository()
+async def list_skills(request: Request, repo: SkillsRepo) -> list[SkillResponse]:
     return [_to_response(i) for i in repo.list_all(request.state.user_id)]
 
 
 @router.post("/")
-async def create_skill(request: Request, body: CreateSkillRequest) -> SkillResponse:
-    repo = SkillsRepository()
+async def create_skill(
+    request: Request, body: CreateSkillRequest, repo: SkillsRepo,
+) -> SkillResponse:
     return _to_response(repo.create(request.state.user_id, body.model_dump()))
 
 
 @router.patch("/{skill_id}")
 async def update_skill(
-    request: Request, skill_id: str, body: UpdateSkillRequest,
+    request: Request, skill_id: str, body: UpdateSkillRequest, repo: SkillsRepo,
 ) -> SkillResponse:
-    repo = SkillsRepository()
     item = repo.update(
         request.state.user_id, skill_id, body.model_dump(exclude_none=True),
     )
@@ -46,7 +45,6 @@ async def update_skill(
 
 
 @router.delete("/{skill_id}")
-async def delete_skill(request: Request, skill_id: str):
-    repo = SkillsRepository()
+async def delete_skill(request: Request, skill_id: str, repo: SkillsRepo):
     repo.delete(request.state.user_id, skill_id)
     return Response(status_code=204)
@@ -0,0 +1,110 @@
+"""Batch precompute of briefing data for the users due in a sweep.
+
+Morning briefings and evening journals used to make the model fetch the
+day through get_daily_summary: a tool round-trip per user, each running
+three sequential queries. For a slot's users this stage instead:
+
+1. loads settings with BatchGetItem,
+2. issues every user's goals / tasks / active-reminders queries in
+   parallel on one bounded pool,
+3. builds all summaries in a single pass (app.agent.daily_summary).
+
+The agent then gets the summary inline in the prompt and the pre-filter
+runs on it, so a briefing needs no tool calls and no extra reads.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+
+from app.agent.daily_summary import build_daily_summary
+from app.dependencies import (
+    get_goals_repo,
+    get_reminders_repo,
+    get_tasks_repo,
+    get_users_repo,
+)
+
+logger = logging.getLogger(__name__)
+
+# Prompt types whose data is precomputed
+BRIEFING_TYPES = ("morning_briefing", "evening_journal")
+
+LOAD_CONCURRENCY = int(os.getenv("BRIEFING_LOAD_CONCURRENCY", "16"))
+
+
+def _local_date(now: datetime, tz_name: str) -> str:
+    try:
+        tz = ZoneInfo(tz_name)
+    except Exception:
+        tz = timezone.utc
+    return now.astimezone(tz).strftime("%Y-%m-%d")
+
+
+def load_entities(
+    user_ids: list[str], max_workers: int = LOAD_CONCURRENCY,
+) -> dict[str, dict[str, list[dict]]]:
+    """Goals, tasks and active reminders for each user, queried in parallel.
+
+    A user whose queries fail is left out of the result.
+    """
+    goals_repo = get_goals_repo()
+    tasks_repo = get_tasks_repo()
+    reminders_repo = get_reminders_repo()
+    loaders = {
+        "goals": goals_repo.list_all,
+        "tasks": tasks_repo.list_all,
+        "reminders": reminders_repo.list_active_reminders,
+    }
+
+    entities: dict[str, dict[str, list[dict]]] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            (uid, kind): pool.submit(load, uid)
+            for uid in user_ids
+            for kind, load in loaders.items()
+        }
+        failed = set()
+        for (uid, kind), future in futures.items():
+            try:
+                entities.setdefault(uid, {})[kind] = future.result()
+            except Exception:
+                logger.exception("Failed to load %s for user %s", kind, uid)
+                failed.add(uid)
+    for uid in failed:
+        entities.pop(uid, None)
+    return entities
+
+
+def precompute_briefings(
+    user_ids: list[str], now: datetime | None = None,
+) -> dict[str, dict]:
+    """{user_id: {"settings": ..., "summary": ...}} for the given users.
+
+    Users whose data could not be loaded are omitted; callers fall back to
+    the per-user path for them.
+    """
+    if not user_ids:
+        return {}
+    now = now or datetime.now(timezone.utc)
+    try:
+        settings = get_users_repo().get_settings_many(user_ids)
+    except Exception:
+        logger.exception("Failed to batch-load user settings")
+        return {}
+    entities = load_entities(user_ids)
+
+    return {
+        uid: {
+            "settings": settings[uid],
+            "summary": build_daily_summary(
+                data["goals"], data["tasks"], data["reminders"],
+                today=_local_date(now, settings[uid]["timezone"]),
+            ),
+        }
+        for uid, data in entities.items()
+    }
@@ -0,0 +1,110 @@
+"""Runs user-defined cron jobs that are due.
+
+Each one-minute tick reads the DueJobs index (one query per fireShard),
+then runs the due jobs on a bounded worker pool. A worker claims its job
+with a versioned update that counts the run and advances nextRunAt (at
+least MIN_RUN_INTERVAL ahead, app.scheduling.cron), then executes the
+job's actionMessage through the agent. Results are posted to the user's
+chat tagged proactiveType="cron".
+
+A run takes one message from the user's daily allowance, like a chat
+turn (app.middleware.rate_limiter): a free user out of messages gets
+lastStatus "rateLimited", and a failed run is refunded. The run budget
+(app.scheduler.sweep_budget) is checked before each claim; jobs left
+unclaimed stay due for the next tick.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from datetime import datetime, timezone
+
+from app.db.table_config import REMINDER_FIRE_SHARDS
+from app.dependencies import get_agent_service, get_cron_jobs_repo
+from app.exceptions import RateLimitExceededError
+from app.middleware.rate_limiter import check_rate_limit, refund_rate_limit
+from app.scheduler.sweep_budget import RunBudget
+from app.scheduler.worker_loops import run_on_worker_loop, worker_pool
+
+logger = logging.getLogger(__name__)
+
+MAX_CONCURRENCY = int(os.getenv("CRON_CONCURRENCY", "4"))
+
+# Job outcome -> results counter
+_TALLY = {
+    "ok": "ran",
+    "silent": "silent",
+    "error": "errors",
+    "rateLimited": "rateLimited",
+    "claimedElsewhere": "claimedElsewhere",
+    "deferred": "deferred",
+}
+
+
+async def _run_job(agent, job: dict) -> str:
+    """Charge and execute one job. Returns "ok" or "silent"."""
+    user_id = job["userId"]
+    charged_day = await check_rate_limit(user_id)
+    try:
+        result = await agent.invoke_scheduled(
+            user_id,
+            job.get("actionMessage", ""),
+            source="cron",
+            extra={"cronJobId": job["jobId"]},
+        )
+    except Exception:
+        await refund_rate_limit(user_id, charged_day)
+        raise
+    return "silent" if result is None else "ok"
+
+
+def _dispatch_job(agent, repo, job: dict, now: datetime, budget: RunBudget) -> str:
+    """Claim and run one job on a worker thread. Returns its outcome."""
+    if budget.exhausted():
+        return "deferred"
+    started = time.monotonic()
+    try:
+        if repo.claim(job, now) is None:
+            return "claimedElsewhere"
+        status = run_on_worker_loop(_run_job(agent, job))
+    except RateLimitExceededError:
+        status = "rateLimited"
+    except Exception:
+        logger.exception("Cron job %s failed for user %s", job["jobId"], job["userId"])
+        status = "error"
+    finally:
+        budget.record(time.monotonic() - started)
+    try:
+        repo.record_status(job["userId"], job["jobId"], status)
+    except Exception:
+        logger.exception("Failed to record status for job %s", job["jobId"])
+    return status
+
+
+def dispatch_due_jobs(now: datetime | None = None, context=None) -> dict:
+    """Claim and run every job due at ``now``. Returns counts for logging."""
+    now = now or datetime.now(timezone.utc)
+    budget = RunBudget(context)
+    repo = get_cron_jobs_repo()
+    results = {"due": 0, **{key: 0 for key in _TALLY.values()}}
+
+    due = []
+    for shard in range(REMINDER_FIRE_SHARDS):
+        try:
+            due.extend(repo.list_due(shard, now))
+        except Exception:
+            logger.exception("Failed to read due cron jobs for shard %s", shard)
+            results["errors"] += 1
+    results["due"] = len(due)
+
+    if due:
+        agent = get_agent_service()
+        with worker_pool(MAX_CONCURRENCY) as pool:
+            outcomes = pool.map(lambda job: _dispatch_job(agent, repo, job, now, budget), due)
+            for outcome in outcomes:
+                results[_TALLY[outcome]] += 1
+
+    logger.info("Cron dispatch: %s", results)
+    return results
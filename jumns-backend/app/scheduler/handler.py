@@ -3,61 +3,296 @@
 Borrowed from OpenClaw's CronService + Projectj's proactive-engine.ts:
 - morning_briefing: daily overview of goals, tasks, reminders
 - evening_journal: reflection prompts based on the day's activity
-- reminder_check: fires every 5 min to check due reminders
+- reminder_check: fires every minute; delivers exactly the due reminders
+  (app.scheduler.reminder_dispatcher, no model call)
 - plan_review: periodic goal adaptation + overdue task rescheduling
 - smart_suggestions: periodic suggestion generation for engagement
+- cron_jobs: fires every minute; runs user-defined cron jobs that are due
+  (app.scheduler.cron_dispatcher)
+
+Morning/evening rules fire hourly; only users whose local morningTime /
+eveningTime falls in the current UTC hour are read, via the UsersBySlot
+GSI. Other prompt types sweep all users with a paginated (optionally
+segmented) scan. Users are processed by a bounded worker pool; large
+sweeps can also be split across Lambda invocations with
+{"shard": i, "totalShards": n} in the event. A sweep checks its run budget
+before each user and, when the invocation runs low on time, defers the
+users not yet started and continues itself with {"resumeAfter": <userId>}
+(see app.scheduler.sweep_budget). Results carry per-sweep throughput metrics.
+
+Morning/evening sweeps first bulk-load every due user's goals, tasks and
+reminders (app.scheduler.briefing_batch) and pass each user's summary to
+the model inline, so briefings make no tool calls.
+
+Duplicate deliveries are suppressed by a per-bucket delivery key and a
+per-user lease (app.scheduler.idempotency); results count them as
+duplicates / leased. Reminder and cron dispatch claim each item with a
+versioned update and report lost claims as claimedElsewhere.
+
+Each user passes a cheap pre-filter (app.agent.proactive_checks) before the
+model is called; results report skipped / silent / delivered counts and
+the skip and deliver ratios for the run.
+
+Delivered cards and the writes behind them are pushed to the user's open
+clients (app.push) as soon as that user finishes, not at the end of the
+sweep.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
+import os
+import time
+import zlib
+from collections import Counter
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING
+
+from app import push
+from app.agent.proactive_checks import ProactiveStats, proactive_stats
+from app.scheduler.briefing_batch import BRIEFING_TYPES, precompute_briefings
+from app.scheduler.cron_dispatcher import dispatch_due_jobs
+from app.scheduler.idempotency import DeliveryGuard
+from app.scheduler.reminder_dispatcher import dispatch_due_reminders
+from app.scheduler.sweep_budget import RunBudget, enqueue_continuation
+from app.scheduler.worker_loops import run_on_worker_loop, worker_pool
+from app.db.base_repository import new_id
+from app.dependencies import get_agent_service, get_users_repo
+from app.tracing import current_context, span, use_context
 
-from app.agent.agent_service import AgentService
-from app.db.repositories.users import UsersRepository
+if TYPE_CHECKING:
+    from app.agent.agent_service import AgentService
 
 logger = logging.getLogger(__name__)
 
+MAX_CONCURRENCY = int(os.getenv("PROACTIVE_CONCURRENCY", "8"))
 
-def _get_eligible_users() -> list[str]:
-    """Query all users from DynamoDB.
+# Users handed to the worker pool at a time
+CHUNK_SIZE = int(os.getenv("PROACTIVE_CHUNK_SIZE", str(MAX_CONCURRENCY * 4)))
 
-    In production, filter by timezone and schedule preferences
-    (morningTime/eveningTime fields on user records).
+# Prompt types tied to a per-user local time slot
+_SLOT_PROMPTS = {
+    "morning_briefing": "morning",
+    "evening_journal": "evening",
+}
+
+
+def _shard_of(user_id: str, total_shards: int) -> int:
+    """Stable shard assignment (crc32, not the per-process salted hash)."""
+    return zlib.crc32(user_id.encode()) % total_shards
+
+
+def _get_eligible_users(
+    prompt_type: str, shard: int = 0, total_shards: int = 1, hour: str | None = None,
+) -> list[str]:
+    """Return the user IDs due for this prompt type in this shard.
+
+    ``hour`` pins the UTC slot hour (continuations keep their sweep's hour).
     """
     try:
-        repo = UsersRepository()
-        # Scan for all users — fine for MVP scale.
-        # For production, use a GSI or maintain a schedule index.
-        items = repo._table.scan(
-            ProjectionExpression="userId",
-            Limit=500,
-        ).get("Items", [])
-        return [item["userId"] for item in items if item.get("userId")]
+        repo = get_users_repo()
+        slot = _SLOT_PROMPTS.get(prompt_type)
+        if slot is None:
+            return repo.list_all_ids(segment=shard, total_segments=total_shards)
+
+        hour = hour or datetime.now(timezone.utc).strftime("%H")
+        user_ids = repo.list_ids_in_slot(slot, hour)
+        if total_shards > 1:
+            user_ids = [u for u in user_ids if _shard_of(u, total_shards) == shard]
+        return user_ids
     except Exception:
         logger.exception("Failed to query eligible users")
         return []
 
 
-def _run_proactive(prompt_type: str) -> dict:
-    """Run proactive agent for all eligible users."""
-    agent = AgentService()
-    user_ids = _get_eligible_users()
-    results = {"processed": 0, "delivered": 0, "errors": 0}
+def _invoke_one(
+    agent: AgentService,
+    user_id: str,
+    prompt_type: str,
+    briefing: dict | None = None,
+    trace_context=None,
+):
+    """Run one proactive invocation to completion on a worker thread.
 
-    for user_id in user_ids:
-        results["processed"] += 1
+    The agent call blocks on the model, so it runs on the worker's own
+    loop (app.scheduler.worker_loops), which is reused across users.
+    """
+    with use_context(trace_context), span(
+        "scheduler.user", prompt_type=prompt_type, **{"enduser.id": user_id},
+    ):
         try:
-            loop = asyncio.new_event_loop()
-            result = loop.run_until_complete(
-                agent.invoke_proactive(user_id, prompt_type)
+            return run_on_worker_loop(
+                agent.invoke_proactive(user_id, prompt_type, briefing=briefing)
+            )
+        finally:
+            push.flush(user_id)  # the delivered card reaches open clients now
+
+
+def _deliver_one(
+    agent: AgentService,
+    guard: DeliveryGuard,
+    user_id: str,
+    prompt_type: str,
+    briefing: dict | None = None,
+    trace_context=None,
+    budget: RunBudget | None = None,
+) -> str:
+    """Claim, invoke and release one user on a worker thread.
+
+    The delivery key is claimed only when a worker is free to run the
+    user, so a sweep cut short leaves no claims for users it never reached.
+    A user is deferred, unclaimed, when the run budget is already spent.
+    Returns the outcome for the tally.
+    """
+    if budget is not None and budget.exhausted():
+        return "deferred"
+    outcome = guard.begin(user_id)
+    if outcome != DeliveryGuard.ADMITTED:
+        return outcome
+    delivered = False
+    started = time.monotonic()
+    try:
+        delivered = _invoke_one(agent, user_id, prompt_type, briefing, trace_context) is not None
+    except Exception:
+        logger.exception("Proactive %s failed for user %s", prompt_type, user_id)
+        return "error"
+    finally:
+        guard.finish(user_id, delivered)
+        if budget is not None:
+            budget.record(time.monotonic() - started)
+    return "delivered" if delivered else "processed"
+
+
+async def _fan_out(
+    prompt_type: str,
+    user_ids: list[str],
+    agent: AgentService | None = None,
+    guard: DeliveryGuard | None = None,
+    budget: RunBudget | None = None,
+) -> tuple[dict, list[str]]:
+    """Process users on a bounded worker pool and tally the outcomes.
+
+    Users whose delivery for this time bucket already happened, or who are
+    still leased by an overlapping sweep, are suppressed before the model
+    is called. Returns the tally and each user's outcome, in ``user_ids``
+    order. Workers check the budget independently, so a "deferred" user
+    can sit between users that ran.
+    """
+    agent = agent or get_agent_service()
+    guard = guard or DeliveryGuard(prompt_type, datetime.now(timezone.utc))
+    results = {
+        "processed": 0, "delivered": 0, "errors": 0,
+        "duplicates": 0, "leased": 0, "precomputed": 0, "deferred": 0,
+    }
+    loop = asyncio.get_running_loop()
+
+    briefings = {}
+    if prompt_type in BRIEFING_TYPES:
+        with span("scheduler.precompute", user_count=len(user_ids)):
+            briefings = precompute_briefings(user_ids)
+    results["precomputed"] = len(briefings)
+    trace_context = current_context()
+
+    with worker_pool(MAX_CONCURRENCY) as pool:
+        outcomes = await asyncio.gather(*(
+            loop.run_in_executor(
+                pool, _deliver_one, agent, guard, user_id, prompt_type,
+                briefings.get(user_id), trace_context, budget,
             )
-            loop.close()
-            if result is not None:
+            for user_id in user_ids
+        ))
+
+    for outcome in outcomes:
+        if outcome == DeliveryGuard.DUPLICATE:
+            results["duplicates"] += 1
+        elif outcome == DeliveryGuard.LEASED:
+            results["leased"] += 1
+        elif outcome == "deferred":
+            results["deferred"] += 1
+        else:
+            results["processed"] += 1
+            if outcome == "delivered":
                 results["delivered"] += 1
-        except Exception:
-            logger.exception("Proactive %s failed for user %s", prompt_type, user_id)
-            results["errors"] += 1
+            elif outcome == "error":
+                results["errors"] += 1
+    return results, outcomes
+
+
+def _run_proactive(prompt_type: str, event: dict | None = None, context=None) -> dict:
+    """Run proactive agent for all eligible users in this event's shard.
+
+    Users are processed in sorted order, CHUNK_SIZE at a time. When the
+    run budget is spent the users not yet started are deferred and the
+    sweep continues, in a follow-up invocation, from the first deferred
+    user (app.scheduler.sweep_budget). Users after it that did run are
+    suppressed there by their delivery keys.
+    """
+    event = event or {}
+    shard = int(event.get("shard", 0))
+    total_shards = max(1, int(event.get("totalShards", 1)))
+    slot_hour = event.get("slotHour") or datetime.now(timezone.utc).strftime("%H")
+    sweep_id = event.get("sweepId") or new_id()
+    resume_after = event.get("resumeAfter")
+    budget = RunBudget(context)
+
+    user_ids = sorted(_get_eligible_users(prompt_type, shard, total_shards, slot_hour))
+    if resume_after:
+        user_ids = [u for u in user_ids if u > resume_after]
+
+    agent = get_agent_service()  # the agent stack loads on first sweep
+    guard = DeliveryGuard(prompt_type, datetime.now(timezone.utc))
+    before = proactive_stats.snapshot(prompt_type)
+    results: Counter = Counter()
+    last_done = resume_after
+    remaining = len(user_ids)
+    for start in range(0, len(user_ids), CHUNK_SIZE):
+        if budget.exhausted():
+            break
+        chunk = user_ids[start:start + CHUNK_SIZE]
+        with span("scheduler.chunk", user_count=len(chunk)):
+            chunk_results, outcomes = asyncio.run(
+                _fan_out(prompt_type, chunk, agent, guard, budget)
+            )
+        results.update(chunk_results)
+        done = outcomes.index("deferred") if "deferred" in outcomes else len(chunk)
+        if done:
+            last_done = chunk[done - 1]
+            remaining -= done
+        if done < len(chunk):
+            break
+
+    results = dict(results)
+    results["outcomes"] = ProactiveStats.summarize(
+        before, proactive_stats.snapshot(prompt_type),
+    )
+    results["shard"] = f"{shard}/{total_shards}"
+    results["sweep"] = {
+        "sweepId": sweep_id,
+        "continuation": int(event.get("continuation", 0)),
+        "users": len(user_ids),
+        "remaining": remaining,
+        "elapsedSeconds": round(budget.elapsed, 2),
+        "usersPerSecond": (
+            round(results.get("processed", 0) / budget.elapsed, 2)
+            if budget.elapsed > 0 else 0.0
+        ),
+    }
+
+    if remaining:
+        continuation = {
+            "type": prompt_type,
+            "shard": shard,
+            "totalShards": total_shards,
+            "slotHour": slot_hour,
+            "sweepId": sweep_id,
+            "resumeAfter": last_done,
+            "continuation": int(event.get("continuation", 0)) + 1,
+        }
+        if enqueue_continuation(context, continuation):
+            results["sweep"]["continued"] = True
+        else:
+            results["continuation"] = continuation
 
     logger.info("Proactive %s: %s", prompt_type, results)
     return results
@@ -70,19 +305,22 @@ def _run_proactive(prompt_type: str) -> dict:
 
 def morning_briefing_handler(event, context):
     """EventBridge target: hourly cron, filters by user timezone."""
-    results = _run_proactive("morning_briefing")
+    results = _run_proactive("morning_briefing", event, context)
     return {"statusCode": 200, "body": results}
 
 
 def evening_journal_handler(event, context):
     """EventBridge target: hourly cron, filters by user timezone."""
-    results = _run_proactive("evening_journal")
+    results = _run_proactive("evening_journal", event, context)
     return {"statusCode": 200, "body": results}
 
 
 def reminder_check_handler(event, context):
-    """EventBridge target: every 5 minutes."""
-    results = _run_proactive("reminder_check")
+    """EventBridge target: every minute.
+
+    Reads the DueReminders index instead of sweeping users through the model.
+    """
+    results = dispatch_due_reminders()
     return {"statusCode": 200, "body": results}
 
 
@@ -92,7 +330,7 @@ def plan_review_handler(event, context):
     Reviews all active goals, runs adapt_plan + reschedule_failed_tasks
     for any that are falling behind.
     """
-    results = _run_proactive("plan_review")
+    results = _run_proactive("plan_review", event, context)
     return {"statusCode": 200, "body": results}
 
 
@@ -101,5 +339,35 @@ def smart_suggest_handler(event, context):
 
     Generates proactive suggestions to keep users engaged.
     """
-    results = _run_proactive("smart_suggestions")
+    results = _run_proactive("smart_suggestions", event, context)
+    return {"statusCode": 200, "body": results}
+
+
+def cron_jobs_handler(event, context):
+    """EventBridge target: every minute. Runs due user cron jobs."""
+    results = dispatch_due_jobs(context=context)
     return {"statusCode": 200, "body": results}
+
+
+_HANDLERS = {
+    "morning_briefing": morning_briefing_handler,
+    "evening_journal": evening_journal_handler,
+    "reminder_check": reminder_check_handler,
+    "plan_review": plan_review_handler,
+    "smart_suggestions": smart_suggest_handler,
+    "cron_jobs": cron_jobs_handler,
+}
+
+
+def handler(event, context):
+    """Single Lambda entry point — routes on the rule's {"type": ...} input."""
+    prompt_type = (event or {}).get("type", "")
+    target = _HANDLERS.get(prompt_type)
+    if target is None:
+        logger.warning("Unknown scheduler event type: %r", prompt_type)
+        return {"statusCode": 400, "body": {"error": f"Unknown type {prompt_type!r}"}}
+    with span(f"scheduler.{prompt_type}", continuation=(event or {}).get("continuation")):
+        try:
+            return target(event, context)
+        finally:
+            push.flush()
@@ -0,0 +1,80 @@
+"""Duplicate suppression for proactive sweeps.
+
+EventBridge delivers at least once, and a slow sweep can overlap the next
+tick. Two guards, both stored in jumns-usage with TTL:
+
+- a delivery key per (user, prompt type, time bucket), written with a
+  conditional put, so each bucket produces at most one model call;
+- a short lease per (user, prompt type), so a sweep skips users another
+  sweep is still processing.
+
+A delivery key is kept only when a delivery was saved; after a failure
+(a model outage, say), a skip or a silent answer it is released, so a
+retry in the same bucket can run. Reminder and cron deliveries need no extra key:
+their dispatchers claim each item with a versioned update.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from datetime import datetime
+
+from app.db.base_repository import new_id
+from app.dependencies import get_usage_repo
+
+logger = logging.getLogger(__name__)
+
+LEASE_SECONDS = int(os.getenv("PROACTIVE_LEASE_SECONDS", "300"))
+DELIVERY_KEY_TTL_SECONDS = 3 * 24 * 3600
+
+# One delivery per bucket; buckets are in UTC
+_BUCKET_FORMATS = {
+    "morning_briefing": "%Y-%m-%d",
+    "evening_journal": "%Y-%m-%d",
+    "plan_review": "%Y-%m-%d",
+    "smart_suggestions": "%Y-%m-%dT%H",
+}
+
+
+def delivery_key(prompt_type: str, now: datetime) -> str:
+    bucket = now.strftime(_BUCKET_FORMATS.get(prompt_type, "%Y-%m-%dT%H:%M"))
+    return f"delivery#{prompt_type}#{bucket}"
+
+
+class DeliveryGuard:
+    """Per-sweep guard; ``begin`` before invoking, ``finish`` afterwards."""
+
+    # begin() outcomes
+    ADMITTED = "admitted"
+    DUPLICATE = "duplicate"
+    LEASED = "leased"
+
+    def __init__(self, prompt_type: str, now: datetime):
+        self._repo = get_usage_repo()
+        self._prompt_type = prompt_type
+        self._key = delivery_key(prompt_type, now)
+        self._owner = new_id()
+
+    def begin(self, user_id: str) -> str:
+        """Take the lease, then the delivery key. Fails open on errors."""
+        try:
+            if not self._repo.acquire_lease(
+                user_id, self._prompt_type, self._owner, LEASE_SECONDS,
+            ):
+                return self.LEASED
+            if not self._repo.claim_key(user_id, self._key, DELIVERY_KEY_TTL_SECONDS):
+                self._repo.release_lease(user_id, self._prompt_type, self._owner)
+                return self.DUPLICATE
+        except Exception:
+            logger.exception("Delivery guard unavailable for user %s", user_id)
+        return self.ADMITTED
+
+    def finish(self, user_id: str, delivered: bool) -> None:
+        """Release the lease; keep the delivery key only if ``delivered``."""
+        try:
+            if not delivered:
+                self._repo.release_key(user_id, self._key)
+            self._repo.release_lease(user_id, self._prompt_type, self._owner)
+        except Exception:
+            logger.exception("Failed to release delivery guard for user %s", user_id)
@@ -0,0 +1,125 @@
+"""In-process min-heap scheduler for cron jobs (local development).
+
+Production runs due jobs from the DueJobs index on a one-minute
+EventBridge tick (app.scheduler.cron_dispatcher). local_server.py has no
+such index, so it keeps a heap of (next run, job id) and sleeps until the
+earliest entry is due.
+
+Rescheduling pushes a new entry and leaves the old one in the heap; stale
+entries are skipped when popped (lazy deletion). Due jobs run on a bounded
+thread pool, and a job that is still running is not started again.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+
+class JobScheduler:
+    """Runs ``run_job(job_id)`` at each job's scheduled time.
+
+    ``run_job`` is responsible for executing the job and calling
+    ``schedule()`` again with its next run time.
+    """
+
+    def __init__(
+        self,
+        run_job: Callable[[str], None],
+        max_concurrency: int = 4,
+        max_sleep: float = 30.0,
+    ):
+        self._run_job = run_job
+        self._heap: list[tuple[float, int, str]] = []
+        self._seq = itertools.count()
+        self._next_run: dict[str, float] = {}  # job_id -> live entry time
+        self._running: set[str] = set()
+        self._cond = threading.Condition()
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="cron-job",
+        )
+        self._max_sleep = max_sleep
+        self._stopped = False
+        self._thread: threading.Thread | None = None
+
+    def __len__(self) -> int:
+        return len(self._next_run)
+
+    def schedule(self, job_id: str, when: datetime | None) -> None:
+        """Set a job's next run time; None unschedules it."""
+        with self._cond:
+            if when is None:
+                self._next_run.pop(job_id, None)
+                return
+            ts = when.timestamp()
+            self._next_run[job_id] = ts
+            heapq.heappush(self._heap, (ts, next(self._seq), job_id))
+            self._cond.notify()
+
+    def cancel(self, job_id: str) -> None:
+        self.schedule(job_id, None)
+
+    def pop_due(self, now: float) -> list[str]:
+        """Remove and return the jobs due at ``now`` (skipping stale entries)."""
+        due = []
+        with self._cond:
+            while self._heap and self._heap[0][0] <= now:
+                ts, _, job_id = heapq.heappop(self._heap)
+                if self._next_run.get(job_id) != ts:
+                    continue  # rescheduled or cancelled since this push
+                del self._next_run[job_id]
+                if job_id in self._running:
+                    logger.info("Cron job %s still running, skipping this run", job_id)
+                    continue
+                self._running.add(job_id)
+                due.append(job_id)
+        return due
+
+    def _execute(self, job_id: str) -> None:
+        try:
+            self._run_job(job_id)
+        except Exception:
+            logger.exception("Cron job %s failed", job_id)
+        finally:
+            with self._cond:
+                self._running.discard(job_id)
+
+    # -- background thread ---------------------------------------------------
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopped = False
+        self._thread = threading.Thread(target=self._loop, name="cron-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        if self._thread:
+            self._thread.join(timeout=5)
+        self._pool.shutdown(wait=False)
+
+    def _loop(self) -> None:
+        while True:
+            with self._cond:
+                if self._stopped:
+                    return
+                now = time.time()
+                wait = self._max_sleep
+                if self._heap:
+                    wait = min(wait, max(0.0, self._heap[0][0] - now))
+                if wait > 0:
+                    self._cond.wait(wait)
+                    continue
+            for job_id in self.pop_due(time.time()):
+                self._pool.submit(self._execute, job_id)
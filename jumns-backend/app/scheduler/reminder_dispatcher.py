@@ -0,0 +1,95 @@
+"""Exact-time reminder delivery.
+
+Replaces the per-user reminder_check model sweep: each tick reads only the
+reminders whose nextFireAt has passed (DueReminders GSI, one query per
+fireShard), claims each with a versioned update that advances nextFireAt,
+and posts a reminder card to the user's chat. No model call is involved.
+If the card cannot be written the claim is undone, so the next tick
+fires that occurrence again (at least once: a failure after the card was
+stored can repeat it).
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timezone
+
+from app.dependencies import get_messages_repo, get_reminders_repo
+from app.db.table_config import REMINDER_FIRE_SHARDS
+
+logger = logging.getLogger(__name__)
+
+
+def reminder_card(reminder: dict) -> dict:
+    """The chat message delivered when a reminder fires."""
+    return {
+        "role": "assistant",
+        "type": "card",
+        "content": f"Reminder: {reminder.get('title', '')}",
+        "cardType": "reminder",
+        "cardData": {
+            "reminderId": reminder.get("id", reminder.get("reminderId", "")),
+            "title": reminder.get("title", ""),
+            "time": reminder.get("originalTime") or reminder.get("time", ""),
+            "goalId": reminder.get("goalId"),
+            "snoozeCount": int(reminder.get("snoozeCount", 0)),
+        },
+        "proactive": True,
+        "proactiveType": "reminder",
+    }
+
+
+def _unclaim(reminders_repo, reminder: dict, claimed: dict) -> bool:
+    """Put an undelivered occurrence back for the next tick."""
+    try:
+        return reminders_repo.unadvance(reminder, claimed)
+    except Exception:
+        logger.exception("Failed to restore reminder %s", reminder.get("reminderId"))
+        return False
+
+
+def dispatch_due_reminders(
+    now: datetime | None = None, shards: range | None = None,
+) -> dict:
+    """Fire every reminder due at ``now``. Returns counts for logging."""
+    now = now or datetime.now(timezone.utc)
+    reminders_repo = get_reminders_repo()
+    messages_repo = get_messages_repo()
+    results = {
+        "due": 0, "fired": 0, "claimedElsewhere": 0, "inactive": 0,
+        "errors": 0, "retrying": 0,
+    }
+
+    for shard in shards or range(REMINDER_FIRE_SHARDS):
+        try:
+            due = reminders_repo.list_due(shard, now)
+        except Exception:
+            logger.exception("Failed to read due reminders for shard %s", shard)
+            results["errors"] += 1
+            continue
+        for reminder in due:
+            results["due"] += 1
+            if not reminder.get("active"):
+                # Paused or finished; advance() would refuse it anyway
+                results["inactive"] += 1
+                continue
+            claimed = None
+            try:
+                # Claim first: a lost race means another tick delivered it
+                claimed = reminders_repo.advance(reminder, now)
+                if claimed is None:
+                    results["claimedElsewhere"] += 1
+                    continue
+                messages_repo.create_message(reminder["userId"], reminder_card(reminder))
+                results["fired"] += 1
+            except Exception:
+                logger.exception(
+                    "Failed to fire reminder %s for user %s",
+                    reminder.get("reminderId"), reminder.get("userId"),
+                )
+                results["errors"] += 1
+                if claimed is not None and _unclaim(reminders_repo, reminder, claimed):
+                    results["retrying"] += 1
+
+    logger.info("Reminder dispatch: %s", results)
+    return results
@@ -0,0 +1,95 @@
+"""Run budget and continuation for long proactive sweeps.
+
+A sweep processes its users in sorted order, one chunk at a time. Before
+each user it checks the Lambda's remaining time; when that drops below
+the margin (room for one more user: the slowest user so far, with
+headroom, and never less than TIME_MARGIN_MS), the users not yet started
+are deferred and the rest of the sweep goes to a continuation:
+
+    {"type": ..., "resumeAfter": <last processed userId>, "slotHour": ...,
+     "sweepId": ..., "continuation": n, "shard": ..., "totalShards": ...}
+
+The continuation is enqueued by invoking this function asynchronously.
+If that fails (or there is no Lambda context), the event is returned in
+the results so the caller can resubmit it. Delivery keys
+(app.scheduler.idempotency) make a resubmitted chunk safe.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+
+from app.tracing import instrument_boto_client
+
+logger = logging.getLogger(__name__)
+
+# Stop starting new users when less than this much time is left
+TIME_MARGIN_MS = int(os.getenv("SWEEP_TIME_MARGIN_MS", "15000"))
+
+# The margin also covers this multiple of the slowest user seen so far
+USER_TIME_FACTOR = 1.5
+
+# Follow-up invocations allowed per sweep (guards against a runaway chain)
+MAX_CONTINUATIONS = int(os.getenv("SWEEP_MAX_CONTINUATIONS", "20"))
+
+
+class RunBudget:
+    """Tracks elapsed time against the Lambda's remaining time."""
+
+    def __init__(self, context=None, margin_ms: int = TIME_MARGIN_MS):
+        self._context = context
+        self._margin_ms = margin_ms
+        self._slowest_ms = 0.0
+        self._started = time.monotonic()
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self._started
+
+    def remaining_ms(self) -> int | None:
+        """Milliseconds left in this invocation, or None outside Lambda."""
+        if self._context is None or not hasattr(self._context, "get_remaining_time_in_millis"):
+            return None
+        return self._context.get_remaining_time_in_millis()
+
+    @property
+    def margin_ms(self) -> float:
+        return max(self._margin_ms, self._slowest_ms * USER_TIME_FACTOR)
+
+    def record(self, seconds: float) -> None:
+        """Note how long one user took; the margin grows to fit the slowest."""
+        self._slowest_ms = max(self._slowest_ms, seconds * 1000)
+
+    def exhausted(self) -> bool:
+        remaining = self.remaining_ms()
+        return remaining is not None and remaining < self.margin_ms
+
+
+def enqueue_continuation(context, event: dict) -> bool:
+    """Invoke this function again asynchronously with ``event``.
+
+    Returns False when no continuation could be enqueued.
+    """
+    function_name = getattr(context, "invoked_function_arn", None)
+    if not function_name:
+        return False
+    if int(event.get("continuation", 0)) > MAX_CONTINUATIONS:
+        logger.error("Sweep %s hit the continuation limit", event.get("sweepId"))
+        return False
+    try:
+        import boto3
+
+        client = boto3.client("lambda")
+        instrument_boto_client(client)
+        client.invoke(
+            FunctionName=function_name,
+            InvocationType="Event",
+            Payload=json.dumps(event).encode(),
+        )
+        return True
+    except Exception:
+        logger.exception("Failed to enqueue continuation for sweep %s", event.get("sweepId"))
+        return False
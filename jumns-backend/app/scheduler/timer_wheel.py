@@ -0,0 +1,111 @@
+"""In-process hashed timer wheel for local development.
+
+local_server.py keeps reminders in memory, so there is no DueReminders
+index to poll. It schedules each reminder's next fire time on this wheel
+instead. Timers hash into ``slots`` buckets by tick, so a tick only looks
+at one bucket. Timers more than one revolution away sit in their bucket
+until their tick comes round.
+
+Callbacks run on the wheel's thread and must not block for long.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+
+class TimerWheel:
+    """Keyed one-shot timers with O(1) schedule/cancel.
+
+    Scheduling an existing key replaces its timer.
+    """
+
+    def __init__(self, tick_seconds: float = 1.0, slots: int = 512):
+        self._tick = tick_seconds
+        self._slots: list[dict[str, tuple[int, Callable[[], None]]]] = [
+            {} for _ in range(slots)
+        ]
+        self._index: dict[str, int] = {}  # key -> slot
+        self._lock = threading.Lock()
+        self._current = self._tick_of(time.time())
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _tick_of(self, epoch: float) -> int:
+        return int(epoch // self._tick)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def schedule(self, key: str, fire_at: datetime, callback: Callable[[], None]) -> None:
+        """Run ``callback`` at ``fire_at`` (immediately on the next tick if past)."""
+        with self._lock:
+            self._remove(key)
+            tick = max(self._tick_of(fire_at.timestamp()), self._current + 1)
+            slot = tick % len(self._slots)
+            self._slots[slot][key] = (tick, callback)
+            self._index[key] = slot
+
+    def cancel(self, key: str) -> bool:
+        with self._lock:
+            return self._remove(key)
+
+    def _remove(self, key: str) -> bool:
+        slot = self._index.pop(key, None)
+        if slot is None:
+            return False
+        self._slots[slot].pop(key, None)
+        return True
+
+    def advance(self, now: float | None = None) -> int:
+        """Fire every timer up to ``now`` (epoch seconds). Returns count fired."""
+        target = self._tick_of(now if now is not None else time.time())
+        due: list[tuple[str, Callable[[], None]]] = []
+        with self._lock:
+            # Catch up tick by tick; after a long stall, check every bucket
+            n = len(self._slots)
+            if target - self._current >= n:
+                buckets = range(n)
+            else:
+                buckets = [t % n for t in range(self._current + 1, target + 1)]
+            for slot in buckets:
+                bucket = self._slots[slot]
+                for key, (fire_tick, callback) in list(bucket.items()):
+                    if fire_tick <= target:
+                        del bucket[key]
+                        del self._index[key]
+                        due.append((key, callback))
+            self._current = max(self._current, target)
+
+        for key, callback in due:
+            try:
+                callback()
+            except Exception:
+                logger.exception("Timer %s failed", key)
+        return len(due)
+
+    # -- background thread ---------------------------------------------------
+
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="timer-wheel", daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self._tick * 2)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._tick):
+            self.advance()
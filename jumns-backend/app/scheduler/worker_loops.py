@@ -0,0 +1,45 @@
+"""Worker pools whose threads each keep one event loop.
+
+Scheduler workers run blocking agent calls, each a coroutine. Running
+them with asyncio.run would build and tear down a loop (and whatever
+per-loop clients the call creates) for every user; instead each worker
+thread creates its loop once and runs every call on it. The loops are
+closed when the pool shuts down.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Coroutine, Iterator
+
+_worker = threading.local()
+
+
+def _start_worker(loops: list[asyncio.AbstractEventLoop]) -> None:
+    _worker.loop = asyncio.new_event_loop()
+    loops.append(_worker.loop)
+
+
+@contextmanager
+def worker_pool(max_workers: int) -> Iterator[ThreadPoolExecutor]:
+    """A ThreadPoolExecutor whose threads each own a persistent loop."""
+    loops: list[asyncio.AbstractEventLoop] = []
+    try:
+        with ThreadPoolExecutor(
+            max_workers=max_workers, initializer=_start_worker, initargs=(loops,),
+        ) as pool:
+            yield pool
+    finally:
+        for loop in loops:
+            loop.close()
+
+
+def run_on_worker_loop(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run ``coro`` on this worker thread's loop (asyncio.run off a pool)."""
+    loop = getattr(_worker, "loop", None)
+    if loop is None:
+        return asyncio.run(coro)
+    return loop.run_until_complete(coro)
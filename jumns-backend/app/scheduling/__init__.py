@@ -0,0 +1,8 @@
+"""Pure schedule math shared by the repositories and the scheduler.
+
+    app.scheduling.recurrence   reminder schedules and fire times
+    app.scheduling.cron         cron jobs' schedules and next runs
+
+Nothing here touches DynamoDB or the scheduler's delivery code, so the
+data layer can compute fire times without importing app.scheduler.
+"""
@@ -0,0 +1,226 @@
+"""Cron expressions and next-run computation for scheduled jobs.
+
+Jobs carry a schedule type and value (the cron tools' contract):
+
+    once      ISO datetime            "2026-03-01T08:00:00Z"
+    daily     local "HH:MM"           "08:00"
+    weekly    "<Day> HH:MM"           "Monday 09:00"
+    interval  minutes between runs    "30"
+    cron      5-field cron expression "0 8 * * mon-fri"
+
+Cron fields are minute, hour, day of month, month, day of week (0 or 7 =
+Sunday). Each field takes "*", lists, ranges, "/step" and month/day
+names; the @hourly, @daily, @weekly, @monthly and @yearly macros are
+accepted. As in Vixie cron, when both day fields are restricted a day
+matching either one fires. Wall-clock times are in the job's timezone.
+
+Runs of one job are at least MIN_RUN_INTERVAL apart: interval schedules
+below it are rejected, and next_run_after skips cron matches that come
+sooner. validate_schedule also rejects schedules with no run ahead (a
+"once" in the past, "0 0 31 2 *").
+"""
+
+from __future__ import annotations
+
+import os
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+SCHEDULE_TYPES = ("once", "daily", "weekly", "interval", "cron")
+
+# Shortest gap between two runs of one job (each run is a model call)
+MIN_RUN_INTERVAL = timedelta(minutes=int(os.getenv("CRON_MIN_INTERVAL_MINUTES", "15")))
+
+_MACROS = {
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+    "@monthly": "0 0 1 * *",
+    "@weekly": "0 0 * * 0",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@hourly": "0 * * * *",
+}
+_MONTH_NAMES = {m: i + 1 for i, m in enumerate(
+    ["jan", "feb", "mar", "apr", "may", "jun",
+     "jul", "aug", "sep", "oct", "nov", "dec"]
+)}
+_DAY_NAMES = {d: i for i, d in enumerate(
+    ["sun", "mon", "tue", "wed", "thu", "fri", "sat"]
+)}
+_WEEKDAYS = {
+    "monday": 1, "tuesday": 2, "wednesday": 3, "thursday": 4,
+    "friday": 5, "saturday": 6, "sunday": 0,
+}
+
+# Give up looking for a match after this many years (e.g. "0 0 30 2 *")
+_SEARCH_YEARS = 5
+
+
+def _parse_field(text: str, low: int, high: int, names: dict[str, int]) -> frozenset[int]:
+    values: set[int] = set()
+    for part in text.lower().split(","):
+        step = 1
+        if "/" in part:
+            part, step_text = part.split("/", 1)
+            step = int(step_text)
+            if step < 1:
+                raise ValueError(f"Invalid step in {text!r}")
+        if part == "*":
+            start, end = low, high
+        elif "-" in part:
+            a, b = part.split("-", 1)
+            start, end = names.get(a, None), names.get(b, None)
+            start = int(a) if start is None else start
+            end = int(b) if end is None else end
+        else:
+            start = names[part] if part in names else int(part)
+            end = high if step > 1 else start
+        if not (low <= start <= high and low <= end <= high) or start > end:
+            raise ValueError(f"Value out of range in {text!r}")
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+class CronExpression:
+    """A parsed 5-field cron expression."""
+
+    def __init__(self, expression: str):
+        self.expression = expression.strip()
+        fields = _MACROS.get(self.expression.lower(), self.expression).split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression needs 5 fields: {expression!r}")
+        minute, hour, day, month, weekday = fields
+        self.minutes = _parse_field(minute, 0, 59, {})
+        self.hours = _parse_field(hour, 0, 23, {})
+        self.days = _parse_field(day, 1, 31, {})
+        self.months = _parse_field(month, 1, 12, _MONTH_NAMES)
+        # 7 is an alias for Sunday
+        self.weekdays = frozenset(
+            d % 7 for d in _parse_field(weekday, 0, 7, _DAY_NAMES)
+        )
+        self._day_any = day == "*"
+        self._weekday_any = weekday == "*"
+
+    def _day_matches(self, dt: datetime) -> bool:
+        in_days = dt.day in self.days
+        in_weekdays = (dt.weekday() + 1) % 7 in self.weekdays
+        if self._day_any or self._weekday_any:
+            return in_days and in_weekdays
+        return in_days or in_weekdays
+
+    def next_after(self, after: datetime, tz: str = "UTC") -> datetime | None:
+        """First matching minute strictly after ``after``, in UTC."""
+        zone = ZoneInfo(tz)
+        local = after.astimezone(zone).replace(tzinfo=None, second=0, microsecond=0)
+        dt = local + timedelta(minutes=1)
+        limit = dt + timedelta(days=366 * _SEARCH_YEARS)
+
+        while dt < limit:
+            if dt.month not in self.months:
+                dt = (dt.replace(day=1) + timedelta(days=32)).replace(day=1, hour=0, minute=0)
+                continue
+            if not self._day_matches(dt):
+                dt = (dt + timedelta(days=1)).replace(hour=0, minute=0)
+                continue
+            if dt.hour not in self.hours:
+                dt = (dt + timedelta(hours=1)).replace(minute=0)
+                continue
+            if dt.minute not in self.minutes:
+                dt += timedelta(minutes=1)
+                continue
+            fire = dt.replace(tzinfo=zone).astimezone(timezone.utc)
+            if fire > after:
+                return fire
+            dt += timedelta(minutes=1)
+        return None
+
+
+def _hh_mm(value: str) -> tuple[int, int]:
+    parts = (value or "08:00").strip().split(":")
+    hour, minute = int(parts[0]), int(parts[1]) if len(parts) > 1 else 0
+    if not (0 <= hour <= 23 and 0 <= minute <= 59):
+        raise ValueError(f"Invalid time {value!r}")
+    return hour, minute
+
+
+def to_cron(schedule_type: str, schedule_value: str) -> CronExpression | None:
+    """The cron expression for daily/weekly/cron schedules (None otherwise)."""
+    if schedule_type == "daily":
+        hour, minute = _hh_mm(schedule_value)
+        return CronExpression(f"{minute} {hour} * * *")
+    if schedule_type == "weekly":
+        parts = (schedule_value or "Monday 09:00").split()
+        day = _WEEKDAYS.get(parts[0].lower()) if parts else None
+        if day is None:
+            raise ValueError(f"Invalid weekday in {schedule_value!r}")
+        hour, minute = _hh_mm(parts[1] if len(parts) > 1 else "09:00")
+        return CronExpression(f"{minute} {hour} * * {day}")
+    if schedule_type == "cron":
+        return CronExpression(schedule_value)
+    return None
+
+
+def compute_next_run(
+    schedule_type: str,
+    schedule_value: str,
+    after: datetime | None = None,
+    tz: str = "UTC",
+) -> datetime | None:
+    """Next run strictly after ``after`` (UTC), or None when finished.
+
+    Raises ValueError for an unknown type or malformed value.
+    """
+    after = after or datetime.now(timezone.utc)
+    if schedule_type not in SCHEDULE_TYPES:
+        raise ValueError(f"Unknown schedule type {schedule_type!r}")
+    if schedule_type == "once":
+        if not schedule_value:
+            return None
+        target = datetime.fromisoformat(schedule_value.replace("Z", "+00:00"))
+        if target.tzinfo is None:
+            target = target.replace(tzinfo=ZoneInfo(tz))
+        return target.astimezone(timezone.utc) if target > after else None
+    if schedule_type == "interval":
+        minutes = int(schedule_value or 30)
+        if minutes < 1:
+            raise ValueError("Interval must be at least 1 minute")
+        return after + timedelta(minutes=minutes)
+    return to_cron(schedule_type, schedule_value).next_after(after, tz)
+
+
+def validate_interval(schedule_type: str, schedule_value: str) -> None:
+    """Raise ValueError for an interval schedule shorter than MIN_RUN_INTERVAL."""
+    if schedule_type != "interval":
+        return
+    minimum = int(MIN_RUN_INTERVAL.total_seconds() // 60)
+    if int(schedule_value or 30) < minimum:
+        raise ValueError(f"Interval must be at least {minimum} minutes")
+
+
+def validate_schedule(
+    schedule_type: str, schedule_value: str, tz: str = "UTC", after: datetime | None = None,
+) -> None:
+    """Raise ValueError for a schedule a job cannot be saved with.
+
+    That is a malformed one, an interval below MIN_RUN_INTERVAL, or one
+    that never runs after ``after``.
+    """
+    validate_interval(schedule_type, schedule_value)
+    if compute_next_run(schedule_type, schedule_value, after, tz) is None:
+        raise ValueError("Schedule never runs")
+
+
+def next_run_after(
+    schedule_type: str, schedule_value: str, last_run: datetime, tz: str = "UTC",
+) -> datetime | None:
+    """Next run after a run at ``last_run``, no sooner than MIN_RUN_INTERVAL.
+
+    Raises ValueError for an unknown type or malformed value.
+    """
+    next_run = compute_next_run(schedule_type, schedule_value, last_run, tz)
+    earliest = last_run + MIN_RUN_INTERVAL
+    if next_run is None or next_run >= earliest:
+        return next_run
+    if schedule_type == "interval":
+        return earliest
+    return compute_next_run(schedule_type, schedule_value, earliest - timedelta(seconds=1), tz)
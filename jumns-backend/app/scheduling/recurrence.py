@@ -0,0 +1,196 @@
+"""Structured reminder schedules parsed from free-text times.
+
+Reminder times are written by the agent or the user as free text
+("Every Monday 8 AM", "Weekdays 7 PM", "Today 5:00 PM"). They are parsed
+once, on write, into a small RRULE-like map stored on the reminder:
+
+    {"freq": "daily" | "weekly" | "once",
+     "times": ["08:00", ...],          # local wall-clock times
+     "days": [0, ...],                 # weekly only, Monday = 0
+     "date": "YYYY-MM-DD",             # once only
+     "tz": "America/New_York"}
+
+next_fire_at() turns that into the next UTC instant, which the dispatcher
+and the DueReminders index work from. Text with no recognizable day or
+time parses to None and the reminder is not scheduled.
+"""
+
+from __future__ import annotations
+
+import re
+from datetime import date, datetime, time, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+_CLOCK_12H = re.compile(r"\b(\d{1,2})(?::(\d{2}))?\s*([ap])\.?m\.?\b", re.IGNORECASE)
+_CLOCK_24H = re.compile(r"\b([01]?\d|2[0-3]):([0-5]\d)\b")
+_ISO_DATE = re.compile(r"\b(\d{4})-(\d{2})-(\d{2})\b")
+_MONTH_DATE = re.compile(
+    r"\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?\s+(\d{1,2})\b",
+    re.IGNORECASE,
+)
+_MONTHS = ["jan", "feb", "mar", "apr", "may", "jun",
+           "jul", "aug", "sep", "oct", "nov", "dec"]
+_DAY_NAMES = re.compile(
+    r"\b(mon(?:day)?|tue(?:s|sday)?|wed(?:nesday)?|thu(?:rs?|rsday)?"
+    r"|fri(?:day)?|sat(?:urday)?|sun(?:day)?)s?\b",
+    re.IGNORECASE,
+)
+_DAYS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+_NAMED_TIMES = {
+    "morning": "morningTime",
+    "evening": "eveningTime",
+    "tonight": "eveningTime",
+    "night": "eveningTime",
+}
+_DAILY = re.compile(r"\b(daily|every\s?day|each day|every (morning|evening|night)|nightly)\b")
+_RECURRING = re.compile(r"\b(every|each)\b")
+
+
+def fire_key(dt: datetime) -> str:
+    """Fixed-width UTC timestamp used for nextFireAt (sorts as a string)."""
+    return dt.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def parse_fire_key(value: str) -> datetime:
+    return datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+
+
+def _tz(name: str | None):
+    try:
+        return ZoneInfo(name or "UTC")
+    except Exception:
+        return timezone.utc
+
+
+def clock_times(text: str, settings: dict | None = None) -> list[str]:
+    """Local "HH:MM" times in a free-text schedule, in order of appearance.
+
+    Falls back to the user's morningTime / eveningTime for "morning",
+    "evening" and "night", and to 12:00 for "noon".
+    """
+    settings = settings or {}
+    times = [
+        f"{int(h) % 12 + (12 if ap.lower() == 'p' else 0):02d}:{int(m or 0):02d}"
+        for h, m, ap in _CLOCK_12H.findall(text)
+    ]
+    if not times:
+        times = [f"{int(h):02d}:{m}" for h, m in _CLOCK_24H.findall(text)]
+    if not times:
+        lowered = text.lower()
+        if "noon" in lowered:
+            times.append("12:00")
+        for word, setting in _NAMED_TIMES.items():
+            if word in lowered:
+                times.append(settings.get(setting, "08:00")[:5])
+                break
+    return times
+
+
+def parse_schedule(
+    text: str, settings: dict | None = None, now: datetime | None = None,
+) -> dict | None:
+    """Parse a free-text reminder time into a recurrence map (or None)."""
+    if not text or text.lower().startswith("snoozed"):
+        return None
+    settings = settings or {}
+    tz_name = settings.get("timezone", "UTC")
+    local_now = (now or datetime.now(timezone.utc)).astimezone(_tz(tz_name))
+    lowered = text.lower()
+
+    times = clock_times(text, settings)
+    day_names = [_DAYS.index(d[:3].lower()) for d in _DAY_NAMES.findall(text)]
+    recurring = bool(_RECURRING.search(lowered))
+
+    rec: dict = {"tz": tz_name}
+    if re.search(r"\bweekdays?\b", lowered):
+        rec.update(freq="weekly", days=[0, 1, 2, 3, 4])
+    elif re.search(r"\bweekends?\b", lowered):
+        rec.update(freq="weekly", days=[5, 6])
+    elif _DAILY.search(lowered):
+        rec["freq"] = "daily"
+    elif day_names and (recurring or re.search(r"\b(mon|tues|wednes|thurs|fri|satur|sun)days\b", lowered)):
+        rec.update(freq="weekly", days=sorted(set(day_names)))
+    elif recurring and times:
+        rec["freq"] = "daily"
+    else:
+        # One-off: explicit date, today/tomorrow, a weekday name, or the
+        # next occurrence of a bare clock time
+        target = _one_off_date(
+            lowered, day_names, local_now,
+            times or [settings.get("morningTime", "08:00")[:5]],
+        )
+        if target is None:
+            if not times:
+                return None
+            first = time.fromisoformat(times[0])
+            target = local_now.date()
+            if datetime.combine(target, first, tzinfo=local_now.tzinfo) <= local_now:
+                target += timedelta(days=1)
+        rec.update(freq="once", date=target.isoformat())
+
+    if not times:
+        times = [settings.get("morningTime", "08:00")[:5]]
+    rec["times"] = sorted(set(times))
+    return rec
+
+
+def _one_off_date(
+    lowered: str, day_names: list[int], local_now: datetime, times: list[str],
+) -> date | None:
+    today = local_now.date()
+    if "tomorrow" in lowered:
+        return today + timedelta(days=1)
+    if "today" in lowered or "tonight" in lowered:
+        return today
+    m = _ISO_DATE.search(lowered)
+    if m:
+        try:
+            return date(int(m[1]), int(m[2]), int(m[3]))
+        except ValueError:
+            return None
+    m = _MONTH_DATE.search(lowered)
+    if m:
+        try:
+            target = date(today.year, _MONTHS.index(m[1][:3].lower()) + 1, int(m[2]))
+        except ValueError:
+            return None
+        return target if target >= today else target.replace(year=today.year + 1)
+    if day_names:
+        target = today + timedelta(days=(day_names[0] - today.weekday()) % 7)
+        if target == today and all(
+            datetime.combine(today, time.fromisoformat(t), tzinfo=local_now.tzinfo) <= local_now
+            for t in times
+        ):
+            # Today's times have passed: "Monday 9am" on a Monday afternoon
+            # means next Monday
+            target += timedelta(days=7)
+        return target
+    return None
+
+
+def next_fire_at(rec: dict | None, after: datetime) -> datetime | None:
+    """The first fire instant strictly after ``after`` (UTC), or None."""
+    if not rec or not rec.get("times"):
+        return None
+    tz = _tz(rec.get("tz"))
+    local_after = after.astimezone(tz)
+    times = sorted(time.fromisoformat(t) for t in rec["times"])
+    freq = rec.get("freq")
+
+    if freq == "once":
+        day = date.fromisoformat(rec["date"])
+        candidates = [day]
+    else:
+        days = {int(d) for d in rec.get("days", range(7))} if freq == "weekly" else None
+        start = local_after.date()
+        candidates = [
+            start + timedelta(days=i) for i in range(8)
+            if days is None or (start + timedelta(days=i)).weekday() in days
+        ]
+
+    for day in candidates:
+        for t in times:
+            fire = datetime.combine(day, t, tzinfo=tz)
+            if fire > local_after:
+                return fire.astimezone(timezone.utc)
+    return None
@@ -0,0 +1,36 @@
+"""JSON encoding for API list responses, push frames and prompt snippets.
+
+orjson when installed (it is in every requirements file), else the
+standard library; DynamoDB Decimals become ints or floats and its sets
+become lists either way. No web-stack imports: the scheduler uses this
+too. The response class for routes is app.routes.bulk.FastJSONResponse.
+"""
+
+from __future__ import annotations
+
+import json
+from decimal import Decimal
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """Compact UTF-8 JSON for ``content``, DynamoDB types included."""
+    if orjson is not None:
+        return orjson.dumps(content, default=_default)
+    return json.dumps(
+        content, default=_default, ensure_ascii=False, separators=(",", ":"),
+    ).encode()
+
@@ -0,0 +1,330 @@
+"""Span tracing for the hot paths, on OpenTelemetry.
+
+Off by default. Set TRACE_EXPORTER to turn it on:
+
+    TRACE_EXPORTER=stdout   one JSON span per line on stdout (CloudWatch)
+    TRACE_EXPORTER=file     one JSON span per line in TRACE_FILE
+                            (default /tmp/jumns-traces.jsonl)
+
+Spans come from three places:
+- ``span()`` / ``@traced`` around request handling, AgentService phases,
+  memory embedding/search/S3 loads and scheduler sweeps;
+- botocore hooks (``instrument_boto_client``) on the DynamoDB, S3 and
+  Lambda clients: one span per AWS call with table, item count and
+  consumed capacity;
+- the Strands SDK, which emits its own agent / model / execute_tool spans
+  into the same provider, so tool calls nest under the model attempt.
+
+Render a waterfall per trace with:
+
+    python -m app.tracing /tmp/jumns-traces.jsonl [trace_id]
+
+When tracing is off or the OpenTelemetry SDK is missing, ``span()``
+yields a non-recording span and the hooks are not installed. Every
+requirements file ships the SDK; if TRACE_EXPORTER is set without it (or
+to an unknown value), a warning is logged at startup.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import logging
+import os
+import sys
+from contextlib import contextmanager
+from typing import Any
+
+try:
+    from opentelemetry import context as otel_context
+    from opentelemetry import trace
+    from opentelemetry.trace import Status, StatusCode
+except ImportError:  # pragma: no cover - OpenTelemetry ships with strands
+    trace = None
+
+try:
+    import opentelemetry.sdk.trace as _otel_sdk
+except ImportError:  # pragma: no cover - warned about below
+    _otel_sdk = None
+
+logger = logging.getLogger(__name__)
+
+TRACE_EXPORTER = os.getenv("TRACE_EXPORTER", "").lower()
+TRACE_FILE = os.getenv("TRACE_FILE", "/tmp/jumns-traces.jsonl")
+
+_configured = False
+
+if TRACE_EXPORTER and TRACE_EXPORTER not in ("stdout", "file"):
+    logger.warning("Unknown TRACE_EXPORTER %r; tracing is off", TRACE_EXPORTER)
+elif TRACE_EXPORTER and (trace is None or _otel_sdk is None):
+    logger.warning(
+        "TRACE_EXPORTER=%s but the OpenTelemetry SDK is not installed; "
+        "no spans will be exported", TRACE_EXPORTER,
+    )
+
+
+def tracing_enabled() -> bool:
+    return trace is not None and _otel_sdk is not None and TRACE_EXPORTER in ("stdout", "file")
+
+
+def configure_tracing() -> None:
+    """Install a TracerProvider with the local exporter (idempotent)."""
+    global _configured
+    if _configured or not tracing_enabled():
+        return
+    _configured = True
+    try:
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import (
+            ConsoleSpanExporter,
+            SimpleSpanProcessor,
+        )
+    except ImportError:
+        return
+
+    out = sys.stdout if TRACE_EXPORTER == "stdout" else open(TRACE_FILE, "a", buffering=1)
+    exporter = ConsoleSpanExporter(
+        out=out, formatter=lambda s: s.to_json(indent=None) + "\n",
+    )
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": "jumns-backend"}),
+    )
+    # Simple (synchronous) processor: Lambda may freeze before a batch flushes
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    trace.set_tracer_provider(provider)
+
+
+class _NoopSpan:
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, attributes: dict[str, Any]) -> None:
+        pass
+
+    def is_recording(self) -> bool:
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+@contextmanager
+def span(name: str, **attributes: Any):
+    """Run the block in a child span of the current one."""
+    if not tracing_enabled():
+        yield _NOOP_SPAN
+        return
+    configure_tracing()
+    tracer = trace.get_tracer("jumns")
+    with tracer.start_as_current_span(
+        name, attributes={k: v for k, v in attributes.items() if v is not None},
+    ) as current:
+        yield current
+
+
+def traced(name: str):
+    """Decorator form of ``span`` for a whole function."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def current_context():
+    """The active trace context, to hand to a worker thread."""
+    return otel_context.get_current() if tracing_enabled() else None
+
+
+@contextmanager
+def use_context(ctx):
+    """Make ``ctx`` (from ``current_context``) active on this thread."""
+    if ctx is None:
+        yield
+        return
+    token = otel_context.attach(ctx)
+    try:
+        yield
+    finally:
+        otel_context.detach(token)
+
+
+# ---------------------------------------------------------------------------
+# botocore hooks — one span per AWS API call
+# ---------------------------------------------------------------------------
+
+_SPAN_KEY = "jumns_trace_span"
+
+
+def _before_call(params, model, context, **kwargs):
+    service = model.service_model.service_name
+    attributes = {
+        "rpc.system": "aws-api",
+        "rpc.service": service,
+        "rpc.method": model.name,
+    }
+    if service == "dynamodb":
+        attributes["db.system"] = "dynamodb"
+        table = params.get("TableName")
+        if table is None and "RequestItems" in params:
+            table = ",".join(params["RequestItems"])
+        attributes["aws.dynamodb.table"] = table
+        if params.get("IndexName"):
+            attributes["aws.dynamodb.index"] = params["IndexName"]
+        members = model.input_shape.members if model.input_shape else {}
+        if "ReturnConsumedCapacity" in members and "ReturnConsumedCapacity" not in params:
+            params["ReturnConsumedCapacity"] = "TOTAL"
+    elif service == "s3":
+        attributes["aws.s3.bucket"] = params.get("Bucket")
+        attributes["aws.s3.key"] = params.get("Key") or params.get("Prefix")
+    tracer = trace.get_tracer("jumns")
+    context[_SPAN_KEY] = tracer.start_span(
+        f"{service}.{model.name}",
+        attributes={k: v for k, v in attributes.items() if v is not None},
+    )
+
+
+def _capacity(parsed: dict) -> float:
+    consumed = parsed.get("ConsumedCapacity")
+    if isinstance(consumed, dict):
+        consumed = [consumed]
+    return sum(float(c.get("CapacityUnits", 0)) for c in consumed or [])
+
+
+def _after_call(http_response, parsed, model, context, **kwargs):
+    current = context.pop(_SPAN_KEY, None)
+    if current is None:
+        return
+    current.set_attribute("http.status_code", http_response.status_code)
+    if "Count" in parsed:
+        current.set_attribute("aws.dynamodb.count", parsed["Count"])
+        current.set_attribute("aws.dynamodb.scanned_count", parsed.get("ScannedCount", 0))
+    elif "Responses" in parsed:
+        current.set_attribute(
+            "aws.dynamodb.count", sum(len(v) for v in parsed["Responses"].values()),
+        )
+    if "ConsumedCapacity" in parsed:
+        current.set_attribute("aws.dynamodb.consumed_capacity", _capacity(parsed))
+    if "LastEvaluatedKey" in parsed:
+        current.set_attribute("aws.dynamodb.has_more", True)
+    if "ContentLength" in parsed:
+        current.set_attribute("aws.s3.content_length", parsed["ContentLength"])
+    error = parsed.get("Error", {}).get("Code")
+    if error:
+        current.set_status(Status(StatusCode.ERROR, error))
+        current.set_attribute("aws.error_code", error)
+    current.end()
+
+
+def _after_call_error(exception, context, **kwargs):
+    current = context.pop(_SPAN_KEY, None)
+    if current is not None:
+        current.record_exception(exception)
+        current.set_status(Status(StatusCode.ERROR, type(exception).__name__))
+        current.end()
+
+
+def instrument_boto_client(client) -> None:
+    """Trace every API call made through ``client`` (no-op when off)."""
+    if not tracing_enabled():
+        return
+    configure_tracing()
+    events = client.meta.events
+    # before-parameter-build sees the API params (before validation), so
+    # ReturnConsumedCapacity can still be added
+    events.register(
+        "before-parameter-build.*.*", _before_call, unique_id="jumns-trace-before",
+    )
+    events.register("after-call.*.*", _after_call, unique_id="jumns-trace-after")
+    events.register(
+        "after-call-error.*.*", _after_call_error, unique_id="jumns-trace-error",
+    )
+
+
+# ---------------------------------------------------------------------------
+# Waterfall rendering: python -m app.tracing <file> [trace_id]
+# ---------------------------------------------------------------------------
+
+
+def _load_spans(path: str) -> list[dict]:
+    from datetime import datetime
+
+    spans = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line.startswith("{"):
+                continue
+            raw = json.loads(line)
+            start = datetime.fromisoformat(raw["start_time"].replace("Z", "+00:00"))
+            end = datetime.fromisoformat(raw["end_time"].replace("Z", "+00:00"))
+            spans.append({
+                "name": raw["name"],
+                "trace": raw["context"]["trace_id"],
+                "id": raw["context"]["span_id"],
+                "parent": raw.get("parent_id"),
+                "start": start.timestamp(),
+                "end": end.timestamp(),
+                "attributes": raw.get("attributes", {}),
+                "error": raw.get("status", {}).get("status_code") == "ERROR",
+            })
+    return spans
+
+
+_SHOWN_ATTRIBUTES = (
+    "aws.dynamodb.table", "aws.dynamodb.index", "aws.dynamodb.count",
+    "aws.dynamodb.consumed_capacity", "aws.s3.key", "model.id", "tool.name",
+    "gen_ai.request.model", "gen_ai.tool.name", "item_count", "user_count",
+)
+
+
+def render_waterfall(spans: list[dict], width: int = 40) -> str:
+    """Text waterfall (one tree per trace) with offsets and durations in ms."""
+    lines = []
+    by_trace: dict[str, list[dict]] = {}
+    for s in spans:
+        by_trace.setdefault(s["trace"], []).append(s)
+
+    for trace_id, members in by_trace.items():
+        t0 = min(s["start"] for s in members)
+        total = max(s["end"] for s in members) - t0 or 1e-9
+        ids = {s["id"] for s in members}
+        children: dict[str | None, list[dict]] = {}
+        for s in members:
+            parent = s["parent"] if s["parent"] in ids else None
+            children.setdefault(parent, []).append(s)
+        lines.append(f"trace {trace_id}  total {total * 1000:.1f} ms")
+
+        def walk(parent, depth):
+            for s in sorted(children.get(parent, []), key=lambda x: x["start"]):
+                offset = s["start"] - t0
+                duration = s["end"] - s["start"]
+                lead = int(offset / total * width)
+                bar = "#" * max(1, int(duration / total * width))
+                attrs = " ".join(
+                    f"{k.rsplit('.', 1)[-1]}={s['attributes'][k]}"
+                    for k in _SHOWN_ATTRIBUTES if k in s["attributes"]
+                )
+                lines.append(
+                    f"  {offset * 1000:8.1f} {duration * 1000:8.1f} ms "
+                    f"|{' ' * lead}{bar:<{width - lead}}| "
+                    f"{'  ' * depth}{s['name']}{' !' if s['error'] else ''}"
+                    f"{'  ' + attrs if attrs else ''}"
+                )
+                walk(s["id"], depth + 1)
+
+        walk(None, 0)
+        lines.append("")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        sys.exit("usage: python -m app.tracing <trace-file> [trace_id]")
+    loaded = _load_spans(sys.argv[1])
+    if len(sys.argv) > 2:
+        loaded = [s for s in loaded if s["trace"].endswith(sys.argv[2].removeprefix("0x"))]
+    print(render_waterfall(loaded))
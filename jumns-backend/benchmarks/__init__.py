@@ -0,0 +1 @@
+"""Offline end-to-end benchmarks (python -m benchmarks.run)."""
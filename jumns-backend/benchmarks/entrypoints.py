@@ -0,0 +1,205 @@
+"""Package size and init time per Lambda entry point (CI-runnable).
+
+    python -m benchmarks.entrypoints [--build] [--runs 3]
+        [--max-init-ms crud=600,chat=2500] [--max-size-mb crud=40]
+        [--output entrypoints.json]
+
+Each entry point (see app.handlers) has its own requirements file, and
+the deployed function bundles only that file's dependency closure plus
+app/. Per entry point this reports:
+
+    sizeMb       app/ plus the installed size of every distribution in the
+                 requirement closure (importlib.metadata, this environment)
+    initMs       median cold import of the handler module plus the first
+                 hit on its main route (benchmarks.importtime.probe)
+    packages     the distributions in the closure
+
+``--build`` instead pip-installs each requirements file into a temporary
+directory, measures that directory and runs the init probes without
+site-packages — so an import the requirements file does not cover fails
+the run rather than being satisfied by the dev environment.
+
+Budgets (--max-init-ms / --max-size-mb, "name=value" pairs or one value
+for all) make the script exit non-zero when exceeded.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+from importlib import metadata
+from pathlib import Path
+
+from packaging.requirements import Requirement
+
+from benchmarks.importtime import BACKEND_ROOT, probe
+
+# name -> (handler module, requirements file, path of its first request)
+ENTRY_POINTS: dict[str, tuple[str, str, str | None]] = {
+    "crud": ("app.handlers.crud", "requirements-crud.txt", "/api/tasks"),
+    "chat": ("app.handlers.chat", "requirements-chat.txt", "/api/chat"),
+    "scheduler": ("app.scheduler.handler", "requirements-scheduler.txt", None),
+}
+
+
+def _normalize(name: str) -> str:
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def read_requirements(filename: str) -> list[Requirement]:
+    """Requirements from a file, following ``-r`` includes."""
+    requirements = []
+    for line in (BACKEND_ROOT / filename).read_text().splitlines():
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        if line.startswith("-r"):
+            requirements.extend(read_requirements(line[2:].strip()))
+        else:
+            requirements.append(Requirement(line))
+    return requirements
+
+
+def closure(requirements: list[Requirement]) -> set[str]:
+    """Installed distributions needed by ``requirements``, transitively.
+
+    Requirements not installed here are skipped (use --build for the
+    exact closure).
+    """
+    seen: set[tuple[str, frozenset]] = set()
+    pending = list(requirements)
+    while pending:
+        requirement = pending.pop()
+        key = (_normalize(requirement.name), frozenset(requirement.extras))
+        if key in seen:
+            continue
+        try:
+            dist = metadata.distribution(key[0])
+        except metadata.PackageNotFoundError:
+            continue
+        seen.add(key)
+        for spec in dist.requires or []:
+            child = Requirement(spec)
+            if child.marker and not any(
+                child.marker.evaluate({"extra": extra}) for extra in (key[1] or {""})
+            ):
+                continue
+            pending.append(child)
+    return {name for name, _ in seen}
+
+
+def _dist_bytes(name: str) -> int:
+    total = 0
+    for file in metadata.distribution(name).files or []:
+        try:
+            total += file.locate().stat().st_size
+        except OSError:
+            continue
+    return total
+
+
+def _tree_bytes(root: Path) -> int:
+    total = 0
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d != "__pycache__"]
+        total += sum((Path(dirpath) / f).stat().st_size for f in filenames)
+    return total
+
+
+def _median(values: list[float]) -> float:
+    ordered = sorted(values)
+    return ordered[len(ordered) // 2]
+
+
+def measure_entry_point(name: str, runs: int = 3, build: bool = False) -> dict:
+    module, requirements_file, path = ENTRY_POINTS[name]
+    app_bytes = _tree_bytes(BACKEND_ROOT / "app")
+
+    if build:
+        with tempfile.TemporaryDirectory(prefix=f"jumns-{name}-") as target:
+            subprocess.run(
+                [sys.executable, "-m", "pip", "install", "--quiet", "--no-cache-dir",
+                 "-r", requirements_file, "-t", target],
+                cwd=BACKEND_ROOT, check=True,
+            )
+            size = app_bytes + _tree_bytes(Path(target))
+            packages = sorted(
+                _normalize(p.name.split("-")[0])
+                for p in Path(target).glob("*.dist-info")
+            )
+            samples = [probe(module, path, site_dir=target) for _ in range(runs)]
+    else:
+        packages = sorted(closure(read_requirements(requirements_file)))
+        size = app_bytes + sum(_dist_bytes(p) for p in packages)
+        samples = [probe(module, path) for _ in range(runs)]
+
+    totals = [s["importMs"] + s["firstHitMs"] for s in samples]
+    return {
+        "module": module,
+        "requirements": requirements_file,
+        "sizeMb": round(size / 1e6, 2),
+        "initMs": round(_median(totals), 1),
+        "initSamplesMs": [round(t, 1) for t in totals],
+        "packages": packages,
+    }
+
+
+def _budgets(spec: str | None) -> dict[str, float]:
+    """'crud=600,chat=2500' -> per-name budgets; '900' -> same for all."""
+    if not spec:
+        return {}
+    if "=" not in spec:
+        return {name: float(spec) for name in ENTRY_POINTS}
+    pairs = (item.split("=", 1) for item in spec.split(","))
+    return {name.strip(): float(value) for name, value in pairs}
+
+
+def check_budgets(report: dict, max_init_ms: dict, max_size_mb: dict) -> list[str]:
+    """Human-readable budget violations (empty when everything fits)."""
+    failures = []
+    for name, result in report.items():
+        if name in max_init_ms and result["initMs"] > max_init_ms[name]:
+            failures.append(f"{name}: init {result['initMs']} ms > {max_init_ms[name]} ms")
+        if name in max_size_mb and result["sizeMb"] > max_size_mb[name]:
+            failures.append(f"{name}: size {result['sizeMb']} MB > {max_size_mb[name]} MB")
+    return failures
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Package size and init time per entry point")
+    parser.add_argument("--entry-points", default=",".join(ENTRY_POINTS),
+                        help="comma-separated subset of: " + ", ".join(ENTRY_POINTS))
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--build", action="store_true",
+                        help="pip install each requirements file into a temp dir and probe in isolation")
+    parser.add_argument("--max-init-ms")
+    parser.add_argument("--max-size-mb")
+    parser.add_argument("--output")
+    args = parser.parse_args(argv)
+
+    names = [n.strip() for n in args.entry_points.split(",") if n.strip()]
+    unknown = set(names) - set(ENTRY_POINTS)
+    if unknown:
+        parser.error(f"unknown entry points: {', '.join(sorted(unknown))}")
+
+    report = {name: measure_entry_point(name, args.runs, args.build) for name in names}
+    for name, result in report.items():
+        print(f"{name:10s} {result['sizeMb']:8.1f} MB  init {result['initMs']:8.1f} ms  "
+              f"({len(result['packages'])} distributions, {result['requirements']})")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    failures = check_budgets(report, _budgets(args.max_init_ms), _budgets(args.max_size_mb))
+    for failure in failures:
+        print(f"over budget: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+"""Offline backend for the benchmarks: moto DynamoDB/S3 and fake externals.
+
+``offline_backend()`` starts moto, creates the Jumns tables (from
+app.db.local_tables) and the memory bucket, and swaps out everything that
+would leave the machine:
+
+- ``strands.models.gemini.GeminiModel`` -> benchmarks.fake_model.ScriptedModel
+- Gemini embeddings -> ``hash_embedding`` (deterministic, 768-d)
+- Cognito JWT validation -> the bearer token is taken as the user id
+- the free-tier message cap is lifted (the counter is still written)
+
+Everything else — routing, middleware, repositories, the Strands agent
+loop and tool execution — is the real code. Set DYNAMODB_ENDPOINT to run
+against DynamoDB Local instead of moto's DynamoDB.
+"""
+
+from __future__ import annotations
+
+import os
+import zlib
+from contextlib import contextmanager
+
+EMBEDDING_DIM = 768
+MEMORY_BUCKET = "jumns-bench-memory"
+
+# Must be in place before app modules read them at import time
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+os.environ.setdefault("MEMORY_BUCKET", MEMORY_BUCKET)
+os.environ.setdefault("GEMINI_API_KEY", "offline")
+
+
+def hash_embedding(text: str) -> list[float]:
+    """Signed feature-hashing embedding of the words in ``text``."""
+    vector = [0.0] * EMBEDDING_DIM
+    for word in text.lower().split():
+        h = zlib.crc32(word.encode())
+        vector[h % EMBEDDING_DIM] += 1.0 if h & 0x80000000 else -1.0
+    return vector
+
+
+@contextmanager
+def offline_backend(model_latency_ms: float = 0.0):
+    """Run the block against moto with external services faked."""
+    import boto3
+    from moto import mock_aws
+
+    from app import dependencies
+    from app.db import connection
+    from app.db.local_tables import create_tables
+    from app.memory.memory_service import MemoryService
+    from app.middleware import auth, rate_limiter
+    from benchmarks.fake_model import ScriptedModel
+    import strands.models.gemini as gemini
+
+    patches = [
+        (gemini, "GeminiModel", ScriptedModel),
+        (MemoryService, "_generate_embedding", lambda self, text: hash_embedding(text)),
+        (auth, "decode_token", lambda token: {"sub": token}),
+        (rate_limiter, "FREE_TIER_LIMIT", 10**9),
+        (ScriptedModel, "latency_ms", model_latency_ms),
+    ]
+    saved = [(target, name, getattr(target, name)) for target, name, _ in patches]
+
+    def _reset():
+        connection.reset_connection()
+        dependencies.reset_instances()
+
+    with mock_aws():
+        _reset()
+        for target, name, value in patches:
+            setattr(target, name, value)
+        try:
+            create_tables()
+            boto3.client("s3").create_bucket(Bucket=os.environ["MEMORY_BUCKET"])
+            yield
+        finally:
+            for target, name, value in saved:
+                setattr(target, name, value)
+            _reset()
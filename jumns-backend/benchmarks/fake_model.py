@@ -0,0 +1,127 @@
+"""Deterministic scripted stand-in for GeminiModel.
+
+Each turn is scripted from the last user prompt: the model first calls
+one tool (chosen by keyword, else by a stable hash of the prompt), then
+answers with a short text once the tool result comes back. Token usage
+is estimated from the request size (4 chars per token) so the usage
+accounting path sees realistic, repeatable numbers.
+
+Proactive prompts that already carry an inline summary are answered
+without a tool call, matching what the real model is asked to do.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import zlib
+from typing import Any
+
+from strands.models.model import Model
+
+# (tool name, input builder) — the prompt text is passed to the builder
+SCRIPTED_TOOLS: list[tuple[str, Any]] = [
+    ("get_daily_summary", lambda prompt: {}),
+    ("get_goals", lambda prompt: {}),
+    ("get_tasks", lambda prompt: {}),
+    ("get_reminders", lambda prompt: {"active_only": True}),
+    ("search_memory", lambda prompt: {"query": prompt[:200], "top_k": 3}),
+]
+
+_KEYWORDS = {
+    "goal": "get_goals",
+    "task": "get_tasks",
+    "remind": "get_reminders",
+    "remember": "search_memory",
+    "today": "get_daily_summary",
+}
+
+
+def _text_of(message: dict) -> str:
+    return " ".join(
+        block["text"] for block in message.get("content", []) if "text" in block
+    )
+
+
+def pick_tool(prompt: str) -> tuple[str, dict]:
+    """The scripted tool call for a prompt."""
+    lowered = prompt.lower()
+    by_name = dict(SCRIPTED_TOOLS)
+    for keyword, name in _KEYWORDS.items():
+        if keyword in lowered:
+            return name, by_name[name](prompt)
+    name, build = SCRIPTED_TOOLS[zlib.crc32(prompt.encode()) % len(SCRIPTED_TOOLS)]
+    return name, build(prompt)
+
+
+class ScriptedModel(Model):
+    """Strands Model that replays a fixed tool-call-then-answer script.
+
+    Accepts GeminiModel's constructor arguments so it can be swapped in
+    for ``strands.models.gemini.GeminiModel``. ``latency_ms`` adds a fixed
+    delay per model call to stand in for network and generation time.
+    """
+
+    latency_ms: float = 0.0
+
+    def __init__(self, *, client_args=None, model_id: str = "scripted", params=None, **kwargs):
+        self.config = {"model_id": model_id, "params": params or {}}
+
+    def update_config(self, **model_config: Any) -> None:
+        self.config.update(model_config)
+
+    def get_config(self) -> dict:
+        return self.config
+
+    async def structured_output(self, output_model, prompt, system_prompt=None, **kwargs):
+        raise NotImplementedError("structured output is not scripted")
+        yield  # pragma: no cover
+
+    async def stream(
+        self,
+        messages,
+        tool_specs=None,
+        system_prompt: str | None = None,
+        **kwargs: Any,
+    ):
+        if self.latency_ms:
+            await asyncio.sleep(self.latency_ms / 1000)
+
+        request_chars = len(system_prompt or "") + len(json.dumps(messages, default=str))
+        last = messages[-1] if messages else {}
+        tool_names = {spec["name"] for spec in tool_specs or []}
+        answered = any("toolResult" in block for block in last.get("content", []))
+        prompt = _text_of(last)
+        inline = "## Daily Summary" in prompt
+
+        yield {"messageStart": {"role": "assistant"}}
+        if not answered and not inline and tool_names:
+            name, tool_input = pick_tool(prompt)
+            if name in tool_names:
+                tool_use_id = f"tooluse_{zlib.crc32((prompt + name).encode()):08x}"
+                yield {"contentBlockStart": {"start": {"toolUse": {"name": name, "toolUseId": tool_use_id}}}}
+                yield {"contentBlockDelta": {"delta": {"toolUse": {"input": json.dumps(tool_input)}}}}
+                yield {"contentBlockStop": {}}
+                yield {"messageStop": {"stopReason": "tool_use"}}
+                yield self._metadata(request_chars, 24)
+                return
+
+        text = "Here's where things stand. You're on track — keep going!"
+        yield {"contentBlockStart": {"start": {}}}
+        yield {"contentBlockDelta": {"delta": {"text": text}}}
+        yield {"contentBlockStop": {}}
+        yield {"messageStop": {"stopReason": "end_turn"}}
+        yield self._metadata(request_chars, len(text) // 4)
+
+    def _metadata(self, request_chars: int, output_tokens: int) -> dict:
+        input_tokens = request_chars // 4
+        return {
+            "metadata": {
+                "usage": {
+                    "inputTokens": input_tokens,
+                    "outputTokens": output_tokens,
+                    "totalTokens": input_tokens + output_tokens,
+                },
+                "metrics": {"latencyMs": int(self.latency_ms)},
+            }
+        }
@@ -0,0 +1,129 @@
+"""Cold-start import cost per entry point: python -m benchmarks.importtime
+
+Each probe runs in a fresh interpreter under ``-X importtime``. It times
+importing the entry module and, for the API, the first hit on a route
+prefix (which imports that route module, see app.application.RouteLoader).
+The importtime log is summed per top-level package, so you can see what
+the remaining cold-start milliseconds are spent on.
+
+    python -m benchmarks.importtime --runs 5 --output importtime.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_ROOT = Path(__file__).resolve().parent.parent
+
+# name -> (module to import, API path to hit first or None)
+PROBES: dict[str, tuple[str, str | None]] = {
+    "api": ("app.main", None),
+    "api/tasks": ("app.main", "/api/tasks"),
+    "api/chat": ("app.main", "/api/chat"),
+    "crud": ("app.handlers.crud", None),
+    "crud/tasks": ("app.handlers.crud", "/api/tasks"),
+    "chat": ("app.handlers.chat", None),
+    "chat/chat": ("app.handlers.chat", "/api/chat"),
+    "scheduler": ("app.scheduler.handler", None),
+}
+
+_PROBE_CODE = """
+import importlib, json, time
+t0 = time.perf_counter()
+module = importlib.import_module({module!r})
+t1 = time.perf_counter()
+if {path!r}:
+    module.app.state.route_loader.ensure({path!r})
+t2 = time.perf_counter()
+print(json.dumps({{"importMs": (t1 - t0) * 1000, "firstHitMs": (t2 - t1) * 1000}}))
+"""
+
+
+def parse_importtime(log: str) -> dict[str, float]:
+    """Self time in ms per top-level package from a -X importtime log."""
+    by_package: dict[str, float] = {}
+    for line in log.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        try:
+            self_us, _, name = line.split(":", 1)[1].split("|")
+            package = name.strip().split(".")[0]
+            by_package[package] = by_package.get(package, 0.0) + int(self_us) / 1000
+        except ValueError:
+            continue
+    return by_package
+
+
+def probe(module: str, path: str | None, site_dir: str | None = None) -> dict:
+    """One cold import in a fresh interpreter.
+
+    With ``site_dir`` the interpreter runs without site-packages (-S) and
+    sees only the backend plus that directory, e.g. a ``pip install -t``
+    of one entry point's requirements.
+    """
+    flags = ["-X", "importtime"]
+    pythonpath = str(BACKEND_ROOT)
+    if site_dir:
+        flags.append("-S")
+        pythonpath = os.pathsep.join([pythonpath, site_dir])
+    env = {**os.environ, "PYTHONPATH": pythonpath}
+    env.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+    proc = subprocess.run(
+        [sys.executable, *flags, "-c", _PROBE_CODE.format(module=module, path=path)],
+        cwd=BACKEND_ROOT, env=env, capture_output=True, text=True, check=False,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"probe {module} {path or ''} failed:\n{proc.stderr[-2000:]}")
+    timings = json.loads(proc.stdout.strip().splitlines()[-1])
+    timings["byPackage"] = parse_importtime(proc.stderr)
+    return timings
+
+
+def measure(runs: int = 3, top: int = 12, probes: dict | None = None) -> dict:
+    """Timings for every probe over ``runs`` fresh interpreters.
+
+    Per probe: importMs / firstHitMs / totalMs sample lists, plus the
+    heaviest packages (mean self time) from the importtime logs.
+    """
+    results = {}
+    for name, (module, path) in (probes or PROBES).items():
+        samples = [probe(module, path) for _ in range(runs)]
+        packages: dict[str, float] = {}
+        for sample in samples:
+            for package, ms in sample["byPackage"].items():
+                packages[package] = packages.get(package, 0.0) + ms / runs
+        results[name] = {
+            "module": module,
+            "path": path,
+            "importMs": [round(s["importMs"], 2) for s in samples],
+            "firstHitMs": [round(s["firstHitMs"], 2) for s in samples],
+            "totalMs": [round(s["importMs"] + s["firstHitMs"], 2) for s in samples],
+            "topPackages": {
+                package: round(ms, 2)
+                for package, ms in sorted(packages.items(), key=lambda p: -p[1])[:top]
+            },
+        }
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cold-start import time per entry point")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=12)
+    parser.add_argument("--output")
+    args = parser.parse_args()
+
+    report = measure(args.runs, args.top)
+    for name, result in report.items():
+        totals = sorted(result["totalMs"])
+        print(f"{name:12s} median {totals[len(totals) // 2]:8.1f} ms  "
+              f"(import {min(result['importMs']):.1f}, first hit {min(result['firstHitMs']):.1f})")
+        print("             " + ", ".join(f"{p} {ms:.0f}" for p, ms in result["topPackages"].items()))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
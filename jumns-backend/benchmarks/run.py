@@ -0,0 +1,470 @@
+"""End-to-end benchmarks: python -m benchmarks.run [options]
+
+Seeds a moto backend (see benchmarks.environment) with synthetic users
+from app.db.synthetic, then measures the real app.main:app through
+Starlette's TestClient and the scheduler and memory services directly:
+
+    chat          POST /api/chat (scripted model: one tool call + answer)
+    crud          goal/task/reminder list, an If-None-Match re-poll of goals,
+                  task create/update/complete/delete
+    memory        MemoryService.search over each user's seeded memories
+    sweep         morning_briefing / evening_journal sweeps (_run_proactive)
+    serialize     JSON for --serialize-items tasks and messages (Decimal
+                  numbers, as DynamoDB returns them): per-item response
+                  models + FastAPI's dump vs the bulk path the list routes
+                  use (ItemView + orjson, app.routes.bulk)
+    coldstart     import + first-hit time per entry point in fresh
+                  interpreters (benchmarks.importtime)
+
+Each operation gets count, mean, p50/p95/p99 (ms) and throughput (ops/s
+of wall time, with --concurrency workers). Results are written as JSON;
+pass --compare with an earlier results file to print the p50/p95 change
+per operation.
+
+Example:
+
+    python -m benchmarks.run --users 20 --scale medium --requests 100 \\
+        --output bench-results.json --compare bench-baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from benchmarks.environment import offline_backend
+
+SCENARIOS = ("chat", "crud", "memory", "sweep", "serialize", "coldstart")
+
+_CHAT_PROMPTS = [
+    "What should I focus on today?",
+    "How are my goals going?",
+    "Which tasks are still open?",
+    "Remind me what reminders I have",
+    "Do you remember what I said about running?",
+    "Give me a quick pep talk",
+]
+
+_WORDS = (
+    "run read write plan gym budget sleep focus project team family call "
+    "garden study piano travel cook walk water review ship design"
+).split()
+
+
+# ---------------------------------------------------------------------------
+# Measurement
+# ---------------------------------------------------------------------------
+
+
+class Recorder:
+    """Collects per-operation latencies (thread-safe)."""
+
+    def __init__(self):
+        self._samples: dict[str, list[float]] = {}
+        self._wall: dict[str, float] = {}
+        self._errors: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def time(self, op: str, fn, *args, **kwargs):
+        started = time.perf_counter()
+        ok = True
+        try:
+            return fn(*args, **kwargs)
+        except Exception:
+            ok = False
+            raise
+        finally:
+            self.record(op, (time.perf_counter() - started) * 1000, ok)
+
+    def record(self, op: str, elapsed_ms: float, ok: bool = True) -> None:
+        with self._lock:
+            self._samples.setdefault(op, []).append(elapsed_ms)
+            if not ok:
+                self._errors[op] = self._errors.get(op, 0) + 1
+
+    def error(self, op: str) -> None:
+        with self._lock:
+            self._errors[op] = self._errors.get(op, 0) + 1
+
+    def add_wall(self, ops: list[str], seconds: float) -> None:
+        for op in ops:
+            self._wall[op] = self._wall.get(op, 0.0) + seconds
+
+    def report(self) -> dict:
+        return {
+            op: summarize(samples, self._wall.get(op), self._errors.get(op, 0))
+            for op, samples in sorted(self._samples.items())
+        }
+
+
+def percentile(sorted_samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_samples:
+        return 0.0
+    rank = max(1, -(-len(sorted_samples) * pct // 100))
+    return sorted_samples[int(rank) - 1]
+
+
+def summarize(samples: list[float], wall_seconds: float | None, errors: int = 0) -> dict:
+    ordered = sorted(samples)
+    total = wall_seconds if wall_seconds else sum(ordered) / 1000
+    return {
+        "count": len(ordered),
+        "errors": errors,
+        "meanMs": round(sum(ordered) / len(ordered), 3) if ordered else 0.0,
+        "p50Ms": round(percentile(ordered, 50), 3),
+        "p95Ms": round(percentile(ordered, 95), 3),
+        "p99Ms": round(percentile(ordered, 99), 3),
+        "maxMs": round(ordered[-1], 3) if ordered else 0.0,
+        "throughputPerSec": round(len(ordered) / total, 2) if total else 0.0,
+    }
+
+
+def _run_workers(concurrency: int, jobs: list) -> float:
+    """Run zero-argument jobs on ``concurrency`` threads; returns wall seconds."""
+    started = time.perf_counter()
+    if concurrency <= 1:
+        for job in jobs:
+            job()
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            for future in [pool.submit(job) for job in jobs]:
+                future.result()
+    return time.perf_counter() - started
+
+
+# ---------------------------------------------------------------------------
+# Seeding
+# ---------------------------------------------------------------------------
+
+
+def _phrase(rng: random.Random, n: int = 4) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(n))
+
+
+def seed(args) -> list[str]:
+    """Bulk-load synthetic users (app.db.synthetic), all due for sweeps now."""
+    from app.db.repositories.users import UsersRepository
+    from app.db.synthetic import SCALES, SyntheticData, plan, seed_backend
+
+    user_ids, counts = plan(
+        args.users, args.scale, args.distribution, prefix="bench-user",
+        overrides={k: getattr(args, k) for k in SCALES["small"] if getattr(args, k) is not None},
+    )
+    seed_backend(user_ids, counts, SyntheticData(args.seed))
+    users = UsersRepository()
+    hour = datetime.now(timezone.utc).strftime("%H")
+    for user_id in user_ids:
+        users.upsert_settings(user_id, {
+            "timezone": "UTC", "morningTime": f"{hour}:00", "eveningTime": f"{hour}:30",
+        })
+    return user_ids
+
+
+# ---------------------------------------------------------------------------
+# Scenarios
+# ---------------------------------------------------------------------------
+
+
+def _client():
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    return TestClient(app)
+
+
+def _request(
+    recorder: Recorder, op: str, client, method: str, path: str, user_id: str,
+    headers: dict | None = None, **kwargs,
+):
+    response = recorder.time(
+        op, client.request, method, path,
+        headers={"Authorization": f"Bearer {user_id}", **(headers or {})}, **kwargs,
+    )
+    if response.status_code >= 400:
+        recorder.error(op)
+    return response
+
+
+def _call(recorder: Recorder, op: str, client, method: str, path: str, user_id: str, **kwargs):
+    response = _request(recorder, op, client, method, path, user_id, **kwargs)
+    if response.status_code >= 400:
+        return None
+    return response.json() if response.content else None
+
+
+def bench_chat(args, recorder: Recorder, user_ids: list[str], rng: random.Random) -> None:
+    local = threading.local()
+
+    def job(user_id: str, prompt: str):
+        def run():
+            if not hasattr(local, "client"):
+                local.client = _client()
+            _call(recorder, "chat", local.client, "POST", "/api/chat", user_id, json={"message": prompt})
+        return run
+
+    jobs = [
+        job(user_ids[i % len(user_ids)], rng.choice(_CHAT_PROMPTS))
+        for i in range(args.requests)
+    ]
+    recorder.add_wall(["chat"], _run_workers(args.concurrency, jobs))
+
+
+_CRUD_OPS = [
+    "crud.goals.list", "crud.goals.poll", "crud.reminders.list", "crud.tasks.list", "crud.tasks.create",
+    "crud.tasks.update", "crud.tasks.complete", "crud.tasks.delete",
+]
+
+
+def bench_crud(args, recorder: Recorder, user_ids: list[str], rng: random.Random) -> None:
+    local = threading.local()
+
+    def job(user_id: str, title: str):
+        def run():
+            if not hasattr(local, "client"):
+                local.client = _client()
+            client = local.client
+            listed = _request(recorder, "crud.goals.list", client, "GET", "/api/goals/", user_id)
+            _request(
+                recorder, "crud.goals.poll", client, "GET", "/api/goals/", user_id,
+                headers={"If-None-Match": listed.headers.get("etag", "")},
+            )
+            _call(recorder, "crud.reminders.list", client, "GET", "/api/reminders/", user_id)
+            _call(recorder, "crud.tasks.list", client, "GET", "/api/tasks/", user_id)
+            task = _call(recorder, "crud.tasks.create", client, "POST", "/api/tasks/", user_id, json={"title": title})
+            if task is None:
+                return
+            path = f"/api/tasks/{task['id']}"
+            _call(recorder, "crud.tasks.update", client, "PATCH", path, user_id, json={"priority": "high"})
+            _call(recorder, "crud.tasks.complete", client, "POST", f"{path}/complete", user_id, json={})
+            _call(recorder, "crud.tasks.delete", client, "DELETE", path, user_id)
+        return run
+
+    jobs = [job(user_ids[i % len(user_ids)], _phrase(rng)) for i in range(args.requests)]
+    recorder.add_wall(_CRUD_OPS, _run_workers(args.concurrency, jobs))
+
+
+def bench_memory(args, recorder: Recorder, user_ids: list[str], rng: random.Random) -> None:
+    from app.memory.memory_service import MemoryService
+
+    service = MemoryService()
+    jobs = [
+        (lambda u=user_ids[i % len(user_ids)], q=_phrase(rng, 5):
+            recorder.time("memory.search", service.search, u, q, 5))
+        for i in range(args.requests)
+    ]
+    recorder.add_wall(["memory.search"], _run_workers(args.concurrency, jobs))
+
+
+def _clear_delivery_keys() -> None:
+    """Drop delivery keys and leases so a sweep can be repeated."""
+    from app.db import table_config as tc
+    from app.db.connection import get_table
+
+    table = get_table(tc.USAGE_TABLE)
+    resp = table.scan(ProjectionExpression="userId, usageKey")
+    with table.batch_writer() as batch:
+        for item in resp.get("Items", []):
+            if item["usageKey"].startswith(("delivery#", "lease#")):
+                batch.delete_item(Key={"userId": item["userId"], "usageKey": item["usageKey"]})
+
+
+def bench_sweep(args, recorder: Recorder, user_ids: list[str], rng: random.Random) -> dict:
+    """Whole-sweep latency plus per-user latency (each worker's _invoke_one)."""
+    from app.scheduler import handler
+
+    original = handler._invoke_one
+    hour = datetime.now(timezone.utc).strftime("%H")
+    sweeps: dict[str, list[dict]] = {}
+    try:
+        for prompt_type in ("morning_briefing", "evening_journal"):
+            user_op = f"sweep.{prompt_type}.user"
+            handler._invoke_one = (
+                lambda *a, _op=user_op, **kw: recorder.time(_op, original, *a, **kw)
+            )
+            for _ in range(args.sweeps):
+                _clear_delivery_keys()
+                started = time.perf_counter()
+                result = recorder.time(
+                    f"sweep.{prompt_type}", handler._run_proactive,
+                    prompt_type, {"slotHour": hour},
+                )
+                recorder.add_wall([user_op], time.perf_counter() - started)
+                sweeps.setdefault(prompt_type, []).append({
+                    "users": result["sweep"]["users"],
+                    "delivered": result.get("delivered", 0),
+                    "errors": result.get("errors", 0),
+                    "usersPerSecond": result["sweep"]["usersPerSecond"],
+                })
+    finally:
+        handler._invoke_one = original
+    return sweeps
+
+
+def _as_dynamodb(value):
+    """Numbers as the Decimals boto3 returns them."""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return Decimal(str(value))
+    if isinstance(value, dict):
+        return {k: _as_dynamodb(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_as_dynamodb(v) for v in value]
+    return value
+
+
+def bench_serialize(args, recorder: Recorder, user_ids: list[str], rng: random.Random) -> None:
+    """serialize.<kind>.models (before) vs serialize.<kind>.bulk (list routes)."""
+    from pydantic import TypeAdapter
+
+    from app.db.synthetic import SyntheticData
+    from app.models.responses import MessageResponse, TaskResponse
+    from app.routes import messages, tasks
+    from app.routes.bulk import FastJSONResponse
+
+    n = args.serialize_items
+    data = SyntheticData(args.seed).user("bench-serialize", {"goals": 10, "tasks": n, "messages": n})
+    for kind, view, model in (
+        ("tasks", tasks._VIEW, TaskResponse),
+        ("messages", messages._VIEW, MessageResponse),
+    ):
+        items = _as_dynamodb(data[kind])
+        adapter = TypeAdapter(list[model])
+
+        # What a list route did before: a model per item, then FastAPI's dump
+        def models():
+            return adapter.dump_json([model.model_validate(view(i)) for i in items], by_alias=True)
+
+        def bulk():
+            return FastJSONResponse(view.many(items)).body
+
+        for _ in range(args.requests):
+            recorder.time(f"serialize.{kind}.models", models)
+            recorder.time(f"serialize.{kind}.bulk", bulk)
+
+
+def bench_coldstart(args, recorder: Recorder, user_ids: list[str], rng: random.Random) -> dict:
+    """Cold import samples as coldstart.<probe>; package breakdown alongside."""
+    from benchmarks.importtime import measure
+
+    report = measure(args.coldstart_runs)
+    for name, result in report.items():
+        for total in result["totalMs"]:
+            recorder.record(f"coldstart.{name}", total)
+    return {name: result["topPackages"] for name, result in report.items()}
+
+
+_BENCHES = {
+    "chat": bench_chat,
+    "crud": bench_crud,
+    "memory": bench_memory,
+    "sweep": bench_sweep,
+    "serialize": bench_serialize,
+    "coldstart": bench_coldstart,
+}
+
+
+# ---------------------------------------------------------------------------
+# Comparison and CLI
+# ---------------------------------------------------------------------------
+
+
+def compare(current: dict, baseline: dict) -> list[str]:
+    """One line per operation with the p50/p95 change against ``baseline``."""
+    lines = []
+    previous = baseline.get("operations", {})
+    for op, stats in current["operations"].items():
+        before = previous.get(op)
+        if not before:
+            lines.append(f"{op:40s} new")
+            continue
+        changes = []
+        for key in ("p50Ms", "p95Ms"):
+            old, new = before.get(key, 0), stats[key]
+            delta = (new - old) / old * 100 if old else 0.0
+            changes.append(f"{key[:3]} {old:9.2f} -> {new:9.2f} ms ({delta:+6.1f}%)")
+        lines.append(f"{op:40s} " + "  ".join(changes))
+    return lines
+
+
+def parse_args(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS),
+                        help="comma-separated subset of: " + ", ".join(SCENARIOS))
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--scale", default="small", help="app.db.synthetic scale preset")
+    parser.add_argument("--distribution", default="uniform", help="uniform or zipf")
+    for name in ("goals", "tasks", "reminders", "messages", "memories"):
+        parser.add_argument(f"--{name}", type=int, default=None,
+                            help=f"{name} per user (overrides --scale)")
+    parser.add_argument("--requests", type=int, default=50,
+                        help="operations per chat / crud / memory scenario")
+    parser.add_argument("--sweeps", type=int, default=3, help="runs per sweep type")
+    parser.add_argument("--serialize-items", type=int, default=1000,
+                        help="tasks / messages per serialize sample")
+    parser.add_argument("--coldstart-runs", type=int, default=3,
+                        help="fresh interpreters per cold-start probe")
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--model-latency-ms", type=float, default=0.0,
+                        help="fixed delay per scripted model call")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", default="bench-results.json")
+    parser.add_argument("--compare", help="earlier results JSON to diff against")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> dict:
+    args = parse_args(argv)
+    scenarios = [s.strip() for s in args.scenarios.split(",") if s.strip()]
+    unknown = set(scenarios) - set(SCENARIOS)
+    if unknown:
+        sys.exit(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    rng = random.Random(args.seed)
+    recorder = Recorder()
+    extra: dict = {}
+    with offline_backend(args.model_latency_ms):
+        started = time.perf_counter()
+        user_ids = seed(args)
+        seed_seconds = time.perf_counter() - started
+        for name in scenarios:
+            result = _BENCHES[name](args, recorder, user_ids, rng)
+            if result:
+                extra[name] = result
+
+    results = {
+        "createdAt": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "config": {k: v for k, v in vars(args).items() if k not in ("output", "compare")},
+        "seedSeconds": round(seed_seconds, 3),
+        "operations": recorder.report(),
+        **extra,
+    }
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+
+    for op, stats in results["operations"].items():
+        print(
+            f"{op:40s} n={stats['count']:<5d} p50={stats['p50Ms']:8.2f} "
+            f"p95={stats['p95Ms']:8.2f} p99={stats['p99Ms']:8.2f} ms  "
+            f"{stats['throughputPerSec']:8.2f}/s  errors={stats['errors']}"
+        )
+    if args.compare:
+        with open(args.compare) as f:
+            print("\n".join(compare(results, json.load(f))))
+    print(f"results written to {args.output}")
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,9 @@ from constructs import Construct
 
 import aws_cdk as cdk
 import aws_cdk.aws_apigateway as apigw
+import aws_cdk.aws_apigatewayv2 as apigwv2
+import aws_cdk.aws_apigatewayv2_integrations as apigwv2_integrations
+import aws_cdk.aws_iam as iam
 import aws_cdk.aws_lambda as _lambda
 import aws_cdk.aws_s3 as s3
 import aws_cdk.aws_secretsmanager as sm
@@ -11,8 +14,29 @@ import aws_cdk.aws_secretsmanager as sm
 from .database import DatabaseConstruct
 
 
+def _function_code(requirements: str) -> _lambda.Code:
+    """Backend package bundled with only one entry point's requirements.
+
+    Each function ships app/ plus ``pip install -r <requirements>``, so the
+    CRUD function carries no agent stack (see app/handlers).
+    """
+    return _lambda.Code.from_asset(
+        "..",
+        exclude=["infra", "benchmarks", "**/__pycache__", "*.json"],
+        bundling=cdk.BundlingOptions(
+            image=_lambda.Runtime.PYTHON_3_12.bundling_image,
+            command=[
+                "bash", "-c",
+                f"pip install --no-cache-dir -r {requirements} -t /asset-output"
+                " && cp -r app /asset-output/",
+            ],
+        ),
+    )
+
+
 class ApiConstruct(Construct):
-    """Creates API Gateway REST API + CRUD/Chat/Scheduler Lambdas."""
+    """Creates API Gateway REST API + CRUD/Chat/Scheduler Lambdas, and the
+    WebSocket API clients receive pushed changes on."""
 
     def __init__(
         self,
@@ -36,10 +60,18 @@ class ApiConstruct(Construct):
             "SKILLS_TABLE": db.skills_table.table_name,
             "INSIGHTS_TABLE": db.insights_table.table_name,
             "ACCESS_CODES_TABLE": db.access_codes_table.table_name,
+            "USAGE_TABLE": db.usage_table.table_name,
+            "CRON_JOBS_TABLE": db.cron_jobs_table.table_name,
             "MEMORY_BUCKET": memory_bucket.bucket_name,
             "SECRETS_ARN": secrets.secret_arn,
             "COGNITO_USER_POOL_ID": "us-east-1_Bn4GrzTdg",
             "COGNITO_CLIENT_ID": "6v0sh32keeunk2e0j2sqlup6n",
+            # Cognito subs allowed on /api/admin (cdk deploy -c adminUserIds=a,b)
+            "ADMIN_USER_IDS": self.node.try_get_context("adminUserIds") or "",
+            # Async repositories (app.db.aio): "thread" or "native" (aiobotocore)
+            "DYNAMODB_ASYNC": self.node.try_get_context("dynamodbAsync") or "thread",
+            # API Gateway compresses instead (min_compression_size below)
+            "COMPRESS_RESPONSES": "0",
         }
 
         # --- CRUD Lambda (512MB / 30s) ---
@@ -47,8 +79,8 @@ class ApiConstruct(Construct):
             self, "CrudFunction",
             function_name=f"jumns-crud-{stage}",
             runtime=_lambda.Runtime.PYTHON_3_12,
-            handler="app.main.handler",
-            code=_lambda.Code.from_asset("../app"),
+            handler="app.handlers.crud.handler",
+            code=_function_code("requirements-crud.txt"),
             memory_size=512,
             timeout=cdk.Duration.seconds(30),
             environment=common_env,
@@ -59,8 +91,8 @@ class ApiConstruct(Construct):
             self, "ChatFunction",
             function_name=f"jumns-chat-{stage}",
             runtime=_lambda.Runtime.PYTHON_3_12,
-            handler="app.main.handler",
-            code=_lambda.Code.from_asset("../app"),
+            handler="app.handlers.chat.handler",
+            code=_function_code("requirements-chat.txt"),
             memory_size=1024,
             timeout=cdk.Duration.seconds(120),
             environment=common_env,
@@ -71,13 +103,23 @@ class ApiConstruct(Construct):
             self, "SchedulerFunction",
             function_name=f"jumns-scheduler-{stage}",
             runtime=_lambda.Runtime.PYTHON_3_12,
-            handler="app.scheduler.handler.morning_briefing_handler",
-            code=_lambda.Code.from_asset("../app"),
+            handler="app.scheduler.handler.handler",
+            code=_function_code("requirements-scheduler.txt"),
             memory_size=1024,
             timeout=cdk.Duration.seconds(120),
             environment=common_env,
         )
 
+        # Long sweeps re-invoke the scheduler to continue (by name: a
+        # grant_invoke on itself would be a circular dependency)
+        self.scheduler_fn.add_to_role_policy(iam.PolicyStatement(
+            actions=["lambda:InvokeFunction"],
+            resources=[
+                f"arn:aws:lambda:{cdk.Aws.REGION}:{cdk.Aws.ACCOUNT_ID}"
+                f":function:jumns-scheduler-{stage}",
+            ],
+        ))
+
         # Grant DynamoDB access to all Lambdas
         for table in db.all_tables:
             table.grant_read_write_data(self.crud_fn)
@@ -99,6 +141,10 @@ class ApiConstruct(Construct):
             self, "JumnsApi",
             rest_api_name=f"jumns-api-{stage}",
             deploy_options=apigw.StageOptions(stage_name="prod"),
+            # gzip/deflate by Accept-Encoding. A brotli body from the Lambda
+            # would need binaryMediaTypes "*/*", which breaks the CORS mock
+            # preflight, so app.middleware.compression is off here.
+            min_compression_size=cdk.Size.kibibytes(1),
             default_cors_preflight_options=apigw.CorsOptions(
                 allow_origins=apigw.Cors.ALL_ORIGINS,
                 allow_methods=apigw.Cors.ALL_METHODS,
@@ -111,9 +157,18 @@ class ApiConstruct(Construct):
         chat_integration = apigw.LambdaIntegration(self.chat_fn)
         chat_resource.add_method("POST", chat_integration)
 
+        # /api/insights/run → Chat Lambda (runs the proactive agent); the
+        # rest of /api/insights stays on CRUD (API Gateway never falls back
+        # from an explicit resource to the /api proxy)
+        crud_integration = apigw.LambdaIntegration(self.crud_fn)
+        insights_resource = api_resource.add_resource("insights")
+        insights_resource.add_method("ANY", crud_integration)
+        insights_resource.add_proxy(default_integration=crud_integration, any_method=True)
+        insights_resource.add_resource("run").add_method("POST", chat_integration)
+
         # /api/{proxy+} → CRUD Lambda (catch-all)
         api_resource.add_proxy(
-            default_integration=apigw.LambdaIntegration(self.crud_fn),
+            default_integration=crud_integration,
             any_method=True,
         )
 
@@ -123,9 +178,52 @@ class ApiConstruct(Construct):
             "GET", apigw.LambdaIntegration(self.crud_fn)
         )
 
-        # Output the API URL
+        # --- Push: WebSocket API (app.push, app.handlers.push) ---
+        self.push_fn = _lambda.Function(
+            self, "PushFunction",
+            function_name=f"jumns-push-{stage}",
+            runtime=_lambda.Runtime.PYTHON_3_12,
+            handler="app.handlers.push.handler",
+            code=_function_code("requirements-crud.txt"),
+            memory_size=256,
+            timeout=cdk.Duration.seconds(10),
+            environment=common_env,
+        )
+        db.usage_table.grant_read_write_data(self.push_fn)
+
+        def push_route() -> apigwv2.WebSocketRouteOptions:
+            return apigwv2.WebSocketRouteOptions(
+                integration=apigwv2_integrations.WebSocketLambdaIntegration(
+                    "PushIntegration", self.push_fn,
+                ),
+            )
+
+        self.push_api = apigwv2.WebSocketApi(
+            self, "JumnsPushApi",
+            api_name=f"jumns-push-{stage}",
+            connect_route_options=push_route(),
+            disconnect_route_options=push_route(),
+            default_route_options=push_route(),
+        )
+        push_stage = apigwv2.WebSocketStage(
+            self, "JumnsPushStage",
+            web_socket_api=self.push_api,
+            stage_name="prod",
+            auto_deploy=True,
+        )
+        # Writers post to open connections through the management API
+        for fn in (self.crud_fn, self.chat_fn, self.scheduler_fn):
+            fn.add_environment("PUSH_ENDPOINT", push_stage.callback_url)
+            push_stage.grant_management_api_access(fn)
+
+        # Output the API URLs
         cdk.CfnOutput(
             self, "ApiUrl",
             value=self.api.url,
             description="Jumns API Gateway endpoint URL",
         )
+        cdk.CfnOutput(
+            self, "PushUrl",
+            value=push_stage.url,
+            description="Jumns push WebSocket URL (connect with ?token=<JWT>)",
+        )
@@ -1,4 +1,4 @@
-"""DynamoDB construct — 8 tables with GSIs per design spec."""
+"""DynamoDB construct — 10 tables with GSIs per design spec."""
 
 from constructs import Construct
 
@@ -14,7 +14,7 @@ class DatabaseConstruct(Construct):
 
         removal = cdk.RemovalPolicy.DESTROY if stage == "dev" else cdk.RemovalPolicy.RETAIN
 
-        # --- jumns-users (PK: userId) ---
+        # --- jumns-users (PK: userId) + UsersBySlot GSI ---
         self.users_table = dynamodb.Table(
             self, "UsersTable",
             table_name=f"jumns-users-{stage}",
@@ -25,8 +25,22 @@ class DatabaseConstruct(Construct):
             point_in_time_recovery=True,
             removal_policy=removal,
         )
+        # Schedule index: UTC hour of the user's local morning (PK) and
+        # evening (SK) time. One index, because CloudFormation creates at
+        # most one GSI per table update. The scheduler only needs user IDs,
+        # so keys-only projection.
+        self.users_table.add_global_secondary_index(
+            index_name="UsersBySlot",
+            partition_key=dynamodb.Attribute(
+                name="morningSlotUtc", type=dynamodb.AttributeType.STRING
+            ),
+            sort_key=dynamodb.Attribute(
+                name="eveningSlotUtc", type=dynamodb.AttributeType.STRING
+            ),
+            projection_type=dynamodb.ProjectionType.KEYS_ONLY,
+        )
 
-        # --- jumns-messages (PK: userId, SK: createdAt#msgId) ---
+        # --- jumns-messages (PK: userId, SK: createdAt#msgId) + MessagesByType GSI ---
         self.messages_table = dynamodb.Table(
             self, "MessagesTable",
             table_name=f"jumns-messages-{stage}",
@@ -40,6 +54,16 @@ class DatabaseConstruct(Construct):
             point_in_time_recovery=True,
             removal_policy=removal,
         )
+        # Sparse: only card messages carry cardKey ("<cardType>#<createdAt>")
+        self.messages_table.add_global_secondary_index(
+            index_name="MessagesByType",
+            partition_key=dynamodb.Attribute(
+                name="userId", type=dynamodb.AttributeType.STRING
+            ),
+            sort_key=dynamodb.Attribute(
+                name="cardKey", type=dynamodb.AttributeType.STRING
+            ),
+        )
 
         # --- jumns-goals (PK: userId, SK: goalId) ---
         self.goals_table = dynamodb.Table(
@@ -56,7 +80,7 @@ class DatabaseConstruct(Construct):
             removal_policy=removal,
         )
 
-        # --- jumns-tasks (PK: userId, SK: taskId) + TasksByGoal GSI ---
+        # --- jumns-tasks (PK: userId, SK: taskId) + TasksByGoal, TasksByDueDate GSIs ---
         self.tasks_table = dynamodb.Table(
             self, "TasksTable",
             table_name=f"jumns-tasks-{stage}",
@@ -79,8 +103,18 @@ class DatabaseConstruct(Construct):
                 name="goalId", type=dynamodb.AttributeType.STRING
             ),
         )
+        # Sparse: tasks without a dueDate are not indexed
+        self.tasks_table.add_global_secondary_index(
+            index_name="TasksByDueDate",
+            partition_key=dynamodb.Attribute(
+                name="userId", type=dynamodb.AttributeType.STRING
+            ),
+            sort_key=dynamodb.Attribute(
+                name="dueDate", type=dynamodb.AttributeType.STRING
+            ),
+        )
 
-        # --- jumns-reminders (PK: userId, SK: reminderId) + ActiveReminders GSI ---
+        # --- jumns-reminders (PK: userId, SK: reminderId) + DueReminders GSI ---
         self.reminders_table = dynamodb.Table(
             self, "RemindersTable",
             table_name=f"jumns-reminders-{stage}",
@@ -94,6 +128,19 @@ class DatabaseConstruct(Construct):
             point_in_time_recovery=True,
             removal_policy=removal,
         )
+        # Sparse: only active, scheduled reminders carry nextFireAt. The
+        # dispatcher reads each fireShard for nextFireAt <= now. The only
+        # index on this table: CloudFormation adds at most one GSI per
+        # update, and active reminders are listed from the base table.
+        self.reminders_table.add_global_secondary_index(
+            index_name="DueReminders",
+            partition_key=dynamodb.Attribute(
+                name="fireShard", type=dynamodb.AttributeType.STRING
+            ),
+            sort_key=dynamodb.Attribute(
+                name="nextFireAt", type=dynamodb.AttributeType.STRING
+            ),
+        )
 
         # --- jumns-skills (PK: userId, SK: skillId) ---
         self.skills_table = dynamodb.Table(
@@ -125,7 +172,7 @@ class DatabaseConstruct(Construct):
             removal_policy=removal,
         )
 
-        # --- jumns-access-codes (PK: code) ---
+        # --- jumns-access-codes (PK: code) + CodesByUser GSI ---
         self.access_codes_table = dynamodb.Table(
             self, "AccessCodesTable",
             table_name=f"jumns-access-codes-{stage}",
@@ -135,6 +182,53 @@ class DatabaseConstruct(Construct):
             billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
             removal_policy=removal,
         )
+        # Sparse: only activated codes carry usedBy
+        self.access_codes_table.add_global_secondary_index(
+            index_name="CodesByUser",
+            partition_key=dynamodb.Attribute(
+                name="usedBy", type=dynamodb.AttributeType.STRING
+            ),
+        )
+
+        # --- jumns-usage (PK: userId, SK: usageKey) — counters, expire via TTL ---
+        self.usage_table = dynamodb.Table(
+            self, "UsageTable",
+            table_name=f"jumns-usage-{stage}",
+            partition_key=dynamodb.Attribute(
+                name="userId", type=dynamodb.AttributeType.STRING
+            ),
+            sort_key=dynamodb.Attribute(
+                name="usageKey", type=dynamodb.AttributeType.STRING
+            ),
+            billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
+            time_to_live_attribute="expiresAt",
+            removal_policy=removal,
+        )
+
+        # --- jumns-cron-jobs (PK: userId, SK: jobId) + DueJobs GSI ---
+        self.cron_jobs_table = dynamodb.Table(
+            self, "CronJobsTable",
+            table_name=f"jumns-cron-jobs-{stage}",
+            partition_key=dynamodb.Attribute(
+                name="userId", type=dynamodb.AttributeType.STRING
+            ),
+            sort_key=dynamodb.Attribute(
+                name="jobId", type=dynamodb.AttributeType.STRING
+            ),
+            billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
+            point_in_time_recovery=True,
+            removal_policy=removal,
+        )
+        # Sparse: only enabled jobs with a pending run carry nextRunAt
+        self.cron_jobs_table.add_global_secondary_index(
+            index_name="DueJobs",
+            partition_key=dynamodb.Attribute(
+                name="fireShard", type=dynamodb.AttributeType.STRING
+            ),
+            sort_key=dynamodb.Attribute(
+                name="nextRunAt", type=dynamodb.AttributeType.STRING
+            ),
+        )
 
         # Collect all tables for IAM grants
         self.all_tables = [
@@ -146,4 +240,6 @@ class DatabaseConstruct(Construct):
             self.skills_table,
             self.insights_table,
             self.access_codes_table,
+            self.usage_table,
+            self.cron_jobs_table,
         ]
@@ -46,11 +46,24 @@ class SchedulingConstruct(Construct):
             )],
         )
 
-        # Reminder check — every 5 minutes
+        # Cron jobs — every minute (reads only due jobs)
+        events.Rule(
+            self, "CronJobs",
+            rule_name=f"jumns-cron-jobs-{stage}",
+            schedule=events.Schedule.rate(cdk.Duration.minutes(1)),
+            targets=[targets.LambdaFunction(
+                scheduler_fn,
+                event=events.RuleTargetInput.from_object(
+                    {"type": "cron_jobs"}
+                ),
+            )],
+        )
+
+        # Reminder dispatch — every minute (reads only due reminders)
         events.Rule(
             self, "ReminderCheck",
             rule_name=f"jumns-reminders-{stage}",
-            schedule=events.Schedule.rate(cdk.Duration.minutes(5)),
+            schedule=events.Schedule.rate(cdk.Duration.minutes(1)),
             targets=[targets.LambdaFunction(
                 scheduler_fn,
                 event=events.RuleTargetInput.from_object(
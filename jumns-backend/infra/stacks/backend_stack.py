@@ -28,7 +28,7 @@ class JumnsBackendStack(cdk.Stack):
     ) -> None:
         super().__init__(scope, id, **kwargs)
 
-        # 1. Database — 8 DynamoDB tables
+        # 1. Database — 10 DynamoDB tables
         db = DatabaseConstruct(self, "Database", stage=stage)
 
         # 2. Memory Store — S3 bucket for vector memory JSON files
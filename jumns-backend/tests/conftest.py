@@ -0,0 +1,12 @@
+"""Shared fixtures: the moto-backed offline backend from the benchmarks."""
+
+import pytest
+
+from benchmarks.environment import offline_backend
+
+
+@pytest.fixture
+def backend():
+    """moto DynamoDB/S3 with the Jumns tables; externals faked."""
+    with offline_backend():
+        yield
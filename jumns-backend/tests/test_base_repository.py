@@ -0,0 +1,44 @@
+import pytest
+
+from app.exceptions import ConcurrentModificationError, ResourceNotFoundError
+
+KEY = {"userId": "u1", "goalId": "g1"}
+
+
+@pytest.fixture
+def repo(backend):
+    from app.db.base_repository import BaseRepository
+    from app.db.connection import get_table
+    from app.db.table_config import GOALS_TABLE
+
+    repo = BaseRepository(get_table(GOALS_TABLE))
+    repo.put_item({**KEY, "title": "Run", "progress": 0})
+    return repo
+
+
+def test_stale_expected_version_is_rejected(repo):
+    current = repo.update_item(KEY, {"title": "Run 5k"})["version"]
+    repo.update_item(KEY, {"title": "Run 10k"}, expected_version=current)
+
+    with pytest.raises(ConcurrentModificationError):
+        repo.update_item(KEY, {"title": "Walk"}, expected_version=current)
+    assert repo.get_item(KEY)["title"] == "Run 10k"
+
+
+def test_must_exist_does_not_create_a_missing_item(repo):
+    missing = {"userId": "u1", "goalId": "gone"}
+    with pytest.raises(ResourceNotFoundError):
+        repo.update_item(missing, {"title": "Run"}, must_exist=True)
+    with pytest.raises(ResourceNotFoundError):
+        repo.get_item(missing)
+
+
+def test_increments_are_added_alongside_the_version(repo):
+    first = repo.update_item(KEY, {}, increments={"progress": 2})
+    second = repo.update_item(
+        KEY, {"title": "Run 5k"}, increments={"progress": 3, "streak": 1},
+        expected_version=first["version"],
+    )
+    assert second["progress"] == 5
+    assert second["streak"] == 1
+    assert second["version"] == first["version"] + 1
@@ -0,0 +1,45 @@
+import pytest
+from botocore.exceptions import ClientError
+
+
+def test_failed_version_bump_fails_the_write_request(backend, monkeypatch):
+    from fastapi.testclient import TestClient
+
+    from app.application import CRUD_ROUTES, create_app
+    from app.dependencies import get_usage_repo
+
+    client = TestClient(create_app(CRUD_ROUTES), raise_server_exceptions=False)
+    client.headers["Authorization"] = "Bearer u1"
+    etag = client.get("/api/goals/").headers["ETag"]
+
+    def throttled(*args, **kwargs):
+        raise ClientError({"Error": {"Code": "ThrottlingException"}}, "UpdateItem")
+
+    monkeypatch.setattr(get_usage_repo(), "touch_collection", throttled)
+    assert client.post("/api/goals/", json={"title": "Run"}).status_code == 500
+    monkeypatch.undo()
+
+    # The goal was written; the client retries and is not told "not modified"
+    assert client.post("/api/goals/", json={"title": "Run"}).status_code == 200
+    assert client.get("/api/goals/", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_bump_failure_is_raised_after_every_owner_is_tried(backend, monkeypatch):
+    from app.db.base_repository import touch_collection
+    from app.dependencies import get_usage_repo
+
+    usage = get_usage_repo()
+    bump = usage.touch_collection
+    tried = []
+
+    def flaky(user_id, collection, deleted=False):
+        tried.append(user_id)
+        if user_id == "u1":
+            raise ClientError({"Error": {"Code": "ThrottlingException"}}, "UpdateItem")
+        return bump(user_id, collection, deleted)
+
+    monkeypatch.setattr(usage, "touch_collection", flaky)
+    with pytest.raises(RuntimeError):
+        touch_collection("goals", [{"userId": "u1", "id": "a"}, {"userId": "u2", "id": "b"}])
+    assert tried == ["u1", "u2"]
+    assert usage.get_collection_version("u2", "goals")[0] == 1
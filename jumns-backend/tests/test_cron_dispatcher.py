@@ -0,0 +1,105 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+
+class StubAgent:
+    """invoke_scheduled that fails for the users in ``failing``."""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.calls: list[str] = []
+
+    async def invoke_scheduled(self, user_id, prompt, *, source, extra=None):
+        self.calls.append(user_id)
+        if user_id in self.failing:
+            raise RuntimeError("model down")
+        return {"content": "ok"}
+
+
+@pytest.fixture
+def dispatch(backend, monkeypatch):
+    from app.scheduler import cron_dispatcher
+
+    def run(agent, context=None):
+        monkeypatch.setattr(cron_dispatcher, "get_agent_service", lambda: agent)
+        later = datetime.now(timezone.utc) + timedelta(hours=1)
+        return cron_dispatcher.dispatch_due_jobs(later, context)
+
+    return run
+
+
+def _job(user_id, schedule_type="interval", value="30"):
+    from app.dependencies import get_cron_jobs_repo
+
+    return get_cron_jobs_repo().create(
+        user_id, {"scheduleType": schedule_type, "scheduleValue": value, "actionMessage": "hi"},
+    )
+
+
+def _status(job):
+    from app.dependencies import get_cron_jobs_repo
+
+    return get_cron_jobs_repo().get(job["userId"], job["jobId"])
+
+
+def test_a_failed_job_is_marked_and_the_rest_still_run(dispatch):
+    bad, good = _job("bad"), _job("good")
+    results = dispatch(StubAgent(failing={"bad"}))
+    assert results["ran"] == 1 and results["errors"] == 1
+    assert _status(bad)["lastStatus"] == "error"
+    assert _status(good)["lastStatus"] == "ok"
+
+
+def test_runs_are_charged_to_the_daily_allowance(dispatch, monkeypatch):
+    from app.dependencies import get_usage_repo
+    from app.middleware import rate_limiter
+
+    monkeypatch.setattr(rate_limiter, "FREE_TIER_LIMIT", 1)
+    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    get_usage_repo().increment_daily_messages("busy", today, 1)
+    job = _job("busy")
+    agent = StubAgent()
+    assert dispatch(agent)["rateLimited"] == 1
+    assert agent.calls == []
+    assert _status(job)["lastStatus"] == "rateLimited"
+
+
+def test_spent_budget_leaves_jobs_due(dispatch):
+    class Context:
+        def get_remaining_time_in_millis(self):
+            return 1_000
+
+    job = _job("late")
+    agent = StubAgent()
+    assert dispatch(agent, Context())["deferred"] == 1
+    assert agent.calls == []
+    assert _status(job)["runCount"] == 0
+
+
+def test_runs_keep_the_minimum_interval(backend):
+    from app.dependencies import get_cron_jobs_repo
+    from app.scheduling.cron import MIN_RUN_INTERVAL
+    from app.scheduling.recurrence import parse_fire_key
+
+    with pytest.raises(ValueError):
+        _job("eager", value="1")
+    job = _job("eager", "cron", "* * * * *")
+    now = datetime.now(timezone.utc)
+    claimed = get_cron_jobs_repo().claim(job, now)
+    assert parse_fire_key(claimed["nextRunAt"]) >= now + MIN_RUN_INTERVAL - timedelta(seconds=1)
+
+
+def test_schedules_that_never_run_are_rejected(backend):
+    from app.dependencies import get_cron_jobs_repo
+
+    repo = get_cron_jobs_repo()
+    with pytest.raises(ValueError):
+        _job("never", "cron", "0 0 31 2 *")
+    with pytest.raises(ValueError):
+        _job("never", "once", "2020-01-01T08:00:00Z")
+
+    job = _job("never", "daily", "08:00")
+    with pytest.raises(ValueError):
+        repo.update("never", job["jobId"], {"scheduleType": "cron", "scheduleValue": "0 0 30 2 *"})
+    assert _status(job)["nextRunAt"] == job["nextRunAt"]
@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from app.entitlements import entitlement_service as es
+
+
+@pytest.fixture
+def service(backend, monkeypatch):
+    service = es.EntitlementService()
+    service.lookups = []
+    clock = [1000.0]
+    service.clock = clock
+    monkeypatch.setattr(es.time, "monotonic", lambda: clock[0])
+
+    async def fetch(user_id):
+        service.lookups.append(user_id)
+        return "2099-01-01T00:00:00Z" if user_id.startswith("pro") else None
+
+    monkeypatch.setattr(service, "_fetch_revenuecat_pro", fetch)
+    return service
+
+
+def _get(service, user_id):
+    return asyncio.run(service.get_entitlement(user_id))
+
+
+def test_free_results_are_rechecked_after_the_short_ttl(service):
+    _get(service, "free")
+    _get(service, "pro1")
+    service.clock[0] += es.FREE_TTL_SECONDS + 1
+    _get(service, "free")
+    _get(service, "pro1")
+    assert service.lookups == ["free", "pro1", "free"]
+
+
+def test_cache_is_bounded_lru(service, monkeypatch):
+    monkeypatch.setattr(es, "MAX_CACHED_USERS", 2)
+    for user_id in ("pro1", "pro2", "pro1", "pro3"):
+        _get(service, user_id)
+    assert list(service._cache) == ["pro1", "pro3"]
+
+
+def test_one_http_client_per_event_loop(service, monkeypatch):
+    monkeypatch.setattr(es, "REVENUECAT_API_KEY", "key")
+
+    async def client():
+        return service._http_client()
+
+    loop = asyncio.new_event_loop()
+    try:
+        first = loop.run_until_complete(client())
+        assert loop.run_until_complete(client()) is first
+        other = asyncio.run(client())
+        assert other is not first
+    finally:
+        loop.close()
+    asyncio.run(client())
+    assert loop not in service._clients
@@ -0,0 +1,63 @@
+import json
+
+import pytest
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from pydantic import ValidationError
+
+from app.db.synthetic import SyntheticData
+from app.serialization import dumps
+
+
+def _stored(item):
+    """``item`` as DynamoDB returns it (numbers as Decimal)."""
+    serializer, deserializer = TypeSerializer(), TypeDeserializer()
+    return {k: deserializer.deserialize(serializer.serialize(v)) for k, v in item.items()}
+
+
+def _views():
+    """Each list route's view and the response model it stands in for."""
+    from app.models import responses as r
+    from app.routes import goals, insights, messages, reminders, tasks
+
+    return {
+        "goals": (goals._VIEW, r.GoalResponse),
+        "tasks": (tasks._VIEW, r.TaskResponse),
+        "reminders": (reminders._VIEW, r.ReminderResponse),
+        "messages": (messages._VIEW, r.MessageResponse),
+        "insights": (insights._VIEW, r.InsightResponse),
+    }
+
+
+def _items():
+    data = SyntheticData(seed=7).user(
+        "u1", {"goals": 5, "tasks": 20, "reminders": 10, "messages": 30},
+    )
+    data["insights"] = [{
+        "userId": "u1", "id": "i1", "type": "pattern", "title": "Mornings",
+        "content": "You finish more before noon", "createdAt": "2026-10-18T08:00:00+00:00",
+    }]
+    return {name: [_stored(item) for item in data[name]] for name in _views()}
+
+
+@pytest.mark.parametrize("collection", ["goals", "tasks", "reminders", "messages", "insights"])
+def test_list_view_matches_the_model(collection):
+    view, model = _views()[collection]
+    items = _items()[collection]
+    assert items
+
+    listed = json.loads(dumps(view.many(items)))
+    validated = [
+        json.loads(model.model_validate(view(item)).model_dump_json(by_alias=True))
+        for item in items
+    ]
+    assert listed == validated
+
+
+def test_missing_required_field_is_null_not_an_error():
+    from app.models.responses import GoalResponse
+    from app.routes.goals import _VIEW
+
+    item = {"userId": "u1", "goalId": "g1", "category": "health"}
+    assert _VIEW(item)["title"] is None
+    with pytest.raises(ValidationError):
+        GoalResponse.model_validate(_VIEW(item))
@@ -0,0 +1,58 @@
+import pytest
+
+
+@pytest.fixture
+def client(backend):
+    from fastapi.testclient import TestClient
+
+    from app.dependencies import get_messages_repo
+    from app.handlers.crud import app
+
+    repo = get_messages_repo()
+    for i in range(5):
+        repo.create_message("u1", {"content": f"m{i}", "role": "user"})
+    client = TestClient(app)
+    client.headers["Authorization"] = "Bearer u1"
+    return client
+
+
+def _pages(client, limit):
+    pages, params = [], {"limit": limit}
+    while True:
+        resp = client.get("/api/messages/", params=params)
+        pages.append([m["content"] for m in resp.json()])
+        cursor = resp.headers.get("X-Next-Cursor")
+        if not cursor:
+            return pages
+        params["before"] = cursor
+
+
+def test_pages_walk_back_and_the_last_has_no_cursor(client):
+    assert _pages(client, 2) == [["m3", "m4"], ["m1", "m2"], ["m0"]]
+    # A page that ends exactly at the first message is still the last
+    assert _pages(client, 5) == [["m0", "m1", "m2", "m3", "m4"]]
+
+
+def test_default_page_size_applies(client):
+    from app.routes import messages
+
+    resp = client.get("/api/messages/")
+    assert len(resp.json()) == 5 and "X-Next-Cursor" not in resp.headers
+    assert messages.DEFAULT_PAGE_SIZE <= messages.MAX_PAGE_SIZE
+
+
+def test_delete_all_reads_every_page(client, monkeypatch):
+    from app.dependencies import get_messages_repo
+
+    repo = get_messages_repo()
+    monkeypatch.setattr(repo._table, "query", _one_item_pages(repo._table.query))
+    assert client.delete("/api/messages/").status_code == 204
+    monkeypatch.undo()
+    assert repo.list_messages("u1") == []
+
+
+def _one_item_pages(query):
+    """DynamoDB query that returns one item per page."""
+    def paged(**kwargs):
+        return query(**{**kwargs, "Limit": 1})
+    return paged
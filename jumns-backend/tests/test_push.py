@@ -0,0 +1,47 @@
+import threading
+
+import pytest
+
+
+@pytest.fixture
+def client(backend):
+    from fastapi.testclient import TestClient
+
+    from app.application import CRUD_ROUTES, create_app
+
+    client = TestClient(create_app(CRUD_ROUTES))
+    client.headers["Authorization"] = "Bearer u1"
+    return client
+
+
+def test_write_requests_flush_push_on_a_worker_thread(client, monkeypatch):
+    from app import push
+
+    loop_thread = []
+    flushes = []
+    monkeypatch.setattr(push, "flush", lambda user_id=None: flushes.append(threading.current_thread()))
+
+    @client.app.middleware("http")
+    async def note_loop_thread(request, call_next):
+        loop_thread.append(threading.current_thread())
+        return await call_next(request)
+
+    assert client.post("/api/goals/", json={"title": "Run"}).status_code == 200
+    assert len(flushes) == 1 and flushes[0] is not loop_thread[0]
+
+
+def test_bulk_changes_drop_ids_past_the_cap():
+    from app.push import MAX_EVENT_IDS, change_event, encode
+    from app.push.apigateway import ApiGatewayBroker
+
+    broker = ApiGatewayBroker("https://example.invalid")
+    ids = [f"id-{i}" for i in range(MAX_EVENT_IDS)]
+    broker.publish("u1", change_event("tasks", ids[:60], 1))
+    broker.publish("u1", change_event("tasks", ids[60:], 2))
+    assert broker._pending["u1"][0]["ids"] == ids
+
+    broker.publish("u1", change_event("tasks", ["one-more"], 3))
+    assert broker._pending["u1"] == [{"type": "change", "collection": "tasks", "version": 3}]
+
+    bulk = change_event("messages", [f"{i:036d}" for i in range(5000)], 4)
+    assert "ids" not in bulk and len(encode(bulk)) < 128 * 1024
@@ -0,0 +1,97 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.exceptions import RateLimitExceededError
+from app.middleware import rate_limiter
+
+LIMIT = 5
+
+
+class FreeTier:
+    async def is_unlimited(self, user_id):
+        return False
+
+
+@pytest.fixture
+def usage(backend, monkeypatch):
+    """The real UsageRepository on moto, with a small free-tier limit."""
+    from app.dependencies import get_usage_repo
+
+    monkeypatch.setattr(rate_limiter, "FREE_TIER_LIMIT", LIMIT)
+    monkeypatch.setattr(rate_limiter, "get_entitlement_service", FreeTier)
+    monkeypatch.setattr(rate_limiter, "_exhausted", {})
+    _serialise_item_writes(monkeypatch)
+    return get_usage_repo()
+
+
+def _serialise_item_writes(monkeypatch):
+    """Apply moto's UpdateItems one at a time, as DynamoDB does per item.
+
+    moto evaluates the condition and the update in separate Python steps,
+    so threads can interleave between them; DynamoDB cannot.
+    """
+    from moto.dynamodb.models import DynamoDBBackend
+
+    lock = threading.Lock()
+    update_item = DynamoDBBackend.update_item
+
+    def serialised(self, *args, **kwargs):
+        with lock:
+            return update_item(self, *args, **kwargs)
+
+    monkeypatch.setattr(DynamoDBBackend, "update_item", serialised)
+
+
+def _counter(repo, user_id, day):
+    return repo._table.get_item(
+        Key={"userId": user_id, "usageKey": f"messages#{day}"},
+    ).get("Item", {})
+
+
+def _check(user_id):
+    try:
+        return asyncio.run(rate_limiter.check_rate_limit(user_id))
+    except RateLimitExceededError:
+        return None
+
+
+def test_concurrent_requests_never_overshoot_the_limit(usage):
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        charged = [day for day in pool.map(_check, ["u1"] * 200) if day]
+    assert len(charged) == LIMIT
+    assert _counter(usage, "u1", rate_limiter._today())["count"] == LIMIT
+
+
+def test_daily_counter_expires_after_two_days(usage):
+    day = _check("u1")
+    first = _counter(usage, "u1", day)["expiresAt"]
+    assert time.time() + 47 * 3600 < first <= time.time() + 48 * 3600
+
+    _check("u1")
+    # Later increments keep the first expiry rather than pushing it out
+    assert _counter(usage, "u1", day)["expiresAt"] == first
+
+
+def test_refund_goes_to_the_day_that_was_charged(usage, monkeypatch):
+    monkeypatch.setattr(rate_limiter, "_today", lambda: "2026-10-18")
+    day = _check("u1")
+    monkeypatch.setattr(rate_limiter, "_today", lambda: "2026-10-19")
+    asyncio.run(rate_limiter.refund_rate_limit("u1", day))
+    assert _counter(usage, "u1", "2026-10-18")["count"] == 0
+
+
+def test_exhausted_users_from_earlier_days_are_dropped(usage, monkeypatch):
+    monkeypatch.setattr(rate_limiter, "_today", lambda: "2026-10-18")
+    for _ in range(LIMIT + 1):
+        _check("u1")
+    assert rate_limiter._exhausted == {"2026-10-18": {"u1"}}
+
+    monkeypatch.setattr(rate_limiter, "_today", lambda: "2026-10-19")
+    for _ in range(LIMIT + 1):
+        _check("u2")
+    assert rate_limiter._exhausted == {"2026-10-19": {"u2"}}
+    assert _check("u1") == "2026-10-19"
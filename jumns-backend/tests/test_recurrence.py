@@ -0,0 +1,26 @@
+from datetime import datetime, timezone
+
+from app.scheduling.recurrence import next_fire_at, parse_schedule
+
+# A Monday
+MONDAY_AFTERNOON = datetime(2026, 10, 19, 15, 0, tzinfo=timezone.utc)
+MONDAY_MORNING = datetime(2026, 10, 19, 7, 0, tzinfo=timezone.utc)
+
+
+def test_weekday_one_off_later_today_fires_today():
+    rec = parse_schedule("Monday 9am", {"timezone": "UTC"}, MONDAY_MORNING)
+    assert rec["freq"] == "once"
+    assert rec["date"] == "2026-10-19"
+    assert next_fire_at(rec, MONDAY_MORNING) == datetime(2026, 10, 19, 9, 0, tzinfo=timezone.utc)
+
+
+def test_weekday_one_off_already_passed_today_moves_to_next_week():
+    rec = parse_schedule("Monday 9am", {"timezone": "UTC"}, MONDAY_AFTERNOON)
+    assert rec["date"] == "2026-10-26"
+    assert next_fire_at(rec, MONDAY_AFTERNOON) == datetime(2026, 10, 26, 9, 0, tzinfo=timezone.utc)
+
+
+def test_weekday_one_off_uses_users_timezone():
+    # 15:00 UTC is 08:00 in Los Angeles: 9am Monday is still ahead
+    rec = parse_schedule("Monday 9am", {"timezone": "America/Los_Angeles"}, MONDAY_AFTERNOON)
+    assert rec["date"] == "2026-10-19"
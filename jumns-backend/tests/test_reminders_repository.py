@@ -0,0 +1,98 @@
+import pytest
+
+from app.exceptions import ResourceNotFoundError
+
+SETTINGS = {"timezone": "UTC", "morningTime": "08:00", "eveningTime": "21:00"}
+
+
+@pytest.fixture
+def repo(backend):
+    from app.db.repositories.reminders import RemindersRepository
+
+    return RemindersRepository()
+
+
+def _paused(repo):
+    r = repo.create("u1", {"title": "Stretch", "time": "every day at 9am"}, SETTINGS)
+    assert "nextFireAt" in r
+    paused = repo.update("u1", r["reminderId"], {"active": False}, SETTINGS)
+    assert "nextFireAt" not in paused
+    return paused
+
+
+def test_changing_time_of_paused_reminder_does_not_schedule_it(repo):
+    r = _paused(repo)
+    updated = repo.update("u1", r["reminderId"], {"time": "every day at 10am"}, SETTINGS)
+    assert updated["active"] is False
+    assert updated["recurrence"]["times"] == ["10:00"]
+    assert "nextFireAt" not in updated
+
+
+def test_snoozing_paused_reminder_does_not_schedule_it(repo):
+    r = _paused(repo)
+    snoozed = repo.snooze("u1", r["reminderId"], 15)
+    assert snoozed["snoozeCount"] == 1
+    assert "nextFireAt" not in snoozed
+
+
+def test_active_reminder_is_rescheduled(repo):
+    r = repo.create("u1", {"title": "Stretch", "time": "every day at 9am"}, SETTINGS)
+    assert "nextFireAt" in repo.update("u1", r["reminderId"], {"time": "every day at 10am"}, SETTINGS)
+    assert "nextFireAt" in repo.snooze("u1", r["reminderId"], 15)
+
+
+def test_update_or_snooze_of_unknown_reminder_creates_nothing(repo):
+    with pytest.raises(ResourceNotFoundError):
+        repo.update("u1", "missing", {"time": "every day at 10am"}, SETTINGS)
+    with pytest.raises(ResourceNotFoundError):
+        repo.snooze("u1", "missing", 15)
+    assert repo.list_all("u1") == []
+
+
+def test_dispatcher_skips_paused_reminders(repo):
+    from datetime import datetime, timedelta, timezone
+
+    from app.dependencies import get_messages_repo
+    from app.scheduler.reminder_dispatcher import dispatch_due_reminders
+
+    r = repo.create("u1", {"title": "Stretch", "time": "every day at 9am"}, SETTINGS)
+    # A stale read of the due index: the reminder was paused after it
+    stale = repo.get("u1", r["reminderId"])
+    repo.update("u1", r["reminderId"], {"active": False}, SETTINGS)
+    assert repo.advance(stale, datetime.now(timezone.utc)) is None
+
+    results = dispatch_due_reminders(datetime.now(timezone.utc) + timedelta(days=2))
+    assert results["fired"] == 0
+    assert get_messages_repo().list_messages("u1") == []
+
+
+def test_active_listing_leaves_out_paused_reminders(repo):
+    paused = _paused(repo)
+    active = repo.create("u1", {"title": "Water", "time": "every day at 10am"}, SETTINGS)
+    assert [r["reminderId"] for r in repo.list_active_reminders("u1")] == [active["reminderId"]]
+    repo.update("u1", paused["reminderId"], {"active": True}, SETTINGS)
+    assert len(repo.list_active_reminders("u1")) == 2
+
+
+def test_undelivered_occurrence_is_fired_on_the_next_tick(repo, monkeypatch):
+    from datetime import datetime, timedelta, timezone
+
+    from app.dependencies import get_messages_repo
+    from app.scheduler.reminder_dispatcher import dispatch_due_reminders
+
+    r = repo.create("u1", {"title": "Stretch", "time": "every day at 9am"}, SETTINGS)
+    tick = datetime.now(timezone.utc) + timedelta(days=1, minutes=1)
+    messages = get_messages_repo()
+
+    def down(*args, **kwargs):
+        raise RuntimeError("DynamoDB put_item failed")
+
+    monkeypatch.setattr(messages, "create_message", down)
+    results = dispatch_due_reminders(tick)
+    assert results["errors"] == 1 and results["retrying"] == 1
+    assert repo.get("u1", r["reminderId"])["nextFireAt"] == r["nextFireAt"]
+
+    monkeypatch.undo()
+    assert dispatch_due_reminders(tick)["fired"] == 1
+    assert len(messages.list_messages("u1")) == 1
+    assert repo.get("u1", r["reminderId"])["nextFireAt"] > r["nextFireAt"]
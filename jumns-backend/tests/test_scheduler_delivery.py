@@ -0,0 +1,124 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from app.exceptions import AgentUnavailableError
+
+
+class StubAgent:
+    """invoke_proactive that fails while ``down`` and delivers otherwise."""
+
+    def __init__(self, down: bool = False):
+        self.down = down
+        self.calls: list[str] = []
+
+    async def invoke_proactive(self, user_id, prompt_type, *, briefing=None):
+        self.calls.append(user_id)
+        if self.down:
+            raise AgentUnavailableError()
+        return {"content": "ok"}
+
+
+@pytest.fixture
+def guard(backend):
+    from app.scheduler.idempotency import DeliveryGuard
+
+    return DeliveryGuard("plan_review", datetime.now(timezone.utc))
+
+
+def _fan_out(users, agent, guard):
+    from app.scheduler.handler import _fan_out
+
+    return asyncio.run(_fan_out("plan_review", users, agent, guard))[0]
+
+
+def test_model_outage_releases_delivery_key_for_retry(guard):
+    agent = StubAgent(down=True)
+    results = _fan_out(["u1", "u2"], agent, guard)
+    assert results["errors"] == 2 and results["delivered"] == 0
+
+    agent.down = False
+    results = _fan_out(["u1", "u2"], agent, guard)
+    assert results["delivered"] == 2 and results["duplicates"] == 0
+
+
+def test_delivered_key_suppresses_a_second_delivery(guard):
+    agent = StubAgent()
+    assert _fan_out(["u1"], agent, guard)["delivered"] == 1
+    results = _fan_out(["u1"], agent, guard)
+    assert results["duplicates"] == 1
+    assert agent.calls == ["u1"]
+
+
+def test_each_key_is_claimed_right_before_its_invocation(guard, monkeypatch):
+    from app.scheduler import handler
+
+    events = []
+    begin = guard.begin
+    monkeypatch.setattr(guard, "begin", lambda u: events.append(("claim", u)) or begin(u))
+    monkeypatch.setattr(handler, "MAX_CONCURRENCY", 1)
+
+    class RecordingAgent(StubAgent):
+        async def invoke_proactive(self, user_id, prompt_type, *, briefing=None):
+            events.append(("invoke", user_id))
+            return await super().invoke_proactive(user_id, prompt_type)
+
+    _fan_out(["u1", "u2"], RecordingAgent(), guard)
+    assert events == [("claim", "u1"), ("invoke", "u1"), ("claim", "u2"), ("invoke", "u2")]
+
+
+def test_budget_is_checked_before_each_user(backend, monkeypatch):
+    from app.scheduler import handler
+
+    agent = StubAgent()
+
+    class Context:
+        # Plenty of time until the third user has run
+        def get_remaining_time_in_millis(self):
+            return 1_000 if len(agent.calls) >= 3 else 600_000
+
+    users = [f"u{i}" for i in range(10)]
+    monkeypatch.setattr(handler, "MAX_CONCURRENCY", 1)
+    monkeypatch.setattr(handler, "get_agent_service", lambda: agent)
+    monkeypatch.setattr(handler, "_get_eligible_users", lambda *args: users)
+
+    results = handler._run_proactive("plan_review", {}, Context())
+    assert agent.calls == ["u0", "u1", "u2"]
+    assert results["sweep"]["remaining"] == 7
+    assert results["continuation"]["resumeAfter"] == "u2"
+
+
+def test_workers_reuse_one_event_loop(guard, monkeypatch):
+    from app.scheduler import handler
+
+    loops = set()
+
+    class LoopAgent(StubAgent):
+        async def invoke_proactive(self, user_id, prompt_type, *, briefing=None):
+            loops.add(id(asyncio.get_running_loop()))
+            return await super().invoke_proactive(user_id, prompt_type)
+
+    monkeypatch.setattr(handler, "MAX_CONCURRENCY", 1)
+    assert _fan_out(["u1", "u2", "u3"], LoopAgent(), guard)["delivered"] == 3
+    assert len(loops) == 1
+
+
+def test_continuation_resumes_at_the_first_deferred_user(backend, monkeypatch):
+    from app.scheduler import handler
+
+    agent = StubAgent()
+    users = [f"u{i}" for i in range(5)]
+    deliver = handler._deliver_one
+
+    def racy_deliver(agent, guard, user_id, *args):
+        # u1's worker was preempted before its budget check; u2.. ran first
+        return "deferred" if user_id == "u1" else deliver(agent, guard, user_id, *args)
+
+    monkeypatch.setattr(handler, "_deliver_one", racy_deliver)
+    monkeypatch.setattr(handler, "get_agent_service", lambda: agent)
+    monkeypatch.setattr(handler, "_get_eligible_users", lambda *args: users)
+
+    results = handler._run_proactive("plan_review", {})
+    assert results["continuation"]["resumeAfter"] == "u0"
+    assert results["sweep"]["remaining"] == 4
@@ -0,0 +1,11 @@
+def test_slot_index_serves_morning_and_evening_sweeps(backend):
+    from app.dependencies import get_users_repo
+
+    repo = get_users_repo()
+    repo.upsert_settings("early", {"timezone": "UTC", "morningTime": "06:00", "eveningTime": "20:00"})
+    repo.upsert_settings("late", {"timezone": "UTC", "morningTime": "09:00", "eveningTime": "20:30"})
+    repo.upsert_settings("odd", {"timezone": "UTC", "morningTime": "soon", "eveningTime": "20:15"})
+
+    assert repo.list_ids_in_slot("morning", "06") == ["early"]
+    assert sorted(repo.list_ids_in_slot("evening", "20")) == ["early", "late", "odd"]
+    assert repo.list_ids_in_slot("evening", "21") == []